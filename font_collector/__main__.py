@@ -1,9 +1,13 @@
 import logging
 import shutil
+from collections.abc import Iterable
+from itertools import chain
 from pathlib import Path
 from sys import argv
 from tempfile import TemporaryDirectory
 
+from find_system_fonts_filename import get_system_fonts_filename
+
 from . import _handler
 from .ass.ass_document import AssDocument
 from .collect_fonts import collect_subtitle_fonts
@@ -11,6 +15,7 @@ from .font import (
     FontCollection,
     FontFile,
     FontLoader,
+    FontSelectionStrategy,
     FontSelectionStrategyLibass
 )
 from .mkvtoolnix import MKVExtract, MKVPropedit
@@ -31,7 +36,9 @@ def main() -> None:
         use_system_font,
         collect_draw_fonts,
         convert_variable_to_collection,
-        logging_file_path
+        logging_file_path,
+        workers,
+        cache_fonts
     ) = parse_arguments()
 
     if logging_file_path:
@@ -44,15 +51,16 @@ def main() -> None:
 
     try:
         fonts_file_found: set[FontFile] = set()
-        additional_fonts = FontLoader.load_additional_fonts(additional_fonts_path)
-        additional_fonts.extend(FontLoader.load_additional_fonts(additional_fonts_recursive_path, True))
-        font_collection = FontCollection(use_system_font=use_system_font, additional_fonts=additional_fonts)
         font_strategy = FontSelectionStrategyLibass()
+        font_collection_loader = _FontCollectionLoader(
+            font_strategy, use_system_font, additional_fonts_path, additional_fonts_recursive_path, workers, cache_fonts
+        )
 
         for ass_path in ass_files_path:
             subtitle = AssDocument.from_file(ass_path)
             _logger.info(f"Loaded successfully {ass_path}")
 
+            font_collection = font_collection_loader.get_font_collection(subtitle, collect_draw_fonts)
             fonts_file_found.update(collect_subtitle_fonts(subtitle, font_collection, font_strategy, collect_draw_fonts, convert_variable_to_collection, output_directory))
             _logger.info("")
 
@@ -67,6 +75,7 @@ def main() -> None:
                         log_msg += f" - \"{mkv_ass_file.track_name}\""
                     _logger.info(log_msg)
 
+                    font_collection = font_collection_loader.get_font_collection(subtitle, collect_draw_fonts)
                     fonts_file_found.update(collect_subtitle_fonts(subtitle, font_collection, font_strategy, collect_draw_fonts, convert_variable_to_collection, output_directory))
                     _logger.info("")
 
@@ -86,5 +95,121 @@ def main() -> None:
     except Exception as e:
         _logger.error("An unexpected error occured", exc_info=True)
 
+
+class _FontCollectionLoader:
+    """Create the FontCollection used to collect the fonts of subtitles, by only loading the fonts they may use.
+
+    When the fonts of a source (the system fonts or an additional directory) are cached, they are loaded from the cache.
+    Otherwise, like on the first run, only the name table of its fonts is read, and only the fonts that may match
+    the font names of the subtitles are loaded. They are loaded as the subtitles are processed, so each font is loaded at most once.
+    The caches aren't created in that case, since it would require loading all the fonts, unless cache_fonts is True.
+
+    Attributes:
+        strategy: The strategy used to match the font names.
+        use_system_font: If True, the collections contain the system fonts.
+        max_workers: See the doc of FontLoader.load_font_files.
+        cache_fonts: If True, the sources that aren't cached are fully loaded and cached, like when the fonts are loaded by FontCollection.
+    """
+
+    def __init__(
+        self,
+        strategy: FontSelectionStrategy,
+        use_system_font: bool,
+        additional_fonts_path: Iterable[Path],
+        additional_fonts_recursive_path: Iterable[Path],
+        max_workers: int | None,
+        cache_fonts: bool
+    ) -> None:
+        self.strategy = strategy
+        self.use_system_font = use_system_font
+        self.max_workers = max_workers
+        self.cache_fonts = cache_fonts
+        self.__font_names: set[str] = set()
+        self.__font_collection: FontCollection | None = None
+
+        # The system fonts are None when FontCollection loads them from the cache
+        self.__system_fonts: _UncachedFontSource | None = None
+        if use_system_font and not cache_fonts and not FontLoader.get_system_font_cache_file_path().is_file():
+            self.__system_fonts = _UncachedFontSource(sorted({Path(font_path) for font_path in get_system_fonts_filename()}))
+
+        # The sources are kept in the order of the arguments, so the fonts are in the same order as with FontLoader.load_additional_fonts
+        self.__additional_fonts: list[list[FontFile] | _UncachedFontSource] = []
+        for fonts_path, scan_subdirs in ((additional_fonts_path, False), (additional_fonts_recursive_path, True)):
+            for font_path in fonts_path:
+                if font_path.is_dir() and not cache_fonts and not FontLoader.get_additional_font_cache_file_path(font_path, scan_subdirs).is_file():
+                    self.__additional_fonts.append(_UncachedFontSource(FontLoader.get_additional_fonts_path([font_path], scan_subdirs)))
+                else:
+                    self.__additional_fonts.append(FontLoader.load_additional_fonts([font_path], scan_subdirs, max_workers, True))
+
+
+    def get_font_collection(self, subtitle: AssDocument, collect_draw_fonts: bool) -> FontCollection:
+        """
+        Args:
+            subtitle: A subtitle.
+            collect_draw_fonts: See the doc of AssDocument.get_used_style.
+        Returns:
+            A collection that contains the fonts that can be used by this subtitle and by the previous ones.
+        """
+        font_names = {style.fontname for style in subtitle.get_used_style(collect_draw_fonts)}.difference(self.__font_names)
+
+        if font_names:
+            self.__font_names.update(font_names)
+            for source in [self.__system_fonts, *self.__additional_fonts]:
+                if isinstance(source, _UncachedFontSource) and source.load_font_files(font_names, self.strategy, self.max_workers):
+                    self.__font_collection = None
+
+        if self.__font_collection is None:
+            system_fonts = self.__system_fonts.font_files if self.__system_fonts is not None else None
+            additional_fonts = [
+                font_file
+                for source in self.__additional_fonts
+                for font_file in (source.font_files if isinstance(source, _UncachedFontSource) else source)
+            ]
+            self.__font_collection = FontCollection(
+                use_system_font=self.use_system_font, additional_fonts=additional_fonts, max_workers=self.max_workers, system_fonts=system_fonts
+            )
+        return self.__font_collection
+
+
+class _UncachedFontSource:
+    """The fonts of a source that isn't cached. They are only loaded when they may match a font name.
+
+    Attributes:
+        fonts_path: The path of all the fonts of the source.
+        font_files: The fonts that have been loaded, in the same order as fonts_path.
+    """
+
+    def __init__(self, fonts_path: list[Path]) -> None:
+        self.fonts_path = fonts_path
+        self.font_files: list[FontFile] = []
+        self.__fonts_path_not_loaded = list(fonts_path)
+
+
+    def load_font_files(self, font_names: Iterable[str], strategy: FontSelectionStrategy, max_workers: int | None) -> bool:
+        """Load the fonts that haven't been loaded yet and that may match one of the font names.
+
+        Args:
+            font_names: The font names to match.
+            strategy: The strategy used to match the font names.
+            max_workers: See the doc of FontLoader.load_font_files.
+        Returns:
+            True if the source contains new fonts, otherwise False.
+        """
+        fonts_path_to_load = FontLoader.filter_fonts_path_by_names(self.__fonts_path_not_loaded, font_names, strategy)
+        if not fonts_path_to_load:
+            return False
+
+        loaded_paths = set(fonts_path_to_load)
+        self.__fonts_path_not_loaded = [font_path for font_path in self.__fonts_path_not_loaded if font_path not in loaded_paths]
+
+        loaded_font_files = FontLoader.load_font_files(fonts_path_to_load, max_workers)
+        if not loaded_font_files:
+            return False
+
+        font_files = {font_file.filename: font_file for font_file in chain(self.font_files, loaded_font_files)}
+        self.font_files = [font_files[font_path] for font_path in self.fonts_path if font_path in font_files]
+        return True
+
+
 if __name__ == "__main__":
     main()
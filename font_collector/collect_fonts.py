@@ -2,9 +2,13 @@ import logging
 from pathlib import Path
 
 from .ass.ass_document import AssDocument
+from .ass.ass_style import AssStyle
+from .ass.usage_data import UsageData
 from .font import (
+    ABCFontFace,
     FontCollection,
     FontFile,
+    FontResult,
     FontSelectionStrategy,
     VariableFontFace,
     font_weight_to_name
@@ -43,9 +47,15 @@ def collect_subtitle_fonts(
 
     nbr_font_not_found = 0
 
+    font_results = font_collection.get_used_fonts_by_styles(used_styles, font_strategy)
+    # The styles are resolved before any variable font is converted, so many styles can use the same variable font.
+    # Each variable font is only converted once. key: the path of the generated font
+    generated_font_files: dict[Path, FontFile] = {}
+    missing_glyphs_by_style = _get_missing_glyphs_by_style(used_styles, font_results)
+
     for style, usage_data in used_styles.items():
 
-        font_result = font_collection.get_used_font_by_style(style, font_strategy)
+        font_result = font_results[style]
 
         # Did not found the font
         if font_result is None:
@@ -70,7 +80,7 @@ def collect_subtitle_fonts(
                 )
 
 
-            missing_glyphs = font_result.font_face.get_missing_glyphs(usage_data.characters_used)
+            missing_glyphs = missing_glyphs_by_style[style]
             if len(missing_glyphs) > 0:
                 _logger.warning(f"'{style.fontname}' is missing the following glyphs used: {missing_glyphs}")
 
@@ -83,7 +93,10 @@ def collect_subtitle_fonts(
                     raise ValueError("When ``convert_variable_to_collection`` is True, you must provide a value for ``output_variable_font_directory``.")
                 font_name = font_result.font_face.get_best_family_prefix_from_lang().value
                 font_filename = output_variable_font_directory.joinpath(f"{font_name}.ttc")
-                generated_font_file = font_result.font_face.variable_font_to_collection(font_filename)
+                generated_font_file = generated_font_files.get(font_filename)
+                if generated_font_file is None:
+                    generated_font_file = font_result.font_face.variable_font_to_collection(font_filename)
+                    generated_font_files[font_filename] = generated_font_file
                 fonts_file_found.add(generated_font_file)
             else:
                 fonts_file_found.add(font_result.font_face.font_file)
@@ -95,3 +108,51 @@ def collect_subtitle_fonts(
 
     return fonts_file_found
 
+
+
+def _get_missing_glyphs_by_style(
+        used_styles: dict[AssStyle, UsageData],
+        font_results: dict[AssStyle, FontResult | None]
+    ) -> dict[AssStyle, set[str]]:
+    """
+    Find the missing glyphs of each style.
+
+    Many styles often resolve to the same font face, so the characters of these styles are checked together,
+    which only checks each character once per font face.
+
+    Args:
+        used_styles: The used styles with their usage data.
+        font_results: The font found for each style.
+
+    Returns:
+        The characters used by each style that its font doesn't support. The styles without a font are omitted.
+    """
+    # The faces of a same font index share the same cmaps, so they are checked together.
+    # key: (filename, font_index), value: (font_face, characters used)
+    characters_by_face: dict[tuple[Path, int], tuple[ABCFontFace, set[str]]] = {}
+    for style, font_result in font_results.items():
+        if font_result is None:
+            continue
+        font_face = font_result.font_face
+        if font_face.font_file is None:
+            raise ValueError(f"This font_face \"{font_face}\" isn't linked to any FontFile.")
+
+        key = (font_face.font_file.filename, font_face.font_index)
+        if key not in characters_by_face:
+            characters_by_face[key] = (font_face, set())
+        characters_by_face[key][1].update(used_styles[style].characters_used)
+
+    # With a coverage, each check is a few set operations, so they are faster in this process than sent to worker processes
+    missing_glyphs_by_face: dict[tuple[Path, int], set[str]] = {}
+    for key, (font_face, characters_used) in characters_by_face.items():
+        missing_glyphs_by_face[key] = font_face.get_missing_glyphs(characters_used)
+
+    missing_glyphs_by_style: dict[AssStyle, set[str]] = {}
+    for style, font_result in font_results.items():
+        if font_result is None or font_result.font_face.font_file is None:
+            continue
+        key = (font_result.font_face.font_file.filename, font_result.font_face.font_index)
+        missing_glyphs_by_style[style] = missing_glyphs_by_face[key].intersection(used_styles[style].characters_used)
+
+    return missing_glyphs_by_style
+
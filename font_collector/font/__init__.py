@@ -3,6 +3,7 @@ from .selection_strategy import *
 # Files
 from .abc_font_face import *
 from .normal_font_face import *
+from .font_cache import *
 from .font_collection import *
 from .font_file import *
 from .font_loader import *
@@ -3,30 +3,16 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from ctypes import byref
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from fontTools.ttLib.ttFont import TTFont
-from freetype import (
-    FT_Done_Face,
-    FT_Done_FreeType,
-    FT_Exception,
-    FT_Face,
-    FT_Get_Char_Index,
-    FT_Get_CMap_Format,
-    FT_Init_FreeType,
-    FT_Library,
-    FT_New_Memory_Face,
-    FT_Set_Charmap
-)
 from langcodes import Language, tag_is_valid
 
 from ..exceptions import InvalidLanguageCode, OSNotSupported
 from ..system_lang import get_system_lang
 from .chinese_variant import ChineseVariant
-from .cmap import CMap
-from .font_parser import FontParser
 from .font_type import FontType
+from .glyph_coverage import GlyphCoverage
 from .name import Name
 
 if TYPE_CHECKING:
@@ -48,7 +34,13 @@ class ABCFontFace(ABC):
         is_glyph_emboldened: True if the font face has emboldened glyphs, otherwise False.
         font_type: The type of font face.
         font_file: The font file associated with this font face
+        glyph_coverage: The characters supported by the font face. It is computed when a static font is loaded.
+            If None, like for a variable font, it will be computed the first time get_missing_glyphs is called.
     """
+    # The subclasses declare their attributes in __slots__, so the faces don't have a __dict__.
+    # It matters for the collections that contain hundreds of thousands of faces.
+    __slots__ = ()
+
     # Make mypy happy
     __font_index: int
     __family_names: list[Name]
@@ -58,6 +50,7 @@ class ABCFontFace(ABC):
     __is_glyph_emboldened: bool
     __font_type: FontType
     __font_file: FontFile | None
+    __glyph_coverage: GlyphCoverage | None
 
     @property
     @abstractmethod
@@ -99,6 +92,16 @@ class ABCFontFace(ABC):
     def font_file(self) -> FontFile | None:
         pass
 
+    @property
+    @abstractmethod
+    def glyph_coverage(self) -> GlyphCoverage | None:
+        pass
+
+    @glyph_coverage.setter
+    @abstractmethod
+    def glyph_coverage(self, value: GlyphCoverage | None) -> None:
+        pass
+
     @abstractmethod
     def link_face_to_a_font_file(self, value: FontFile) -> None:
         # Since there is a circular reference between FontFile and this class, we need to be able to set the value
@@ -196,10 +199,7 @@ class ABCFontFace(ABC):
             If none of the names correspond to the lang_code, then it returns None.
             It respects what is written here: https://github.com/libass/libass/wiki/Fonts-across-platforms#createfontindirectselectobject-vsfilter
         """
-        if not tag_is_valid(lang_code):
-            raise InvalidLanguageCode(f"The language code \"{lang_code}\" does not conform to IETF BCP-47")
-
-        requested_lang = Language.get(lang_code)
+        requested_lang = ABCFontFace.__get_language(lang_code)
         is_requested_chinese = requested_lang.language == "zh"
         if is_requested_chinese:
             requested_chinese_variant = ChineseVariant.from_lang_code(requested_lang)
@@ -236,6 +236,20 @@ class ABCFontFace(ABC):
         return best_name
 
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __get_language(lang_code: str) -> Language:
+        """
+        Args:
+            lang_code: An IETF BCP-47 tag.
+        Returns:
+            The Language of the tag. The result is cached, since the same tags are requested for every font face.
+        """
+        if not tag_is_valid(lang_code):
+            raise InvalidLanguageCode(f"The language code \"{lang_code}\" does not conform to IETF BCP-47")
+        return Language.get(lang_code)
+
+
     def get_missing_glyphs(
         self,
         text: Iterable[str],
@@ -255,98 +269,7 @@ class ABCFontFace(ABC):
         if self.font_file is None:
             raise ValueError("This font_face isn't linked to any FontFile.")
 
-        char_not_found: set[str] = set()
-
-        library = FT_Library()
-        face = FT_Face()
-
-        error = FT_Init_FreeType(byref(library))
-        if error: raise FT_Exception(error)
-
-        # We cannot use FT_New_Face due to this issue: https://github.com/rougier/freetype-py/issues/157
-        with open(self.font_file.filename, mode="rb") as f:
-            filebody = f.read()
-        error = FT_New_Memory_Face(library, filebody, len(filebody), self.font_index, byref(face))
-        if error: raise FT_Exception(error)
-
-        ttFont = TTFont(self.font_file.filename, fontNumber=self.font_index)
-        supported_cmaps = FontParser.get_supported_cmaps(ttFont, self.font_file.filename, self.font_index)
-        supported_charmaps = []
-        for i in range(face.contents.num_charmaps):
-            charmap = face.contents.charmaps[i]
-            # Ignore the CMap created by freetype.
-            # See: https://freetype.org/freetype2/docs/reference/ft2-truetype_tables.html#ft_get_cmap_format
-            if FT_Get_CMap_Format(charmap) == -1:
-                continue
-
-            platform_id = charmap.contents.platform_id
-            encoding_id = charmap.contents.encoding_id
-
-            cmap = CMap(platform_id, encoding_id)
-            if cmap not in supported_cmaps:
-                continue
-
-            supported_charmaps.append(charmap)
-
-        for char in text:
-            char_found = False
-
-            for charmap in supported_charmaps:
-                error = FT_Set_Charmap(face, charmap)
-                if error: raise FT_Exception(error)
-
-                platform_id = charmap.contents.platform_id
-                encoding_id = charmap.contents.encoding_id
-
-                cmap_encoding = FontParser.get_cmap_encoding(platform_id, encoding_id)
-
-                # cmap not supported
-                if cmap_encoding is None:
-                    continue
-
-                if cmap_encoding == "unicode":
-                    codepoint = ord(char)
-                else:
-                    symbol_cmap = False
-                    if cmap_encoding == "unknown":
-                        if platform_id == 3 and encoding_id == 0:
-                            symbol_cmap = True
-                            if support_only_ascii_char_for_symbol_font and not char.isascii():
-                                continue
-                            cmap_encoding = FontParser.get_symbol_cmap_encoding(face)
-
-                            if cmap_encoding is None:
-                                # Fallback if guess fails
-                                cmap_encoding = "cp1252"
-                        else:
-                            # cmap not supported
-                            continue
-
-                    if symbol_cmap and (0xF020 <= ord(char) and ord(char) <= 0xF0FF):
-                        # If the character is already a "symbol" character (a.k.a is between 0xF020 and 0xF0FF),
-                        # GDI directly use it's codepoint.
-                        codepoint = ord(char)
-                    else:
-                        try:
-                            codepoint = int.from_bytes(char.encode(cmap_encoding), "big")
-                        except UnicodeEncodeError:
-                            continue
-
-                # GDI/Libass modify the codepoint for microsoft symbol cmap.
-                # See: https://github.com/libass/libass/blob/04a208d5d200360d2ac75f8f6cfc43dd58dd9225/libass/ass_font.c#L249-L250
-                if platform_id == 3 and encoding_id == 0:
-                    codepoint = 0xF000 | codepoint
-
-                index = FT_Get_Char_Index(face, codepoint)
-
-                if index:
-                    char_found = True
-                    break
-
-            if not char_found:
-                char_not_found.add(char)
-
-        FT_Done_Face(face)
-        FT_Done_FreeType(library)
+        if self.glyph_coverage is None:
+            self.glyph_coverage = GlyphCoverage.from_font(self.font_file.filename, self.font_index)
 
-        return char_not_found
+        return self.glyph_coverage.get_missing_glyphs(text, support_only_ascii_char_for_symbol_font)
@@ -11,6 +11,7 @@ class CMap:
         platform_id: The platform ID of the CMap.
         platform_enc_id: The platform encoding ID of the CMap.
     """
+    __slots__ = ("platform_id", "platform_enc_id")
 
     def __init__(
         self,
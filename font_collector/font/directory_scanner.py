@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from time import time_ns
+
+
+class ScannedDirectory:
+    """Represents the content of a directory the last time it was scanned.
+
+    Attributes:
+        mtime_ns: The modification time of the directory, in nanoseconds. If None, the directory must be scanned again.
+        files: The name of the font files in the directory.
+        subdirectories: The name of the subdirectories of the directory.
+    """
+
+    def __init__(self, mtime_ns: int | None, files: list[str], subdirectories: list[str]) -> None:
+        self.mtime_ns = mtime_ns
+        self.files = files
+        self.subdirectories = subdirectories
+
+
+class DirectoryScanner:
+    """
+    This class is a collection of static methods that list the font files of directories
+    by reusing the result of the previous scan for the directories that haven't been modified.
+
+    The modification time of a directory only changes when an entry is added, removed or renamed in it.
+    So, an unmodified directory isn't listed again.
+    Warning: A font file overwritten in place (without being deleted or renamed) doesn't modify its directory,
+    so the files of an unmodified directory must still be stat to detect it. FontLoader only skips it when asked to (skip_unmodified_directories).
+    """
+
+    # If a directory is modified in the same timestamp granularity as the scan, the modification may be missed.
+    # The biggest granularity is the one of FAT (2 seconds), so a directory modified too recently is always scanned again.
+    RACY_MTIME_NS = 2_000_000_000
+
+    @staticmethod
+    def scan(
+        directory: Path,
+        scan_subdirs: bool,
+        is_font_file: Callable[[str], bool],
+        scanned_directories: dict[Path, ScannedDirectory]
+    ) -> tuple[list[Path], dict[Path, ScannedDirectory], set[Path]]:
+        """
+        Args:
+            directory: The directory to scan.
+            scan_subdirs: If True, it will scan the subdirectories recursively.
+            is_font_file: A function that receives a file name and returns True if it is a font file.
+            scanned_directories: The result of the previous scan. See the return value.
+        Returns:
+            - The path of the font files, in the same order as os.walk.
+            - The scanned directories, which should be given to the next scan.
+            - The directories that have been modified since the previous scan (or that are new).
+        """
+        scan_start_ns = time_ns()
+        fonts_path: list[Path] = []
+        new_scanned_directories: dict[Path, ScannedDirectory] = {}
+        modified_directories: set[Path] = set()
+
+        directories_to_scan = [directory]
+        while directories_to_scan:
+            current_directory = directories_to_scan.pop()
+            try:
+                mtime_ns = os.stat(current_directory).st_mtime_ns
+            except OSError:
+                # Like os.walk, ignore the directories that can't be read
+                continue
+
+            scanned_directory = scanned_directories.get(current_directory)
+            if scanned_directory is None or scanned_directory.mtime_ns is None or scanned_directory.mtime_ns != mtime_ns:
+                files: list[str] = []
+                subdirectories: list[str] = []
+                try:
+                    with os.scandir(current_directory) as entries:
+                        for entry in entries:
+                            # The DirEntry already know the type of the entry, so it doesn't need a stat
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirectories.append(entry.name)
+                            elif is_font_file(entry.name) and entry.is_file():
+                                files.append(entry.name)
+                except OSError:
+                    continue
+
+                scanned_directory = ScannedDirectory(
+                    mtime_ns if mtime_ns < scan_start_ns - DirectoryScanner.RACY_MTIME_NS else None,
+                    files,
+                    subdirectories,
+                )
+                modified_directories.add(current_directory)
+
+            new_scanned_directories[current_directory] = scanned_directory
+            fonts_path.extend(current_directory.joinpath(name) for name in scanned_directory.files)
+            if scan_subdirs:
+                # Reversed, so the subdirectories are popped in the order of the listing
+                directories_to_scan.extend(current_directory.joinpath(name) for name in reversed(scanned_directory.subdirectories))
+
+        return fonts_path, new_scanned_directories, modified_directories
+
+
+    @staticmethod
+    def scan_font_files(
+        fonts_path: Iterable[Path],
+        scanned_directories: dict[Path, ScannedDirectory]
+    ) -> tuple[dict[Path, ScannedDirectory], set[Path]]:
+        """Compare the directories of already listed font files (ex: the system fonts) with the previous scan.
+
+        Args:
+            fonts_path: The font files.
+            scanned_directories: The result of the previous scan. See the return value.
+        Returns:
+            - The scanned directories, which should be given to the next scan.
+            - The directories that have been modified since the previous scan (or that are new).
+        """
+        scan_start_ns = time_ns()
+        files_by_directory: dict[Path, list[str]] = {}
+        for font_path in fonts_path:
+            files_by_directory.setdefault(font_path.parent, []).append(font_path.name)
+
+        new_scanned_directories: dict[Path, ScannedDirectory] = {}
+        modified_directories: set[Path] = set()
+        for directory, files in files_by_directory.items():
+            try:
+                mtime_ns: int | None = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+
+            scanned_directory = scanned_directories.get(directory)
+            if (
+                mtime_ns is None
+                or scanned_directory is None
+                or scanned_directory.mtime_ns != mtime_ns
+                or sorted(scanned_directory.files) != sorted(files)
+            ):
+                modified_directories.add(directory)
+                if mtime_ns is not None and mtime_ns >= scan_start_ns - DirectoryScanner.RACY_MTIME_NS:
+                    mtime_ns = None
+
+            new_scanned_directories[directory] = ScannedDirectory(mtime_ns, files, [])
+
+        return new_scanned_directories, modified_directories
@@ -13,10 +13,15 @@ from ..exceptions import (
     InvalidVariableFontFaceException
 )
 from .abc_font_face import ABCFontFace
+from .cmap import CMap
 from .font_parser import FontParser
 from .font_type import FontType
+from .freetype_manager import FreeTypeManager
+from .glyph_coverage import GlyphCoverage
+from .mapped_font_file import MappedFontFile
 from .name import NameID, PlatformID
 from .normal_font_face import NormalFontFace
+from .sfnt_metadata import SfntMetadata
 from .variable_font_face import VariableFontFace
 
 _logger = logging.getLogger(__name__)
@@ -32,68 +37,143 @@ class FactoryABCFontFace:
             A tuple containing a list of NormalFontFace or VariableFontFace objects representing the font file
             at the given path and a boolean indicating whether the font is a collection font (TTC/OTC fonts)
         """
-        ttFonts: list[TTFont] = []
+        # The file is mapped once and all the readers (SfntMetadata, fontTools and FreeType) share the mapping.
+        # The FreeType faces opened by the fallbacks are reused while the file is read, then released with the session.
+        with MappedFontFile(font_path) as font_data, FreeTypeManager.session():
+            return FactoryABCFontFace.__from_mapped_font_file(font_path, font_data)
 
-        font = TTFont(font_path, fontNumber=0)
-        ttFonts.append(font)
 
-        is_collection_font = False
+    @staticmethod
+    def __from_mapped_font_file(font_path: Path, font_data: MappedFontFile) -> tuple[list[ABCFontFace], bool]:
+        """
+        Args:
+            font_path: Font path.
+            font_data: The mapped font file. The returned faces don't reference it, so it can be closed after.
+        Returns:
+            See from_font_path.
+        """
+        # The members of a collection are read one by one with the same stream. Each member is released as soon as its faces are built,
+        # so a big collection never has all its members decoded in memory at the same time.
+        with font_data.open() as file:
+            # To index a static font face, we only need a few fields, so we try to read them without decoding the whole font with fontTools.
+            # If the face is a variable font or if anything is unusual, we fallback to fontTools.
+            # With lazy=True, fontTools reads the tables from the mapping instead of copying the whole file in memory.
+            fonts_offset = SfntMetadata.get_fonts_offset(file)
 
-        # Handle TTC/OTC font
-        if hasattr(font.reader, "numFonts"):
-            is_collection_font = True
-            if font.reader.numFonts > 1:
-                for index in range(1, font.reader.numFonts):
-                    font = TTFont(font_path, fontNumber=index)
-                    ttFonts.append(font)
+            first_font: TTFont | None = None
+            if fonts_offset is not None:
+                offsets, is_collection_font = fonts_offset
+                fonts_count = len(offsets)
+            else:
+                first_font = TTFont(file, fontNumber=0, lazy=True)
+                # Handle TTC/OTC font
+                is_collection_font = hasattr(first_font.reader, "numFonts")
+                fonts_count = first_font.reader.numFonts if is_collection_font else 1
 
-        fonts: list[ABCFontFace] = []
-        try:
-            for font_index, ttFont in enumerate(ttFonts):
-
-                # If is Variable Font, else "normal" font
-                is_var_font = FontParser.is_valid_variable_font(ttFont)
-                if is_var_font:
-                    try:
-                        fonts.extend(FactoryABCFontFace.__create_variable_fonts(ttFont, font_index))
-                    except InvalidVariableFontFaceException:
-                        is_var_font = False
-
-                if not is_var_font:
-                    font = FactoryABCFontFace.__create_font(ttFont, font_path, font_index)
-                    fonts.append(font)
-        except InvalidFontException:
-            _logger.error(f'The font "{font_path}" is invalid.{linesep}If you think it is an error, please open an issue on github, share the font and the following error message:')
-            raise
-        except Exception:
-            _logger.error(f'An unknown error occurred while reading the font "{font_path}"{linesep}Please open an issue on github, share the font and the following error message:')
-            raise
+            fonts: list[ABCFontFace] = []
+            for font_index in range(fonts_count):
+                ttFont: TTFont | SfntMetadata | None
+                if fonts_offset is not None:
+                    ttFont = SfntMetadata.from_file(file, offsets[font_index])
+                    if ttFont is None:
+                        ttFont = TTFont(file, fontNumber=font_index, lazy=True)
+                elif first_font is not None:
+                    # Only the first member has already been read
+                    ttFont, first_font = first_font, None
+                else:
+                    ttFont = TTFont(file, fontNumber=font_index, lazy=True)
+
+                try:
+                    fonts.extend(FactoryABCFontFace.__create_font_faces(ttFont, font_path, font_index, font_data))
+                except InvalidFontException:
+                    _logger.error(f'The font "{font_path}" is invalid.{linesep}If you think it is an error, please open an issue on github, share the font and the following error message:')
+                    raise
+                except Exception:
+                    _logger.error(f'An unknown error occurred while reading the font "{font_path}"{linesep}Please open an issue on github, share the font and the following error message:')
+                    raise
 
         return fonts, is_collection_font
 
 
     @staticmethod
-    def __create_font(ttFont: TTFont, font_path: Path, font_index: int) -> NormalFontFace:
+    def __create_font_faces(ttFont: TTFont | SfntMetadata, font_path: Path, font_index: int, font_data: MappedFontFile) -> list[ABCFontFace]:
         """
         Args:
-            ttFont: An fontTools object
+            ttFont: The fontTools object (or the SfntMetadata) of the font face.
+            font_path: Font path.
+            font_index: Font index.
+            font_data: The mapped font file.
+        Returns:
+            The NormalFontFace or the VariableFontFace objects of the font index.
+        """
+        fonts: list[ABCFontFace] = []
+
+        # If is Variable Font, else "normal" font
+        is_var_font = FontParser.is_valid_variable_font(ttFont)
+        if is_var_font:
+            try:
+                fonts.extend(FactoryABCFontFace.__create_variable_fonts(ttFont, font_index))
+            except InvalidVariableFontFaceException:
+                is_var_font = False
+
+        if not is_var_font:
+            # The cmaps are only read once. If the cmap table is corrupted, fontTools keeps the partially decompiled table,
+            # so reading it a second time wouldn't fail and would return no cmap.
+            cmaps = FontParser.get_supported_cmaps(ttFont, font_path, font_index)
+            font = FactoryABCFontFace.__create_font(ttFont, font_path, font_index, cmaps)
+            # The coverage of a static font is cheap to compute since its cmaps have already been read.
+            # The coverage of a variable font is only computed when get_missing_glyphs is first called,
+            # since most of them are never used and reading their cmaps may need FreeType.
+            font.glyph_coverage = FactoryABCFontFace.__get_glyph_coverage(ttFont, font_path, font_index, font_data, cmaps)
+            fonts.append(font)
+
+        return fonts
+
+
+    @staticmethod
+    def __get_glyph_coverage(
+        ttFont: TTFont | SfntMetadata, font_path: Path, font_index: int, font_data: MappedFontFile, cmaps: list[CMap]
+    ) -> GlyphCoverage | None:
+        """
+        Args:
+            ttFont: The fontTools object (or the SfntMetadata) of the font face.
+            font_path: Font path.
+            font_index: Font index.
+            font_data: The mapped font file.
+            cmaps: The supported cmaps of the font face. See FontParser.get_supported_cmaps.
+        Returns:
+            The glyph coverage of the font face. If it cannot be computed, it returns None,
+            so the font can still be indexed and the coverage will be computed when it is needed.
+        """
+        try:
+            return GlyphCoverage.from_font(font_path, font_index, ttFont, font_data, cmaps)
+        except Exception as e:
+            _logger.debug(f'The glyph coverage of the font "{font_path}" at the index {font_index} could not be computed: {e}')
+            return None
+
+
+    @staticmethod
+    def __create_font(ttFont: TTFont | SfntMetadata, font_path: Path, font_index: int, cmaps: list[CMap]) -> NormalFontFace:
+        """
+        Args:
+            ttFont: An fontTools object or the metadata of a static font face
             font_path: Font path.
             font_index: Font index.
+            cmaps: The supported cmaps of the font face. See FontParser.get_supported_cmaps.
         Returns:
             An FontFace instance that represent the ttFont.
         """
-        cmaps = FontParser.get_supported_cmaps(ttFont, font_path, font_index)
         if len(cmaps) == 0:
              raise InvalidNormalFontFaceException(f"The font doesn't contain any valid cmap.")
 
         cmap_platform_id = cmaps[0].platform_id
-        family_names = FontParser.get_filtered_names(ttFont["name"].names, platformID=cmap_platform_id, nameID=NameID.FAMILY_NAME)
+        family_names = FontParser.get_font_names(ttFont, cmap_platform_id, NameID.FAMILY_NAME)
 
         font_type = FontType.from_font(ttFont)
         if font_type == FontType.TRUETYPE:
-            exact_names = FontParser.get_filtered_names(ttFont["name"].names, platformID=cmap_platform_id, nameID=NameID.FULL_NAME)
+            exact_names = FontParser.get_font_names(ttFont, cmap_platform_id, NameID.FULL_NAME)
         elif font_type == FontType.OPENTYPE:
-            exact_names = FontParser.get_filtered_names(ttFont["name"].names, platformID=cmap_platform_id, nameID=NameID.POSTSCRIPT_NAME)
+            exact_names = FontParser.get_font_names(ttFont, cmap_platform_id, NameID.POSTSCRIPT_NAME)
         elif font_type == FontType.UNKNOWN:
             raise InvalidNormalFontFaceException(f"The font type is not recognized.")
         else:
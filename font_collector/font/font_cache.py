@@ -0,0 +1,585 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from langcodes import Language
+
+from .._version import __version__
+from .abc_font_face import ABCFontFace
+from .directory_scanner import ScannedDirectory
+from .font_file import FontFile
+from .font_type import FontType
+from .glyph_coverage import GlyphCoverage
+from .name import Name
+from .normal_font_face import NormalFontFace
+from .variable_font_face import VariableFontFace
+
+__all__ = ["FontCache"]
+_logger = logging.getLogger(__name__)
+
+
+class FontCache:
+    """A SQLite database that caches FontFile objects.
+
+    There is one row per font file, one row per font face and one row per name.
+    So, a font file can be added, updated or removed without rewriting the whole cache.
+    The names are stored in an indexed column, so the cache can be queried by name.
+
+    It also remembers the invalid fonts with their size and modification time,
+    so they don't need to be parsed again until they change.
+
+    The database is read through a memory mapping (see MMAP_SIZE), so the processes that open the same cache,
+    like the workers of a render farm, share a single copy of it through the OS page cache.
+    With get_font_names_by_prefix and get_font_files_by_filenames, a process only decodes the fonts it needs
+    instead of the whole cache. See FontCollection.lazy_system_fonts.
+
+    Warning: The cache must be closed with close() or used as a context manager.
+    """
+
+    SCHEMA_VERSION = 5
+    # The maximum number of bytes of the database that SQLite reads through a memory mapping instead of its own page cache.
+    # See: https://www.sqlite.org/mmap.html
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    # The name types used in the font_name table.
+    FAMILY_NAMES = "family_names"
+    EXACT_NAMES = "exact_names"
+    FAMILIES_PREFIX = "families_prefix"
+    FAMILIES_SUFFIX = "families_suffix"
+    EXACT_NAMES_SUFFIX = "exact_names_suffix"
+
+    def __init__(self, cache_file: Path) -> None:
+        """
+        Open the cache file. If it doesn't exist, it will be created.
+        If the cache file isn't a valid database, or if it has been created by another version of FontCollector, it will be reset.
+
+        Args:
+            cache_file: The path to the font cache file.
+        """
+        self.__cache_file = cache_file
+        self.__connection = self.__connect()
+
+        try:
+            self.__initialize()
+        except sqlite3.DatabaseError:
+            _logger.info(f'The font cache "{cache_file}" is corrupted. It will be recreated.')
+            self.__connection.close()
+            cache_file.unlink()
+            self.__connection = self.__connect()
+            self.__initialize()
+
+
+    @property
+    def cache_file(self) -> Path:
+        return self.__cache_file
+
+
+    def __connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.__cache_file)
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute(f"PRAGMA mmap_size = {FontCache.MMAP_SIZE}")
+        return connection
+
+
+    def __initialize(self) -> None:
+        with self.__connection:
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            row = self.__connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()
+
+            version = f"{__version__}:{FontCache.SCHEMA_VERSION}"
+            if row is None or row[0] != version:
+                self.__connection.execute("DROP TABLE IF EXISTS font_name")
+                self.__connection.execute("DROP TABLE IF EXISTS font_face")
+                self.__connection.execute("DROP TABLE IF EXISTS font_file")
+                self.__connection.execute("DROP TABLE IF EXISTS invalid_font")
+                self.__connection.execute("DROP TABLE IF EXISTS directory")
+                self.__connection.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('version', ?)", (version,))
+
+            self.__connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS font_file (
+                    id INTEGER PRIMARY KEY,
+                    filename TEXT NOT NULL UNIQUE,
+                    is_collection_font INTEGER NOT NULL,
+                    last_loaded_time REAL NOT NULL,
+                    creation_time REAL NOT NULL
+                )
+                """
+            )
+            self.__connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS font_face (
+                    id INTEGER PRIMARY KEY,
+                    font_file_id INTEGER NOT NULL REFERENCES font_file(id) ON DELETE CASCADE,
+                    face_type TEXT NOT NULL,
+                    font_index INTEGER NOT NULL,
+                    weight INTEGER NOT NULL,
+                    is_italic INTEGER NOT NULL,
+                    is_glyph_emboldened INTEGER NOT NULL,
+                    font_type TEXT NOT NULL,
+                    named_instance_coordinates TEXT,
+                    glyph_coverage BLOB
+                )
+                """
+            )
+            self.__connection.execute("CREATE INDEX IF NOT EXISTS font_face_font_file_id ON font_face(font_file_id)")
+            self.__connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS font_name (
+                    id INTEGER PRIMARY KEY,
+                    font_face_id INTEGER NOT NULL REFERENCES font_face(id) ON DELETE CASCADE,
+                    name_type TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    lower_value TEXT NOT NULL,
+                    lang_code TEXT NOT NULL
+                )
+                """
+            )
+            self.__connection.execute("CREATE INDEX IF NOT EXISTS font_name_font_face_id ON font_name(font_face_id)")
+            self.__connection.execute("CREATE INDEX IF NOT EXISTS font_name_lower_value ON font_name(lower_value)")
+            self.__connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS invalid_font (
+                    filename TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    error TEXT NOT NULL
+                )
+                """
+            )
+            self.__connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS directory (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER,
+                    files TEXT NOT NULL,
+                    subdirectories TEXT NOT NULL
+                )
+                """
+            )
+
+
+    def close(self) -> None:
+        self.__connection.close()
+
+
+    def __enter__(self) -> FontCache:
+        return self
+
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+    def get_font_files(self, check_files_exist: bool = True) -> tuple[list[FontFile], list[Path]]:
+        """Retrieve all the cached fonts.
+
+        The fonts that don't exist anymore are removed from the cache.
+        The fonts that can't be decoded (corrupted rows) are also removed from the cache, but the other fonts are still returned.
+
+        Args:
+            check_files_exist: If False, it doesn't verify that the fonts still exist.
+                It avoids one stat per font when the caller already knows which files exist.
+        Returns:
+            The cached fonts and the filename of the fonts that were corrupted in the cache.
+        """
+        return self.__get_font_files("SELECT id, filename, is_collection_font, last_loaded_time, creation_time FROM font_file ORDER BY id", (), check_files_exist)
+
+
+    def get_font_files_by_name(self, name: str) -> list[FontFile]:
+        """
+        Args:
+            name: A family name or an exact name. The comparison is case-insensitive.
+        Returns:
+            The cached fonts that contain at least one font face with this family name or exact name.
+        """
+        font_files, _ = self.__get_font_files(
+            """
+            SELECT id, filename, is_collection_font, last_loaded_time, creation_time FROM font_file WHERE id IN (
+                SELECT font_face.font_file_id FROM font_name
+                JOIN font_face ON font_face.id = font_name.font_face_id
+                WHERE font_name.lower_value = ? AND font_name.name_type IN (?, ?)
+            ) ORDER BY id
+            """,
+            (name.lower(), FontCache.FAMILY_NAMES, FontCache.EXACT_NAMES),
+            True
+        )
+        return font_files
+
+
+    def get_font_files_by_filenames(self, filenames: Iterable[Path], check_files_exist: bool = True) -> list[FontFile]:
+        """
+        Args:
+            filenames: The filename of the fonts to retrieve.
+            check_files_exist: See the doc of get_font_files.
+        Returns:
+            The cached fonts among filenames. The fonts that aren't in the cache are ignored.
+            Like with get_font_files, the fonts that don't exist anymore or that are corrupted are removed from the cache.
+        """
+        font_files: list[FontFile] = []
+        for filenames_chunk in FontCache.__chunks([str(filename) for filename in filenames]):
+            placeholders = ",".join("?" * len(filenames_chunk))
+            chunk_font_files, _ = self.__get_font_files(
+                f"SELECT id, filename, is_collection_font, last_loaded_time, creation_time FROM font_file WHERE filename IN ({placeholders}) ORDER BY id",
+                tuple(filenames_chunk),
+                check_files_exist
+            )
+            font_files.extend(chunk_font_files)
+        return font_files
+
+
+    def get_font_names(self) -> list[tuple[Path, str]]:
+        """Retrieve the family names and the exact names of the cached fonts without decoding the fonts.
+
+        It is much faster than get_font_files and it uses much less memory, so it can be used to find which fonts may match a name.
+
+        Returns:
+            The distinct family names and exact names of each cached font, with the filename of the font.
+        """
+        return self.__get_font_names("", ())
+
+
+    def get_font_names_by_prefix(self, prefix: str) -> list[tuple[Path, str]]:
+        """Same as get_font_names, but only for the names whose lowercase starts with prefix.
+
+        The names are found with the index of the lowercase names, so only the rows of these names are read.
+        It allows a process to find the fonts that may match a name without reading the whole cache.
+
+        Args:
+            prefix: A lowercase prefix. See FontSelectionStrategy.get_name_key_prefix.
+        Returns:
+            The distinct family names and exact names whose lowercase starts with prefix, with the filename of the font.
+        """
+        if not prefix:
+            return self.get_font_names()
+
+        # SQLite compares the strings by their UTF-8 bytes, which sorts them like their code points.
+        # So, the names that start with prefix are between prefix and the prefix whose last character is incremented.
+        last_code_point = ord(prefix[-1]) + 1
+        if 0xD800 <= last_code_point <= 0xDFFF:
+            # The surrogates can't be encoded in UTF-8
+            last_code_point = 0xE000
+        if last_code_point > 0x10FFFF:
+            return self.__get_font_names("AND font_name.lower_value >= ?", (prefix,))
+        return self.__get_font_names("AND font_name.lower_value >= ? AND font_name.lower_value < ?", (prefix, prefix[:-1] + chr(last_code_point)))
+
+
+    def __get_font_names(self, condition: str, parameters: tuple[str, ...]) -> list[tuple[Path, str]]:
+        font_names: list[tuple[Path, str]] = []
+        # A filename appears in many rows, so each one is only converted once
+        paths: dict[str, Path] = {}
+        for filename, value in self.__connection.execute(
+            f"""
+            SELECT DISTINCT font_file.filename, font_name.value FROM font_name
+            JOIN font_face ON font_face.id = font_name.font_face_id
+            JOIN font_file ON font_file.id = font_face.font_file_id
+            WHERE font_name.name_type IN (?, ?) {condition}
+            """,
+            (FontCache.FAMILY_NAMES, FontCache.EXACT_NAMES, *parameters)
+        ):
+            path = paths.get(filename)
+            if path is None:
+                path = paths[filename] = Path(filename)
+            font_names.append((path, value))
+        return font_names
+
+
+    def get_last_loaded_times(self) -> dict[Path, float]:
+        """
+        Returns:
+            The last_loaded_time of each cached font, without decoding the fonts.
+        """
+        return {Path(filename): last_loaded_time for filename, last_loaded_time in self.__connection.execute("SELECT filename, last_loaded_time FROM font_file")}
+
+
+    def __get_font_files(self, font_file_query: str, parameters: tuple[str, ...], check_files_exist: bool) -> tuple[list[FontFile], list[Path]]:
+        font_file_rows = self.__connection.execute(font_file_query, parameters).fetchall()
+        font_file_ids = [row[0] for row in font_file_rows]
+
+        # font_file_id: [face_row]
+        face_rows: dict[int, list[tuple[int, int, str, int, int, int, int, str, str | None, bytes | None]]] = {font_file_id: [] for font_file_id in font_file_ids}
+        # font_face_id: {name_type: [Name]}
+        names: dict[int, dict[str, list[tuple[str, str]]]] = {}
+
+        for font_file_id_chunk in FontCache.__chunks(font_file_ids):
+            placeholders = ",".join("?" * len(font_file_id_chunk))
+            for face_row in self.__connection.execute(
+                f"""
+                SELECT id, font_file_id, face_type, font_index, weight, is_italic, is_glyph_emboldened, font_type, named_instance_coordinates, glyph_coverage
+                FROM font_face WHERE font_file_id IN ({placeholders}) ORDER BY id
+                """,
+                font_file_id_chunk
+            ):
+                face_rows[face_row[1]].append(face_row)
+                names[face_row[0]] = {}
+
+            for font_face_id, name_type, value, lang_code in self.__connection.execute(
+                f"""
+                SELECT font_name.font_face_id, font_name.name_type, font_name.value, font_name.lang_code FROM font_name
+                JOIN font_face ON font_face.id = font_name.font_face_id
+                WHERE font_face.font_file_id IN ({placeholders}) ORDER BY font_name.id
+                """,
+                font_file_id_chunk
+            ):
+                names[font_face_id].setdefault(name_type, []).append((value, lang_code))
+
+        font_files: list[FontFile] = []
+        corrupted_filenames: list[Path] = []
+        rows_to_delete: list[int] = []
+
+        for font_file_id, filename, is_collection_font, last_loaded_time, creation_time in font_file_rows:
+            try:
+                # The faces of a same font index share the same coverage, so it is only deserialized once
+                glyph_coverages: dict[bytes, GlyphCoverage] = {}
+                font_faces = [FontCache.__row_to_font_face(face_row, names[face_row[0]], glyph_coverages) for face_row in face_rows[font_file_id]]
+                font_files.append(FontFile(Path(filename), font_faces, bool(is_collection_font), last_loaded_time, check_files_exist, creation_time))
+            except FileNotFoundError:
+                # The font has been deleted
+                rows_to_delete.append(font_file_id)
+            except Exception:
+                _logger.info(f'The font "{filename}" is corrupted in the font cache "{self.cache_file}". It will be removed from the cache.')
+                corrupted_filenames.append(Path(filename))
+                rows_to_delete.append(font_file_id)
+
+        if rows_to_delete:
+            with self.__connection:
+                self.__connection.executemany("DELETE FROM font_file WHERE id = ?", ((font_file_id,) for font_file_id in rows_to_delete))
+
+        return font_files, corrupted_filenames
+
+
+    def add_font_files(self, font_files: Iterable[FontFile]) -> None:
+        """Add the fonts to the cache. If a font with the same filename is already in the cache, it is replaced.
+
+        Args:
+            font_files: The fonts to cache.
+        """
+        with self.__connection:
+            for font_file in font_files:
+                self.__connection.execute("DELETE FROM font_file WHERE filename = ?", (str(font_file.filename),))
+                self.__connection.execute("DELETE FROM invalid_font WHERE filename = ?", (str(font_file.filename),))
+                cursor = self.__connection.execute(
+                    "INSERT INTO font_file (filename, is_collection_font, last_loaded_time, creation_time) VALUES (?, ?, ?, ?)",
+                    (str(font_file.filename), font_file.is_collection_font, font_file.last_loaded_time, font_file.creation_time)
+                )
+                font_file_id = cursor.lastrowid
+
+                for font_face in font_file.font_faces:
+                    named_instance_coordinates = None
+                    if isinstance(font_face, VariableFontFace):
+                        named_instance_coordinates = json.dumps(font_face.named_instance_coordinates)
+
+                    cursor = self.__connection.execute(
+                        """
+                        INSERT INTO font_face (font_file_id, face_type, font_index, weight, is_italic, is_glyph_emboldened, font_type, named_instance_coordinates, glyph_coverage)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            font_file_id,
+                            font_face.__class__.__name__,
+                            font_face.font_index,
+                            font_face.weight,
+                            font_face.is_italic,
+                            font_face.is_glyph_emboldened,
+                            font_face.font_type.name,
+                            named_instance_coordinates,
+                            None if font_face.glyph_coverage is None else font_face.glyph_coverage.to_bytes(),
+                        )
+                    )
+                    font_face_id = cursor.lastrowid
+
+                    self.__connection.executemany(
+                        "INSERT INTO font_name (font_face_id, name_type, value, lower_value, lang_code) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            (font_face_id, name_type, name.value, name.value.lower(), name.lang_code.to_tag())
+                            for name_type, names in FontCache.__get_font_face_names(font_face)
+                            for name in names
+                        )
+                    )
+
+
+    def remove_font_files(self, filenames: Iterable[Path]) -> None:
+        """
+        Args:
+            filenames: The filename of the fonts to remove from the cache. It also works for the invalid fonts.
+        """
+        rows = [(str(filename),) for filename in filenames]
+        with self.__connection:
+            self.__connection.executemany("DELETE FROM font_file WHERE filename = ?", rows)
+            self.__connection.executemany("DELETE FROM invalid_font WHERE filename = ?", rows)
+
+
+    def get_invalid_fonts(self) -> dict[Path, str]:
+        """Retrieve the invalid fonts that haven't changed since they were added with add_invalid_fonts.
+
+        The invalid fonts that have been deleted, or whose size or modification time has changed, are removed from the cache.
+
+        Returns:
+            The filename of the invalid fonts with the reason why they are invalid.
+        """
+        invalid_fonts: dict[Path, str] = {}
+        rows_to_delete: list[tuple[str]] = []
+
+        for filename, size, mtime_ns, error in self.__connection.execute("SELECT filename, size, mtime_ns, error FROM invalid_font ORDER BY filename"):
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                rows_to_delete.append((filename,))
+                continue
+
+            if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                invalid_fonts[Path(filename)] = error
+            else:
+                rows_to_delete.append((filename,))
+
+        if rows_to_delete:
+            with self.__connection:
+                self.__connection.executemany("DELETE FROM invalid_font WHERE filename = ?", rows_to_delete)
+
+        return invalid_fonts
+
+
+    def add_invalid_fonts(self, invalid_fonts: dict[Path, str]) -> None:
+        """Remember the invalid fonts with their current size and modification time.
+        If a font with the same filename is already in the cache, it is replaced.
+
+        Args:
+            invalid_fonts: The filename of the invalid fonts with the reason why they are invalid.
+        """
+        rows: list[tuple[str, int, int, str]] = []
+        for filename, error in invalid_fonts.items():
+            try:
+                stat = filename.stat()
+            except OSError:
+                continue
+            rows.append((str(filename), stat.st_size, stat.st_mtime_ns, error))
+
+        with self.__connection:
+            self.__connection.executemany("DELETE FROM font_file WHERE filename = ?", ((row[0],) for row in rows))
+            self.__connection.executemany("INSERT OR REPLACE INTO invalid_font (filename, size, mtime_ns, error) VALUES (?, ?, ?, ?)", rows)
+
+
+    def get_directories(self) -> dict[Path, ScannedDirectory]:
+        """
+        Returns:
+            The directories saved with set_directories. If a row can't be decoded, the directory is ignored, so it will be scanned again.
+        """
+        directories: dict[Path, ScannedDirectory] = {}
+        for path, mtime_ns, files, subdirectories in self.__connection.execute("SELECT path, mtime_ns, files, subdirectories FROM directory"):
+            try:
+                directories[Path(path)] = ScannedDirectory(mtime_ns, json.loads(files), json.loads(subdirectories))
+            except ValueError:
+                continue
+        return directories
+
+
+    def set_directories(self, directories: dict[Path, ScannedDirectory]) -> None:
+        """
+        Args:
+            directories: The scanned directories obtained from DirectoryScanner. It replaces the previous ones.
+        """
+        with self.__connection:
+            self.__connection.execute("DELETE FROM directory")
+            self.__connection.executemany(
+                "INSERT INTO directory (path, mtime_ns, files, subdirectories) VALUES (?, ?, ?, ?)",
+                (
+                    (str(path), directory.mtime_ns, json.dumps(directory.files), json.dumps(directory.subdirectories))
+                    for path, directory in directories.items()
+                )
+            )
+
+
+    def clear(self) -> None:
+        """
+        Remove all the fonts from the cache, including the invalid fonts and the scanned directories.
+        """
+        with self.__connection:
+            self.__connection.execute("DELETE FROM font_file")
+            self.__connection.execute("DELETE FROM invalid_font")
+            self.__connection.execute("DELETE FROM directory")
+
+
+    @staticmethod
+    def __get_font_face_names(font_face: ABCFontFace) -> list[tuple[str, list[Name]]]:
+        """
+        Args:
+            font_face: A font face.
+        Returns:
+            The names to store for the font face with their name type.
+            The family_names and the exact_names are always stored, so the cache can be queried by name.
+        """
+        names = [
+            (FontCache.FAMILY_NAMES, font_face.family_names),
+            (FontCache.EXACT_NAMES, font_face.exact_names),
+        ]
+        if isinstance(font_face, VariableFontFace):
+            names.extend([
+                (FontCache.FAMILIES_PREFIX, font_face.families_prefix),
+                (FontCache.FAMILIES_SUFFIX, font_face.families_suffix),
+                (FontCache.EXACT_NAMES_SUFFIX, font_face.exact_names_suffix),
+            ])
+        return names
+
+
+    @staticmethod
+    def __row_to_font_face(
+        face_row: tuple[int, int, str, int, int, int, int, str, str | None, bytes | None],
+        names: dict[str, list[tuple[str, str]]],
+        glyph_coverages: dict[bytes, GlyphCoverage]
+    ) -> ABCFontFace:
+        def get_names(name_type: str) -> list[Name]:
+            return [Name(value, Language.get(lang_code)) for value, lang_code in names.get(name_type, [])]
+
+        _, _, face_type, font_index, weight, is_italic, is_glyph_emboldened, font_type, named_instance_coordinates, glyph_coverage_data = face_row
+
+        glyph_coverage = None
+        if glyph_coverage_data is not None:
+            glyph_coverage = glyph_coverages.get(glyph_coverage_data)
+            if glyph_coverage is None:
+                glyph_coverage = GlyphCoverage.from_bytes(glyph_coverage_data)
+                glyph_coverages[glyph_coverage_data] = glyph_coverage
+
+        if face_type == NormalFontFace.__name__:
+            return NormalFontFace(
+                font_index,
+                get_names(FontCache.FAMILY_NAMES),
+                get_names(FontCache.EXACT_NAMES),
+                weight,
+                bool(is_italic),
+                bool(is_glyph_emboldened),
+                FontType[font_type],
+                glyph_coverage,
+            )
+        elif face_type == VariableFontFace.__name__ and named_instance_coordinates is not None:
+            return VariableFontFace(
+                font_index,
+                get_names(FontCache.FAMILIES_PREFIX),
+                get_names(FontCache.FAMILIES_SUFFIX),
+                get_names(FontCache.EXACT_NAMES_SUFFIX),
+                weight,
+                bool(is_italic),
+                FontType[font_type],
+                json.loads(named_instance_coordinates),
+                glyph_coverage,
+            )
+        raise ValueError(f'The font face type "{face_type}" is invalid.')
+
+
+    @staticmethod
+    def __chunks(values: list[Any]) -> Iterable[list[Any]]:
+        # SQLite limits the number of parameters of a query. Old versions only support 999.
+        chunk_size = 900
+        for i in range(0, len(values), chunk_size):
+            yield values[i : i + chunk_size]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections import Counter
-from collections.abc import Generator
-from typing import TYPE_CHECKING, Any
+from collections import Counter, OrderedDict
+from collections.abc import Generator, Hashable, Iterable
+from itertools import chain, count
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, SupportsIndex
 
 from ..ass import AssStyle
 from .abc_font_face import ABCFontFace
+from .font_cache import FontCache
 from .font_file import FontFile
 from .font_loader import FontLoader
 from .font_result import FontResult
@@ -17,6 +20,182 @@ if TYPE_CHECKING:
 
 __all__ = ["FontCollection"]
 
+# The versions are unique among all the lists, so a version identifies both the list and its content
+_list_versions = count()
+
+
+class _FontFileList(list["FontFile"]):
+    """A list of FontFile that gets a new version each time it is modified, so its changes can be detected in O(1).
+
+    Attributes:
+        version: A number that changes each time the list is modified. No other list has the same version.
+    """
+
+    def __init__(self, font_files: Iterable[FontFile] = ()) -> None:
+        super().__init__(font_files)
+        self.version = next(_list_versions)
+
+    def __modified(self) -> None:
+        self.version = next(_list_versions)
+
+    def append(self, font_file: FontFile) -> None:
+        super().append(font_file)
+        self.__modified()
+
+    def extend(self, font_files: Iterable[FontFile]) -> None:
+        super().extend(font_files)
+        self.__modified()
+
+    def insert(self, index: SupportsIndex, font_file: FontFile) -> None:
+        super().insert(index, font_file)
+        self.__modified()
+
+    def pop(self, index: SupportsIndex = -1) -> FontFile:
+        font_file = super().pop(index)
+        self.__modified()
+        return font_file
+
+    def remove(self, font_file: FontFile) -> None:
+        super().remove(font_file)
+        self.__modified()
+
+    def clear(self) -> None:
+        super().clear()
+        self.__modified()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self.__modified()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.__modified()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self.__modified()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self.__modified()
+
+    def __iadd__(self, font_files: Iterable[FontFile]) -> _FontFileList:  # type: ignore[override, misc]
+        super().__iadd__(font_files)
+        self.__modified()
+        return self
+
+    def __imul__(self, value: SupportsIndex) -> _FontFileList:
+        super().__imul__(value)
+        self.__modified()
+        return self
+
+
+def _get_font_files_version(font_files: list[FontFile]) -> int | None:
+    """
+    Args:
+        font_files: The fonts of a source of a FontCollection.
+    Returns:
+        The version of the list. The sources that aren't a _FontFileList are the empty lists of the unused sources, so their version is None.
+    """
+    return font_files.version if isinstance(font_files, _FontFileList) else None
+
+
+class _FontNameIndex:
+    """Index the font faces of a list of FontFile by the name key of their family names and exact names.
+
+    Attributes:
+        version: The version of the list of FontFile when the index has been built (see _get_font_files_version).
+        font_faces_by_key: The font faces of each name key, in the same order as the list of FontFile.
+    """
+
+    def __init__(self, font_files: list[FontFile], strategy: FontSelectionStrategy) -> None:
+        self.version = _get_font_files_version(font_files)
+        self.font_faces_by_key: dict[Hashable, list[ABCFontFace]] = {}
+
+        for font_file in font_files:
+            for font_face in font_file.font_faces:
+                face_keys: set[Hashable] = set()
+                for name in chain(font_face.family_names, font_face.exact_names):
+                    key = strategy.get_name_key(name.value)
+                    if key is not None and key not in face_keys:
+                        face_keys.add(key)
+                        self.font_faces_by_key.setdefault(key, []).append(font_face)
+
+
+class _LazyFontNameIndex:
+    """Index the fonts of a FontCache by the name key of their family names and exact names, without decoding them.
+
+    The names of a key are only read from the cache when the key is requested, if the strategy supports name key prefixes
+    (see FontSelectionStrategy.get_name_key_prefix). Otherwise, all the names are read the first time.
+    The fonts are only retrieved from the cache when one of their name keys is requested.
+    So, a process only reads the rows of the fonts it may use, and the rest of the cache is never loaded in its memory.
+
+    Attributes:
+        cache_file: The path to the font cache file.
+        strategy: The strategy used to compute the name keys.
+        filenames_by_key: The filename of the fonts of each name key that has been read, sorted like the system fonts.
+        font_files: The fonts that have already been retrieved from the cache. A font that isn't in the cache anymore is None.
+    """
+
+    def __init__(self, cache_file: Path, strategy: FontSelectionStrategy) -> None:
+        self.cache_file = cache_file
+        self.strategy = strategy
+        self.filenames_by_key: dict[Hashable, list[Path]] = {}
+        self.font_files: dict[Path, FontFile | None] = {}
+        # If True, filenames_by_key contains all the name keys of the cache
+        self.__all_names_read = False
+
+
+    def get_font_faces(self, font_name: str) -> list[ABCFontFace]:
+        """
+        Args:
+            font_name: A font name. It can come from a AssStyle. The strategy must support name keys.
+        Returns:
+            The font faces that have a family name or an exact name with the same name key as font_name.
+        """
+        key = self.strategy.get_name_key(font_name)
+        if not self.__all_names_read and key not in self.filenames_by_key:
+            self.__read_font_names(font_name, key)
+        filenames = self.filenames_by_key.get(key, [])
+
+        filenames_to_retrieve = [filename for filename in filenames if filename not in self.font_files]
+        if filenames_to_retrieve:
+            with FontCache(self.cache_file) as font_cache:
+                retrieved_font_files = {font_file.filename: font_file for font_file in font_cache.get_font_files_by_filenames(filenames_to_retrieve)}
+            for filename in filenames_to_retrieve:
+                self.font_files[filename] = retrieved_font_files.get(filename)
+
+        font_faces: list[ABCFontFace] = []
+        for filename in filenames:
+            font_file = self.font_files[filename]
+            if font_file is None:
+                continue
+            for font_face in font_file.font_faces:
+                if any(self.strategy.get_name_key(name.value) == key for name in chain(font_face.family_names, font_face.exact_names)):
+                    font_faces.append(font_face)
+        return font_faces
+
+
+    def __read_font_names(self, font_name: str, key: Hashable) -> None:
+        prefix = self.strategy.get_name_key_prefix(font_name)
+
+        with FontCache(self.cache_file) as font_cache:
+            font_names = font_cache.get_font_names() if prefix is None else font_cache.get_font_names_by_prefix(prefix)
+
+        filenames_by_key: dict[Hashable, set[Path]] = {}
+        for filename, name in font_names:
+            name_key = self.strategy.get_name_key(name)
+            # The other keys may have names that don't start with prefix
+            if name_key is not None and (prefix is None or name_key == key):
+                filenames_by_key.setdefault(name_key, set()).add(filename)
+
+        if prefix is None:
+            self.__all_names_read = True
+            self.filenames_by_key = {}
+        self.filenames_by_key.update((name_key, sorted(filenames)) for name_key, filenames in filenames_by_key.items())
+        self.filenames_by_key.setdefault(key, [])
+
+
 class FontCollection:
     """A collection of fonts. This class allows querying fonts.
 
@@ -28,11 +207,25 @@ class FontCollection:
         use_generated_fonts: Use the cached font collection (.ttc file) generated from a variable font.
         system_fonts: If use_system_font is set to True, it will contain the system font.
             If False, it will be empty.
+            The system fonts can be given to the constructor (for example, only the system fonts that may be used), so they aren't loaded.
+            They can't be given with reload_system_font. When they are given, lazy_system_fonts is False.
         generated_fonts: If use_generated_fonts is set to True, it will contain the font collection (.ttc file) generated from a variable font.
             If False, it will be empty.
             Warning: All FontCollections use the same generated_fonts.
-        additional_fonts: Contains the specified additional fonts.
+        additional_fonts: Contains the specified additional fonts. It is a copy of the given fonts.
+            It can be modified in place (for example with append) or replaced, both are detected.
         fonts: A list that contain `system_fonts`, `generated_fonts`, and `additional_fonts`.
+        max_workers: The number of worker processes used to load the system fonts. See the doc of FontLoader.load_font_files.
+        font_result_cache_size: The maximum number of results of get_used_font_by_style that are cached. If 0, the results aren't cached.
+            The cache is cleared when a FontFile is added, removed or replaced in system_fonts, generated_fonts or additional_fonts.
+            Warning: Reloading a FontFile in place (with FontFile.reload_font_file) isn't detected.
+        font_result_cache_hits: The number of calls to get_used_font_by_style that have been answered by the cache.
+        font_result_cache_misses: The number of calls to get_used_font_by_style that have been computed.
+        lazy_system_fonts: If True (the default), get_used_font_by_style doesn't load the system fonts.
+            It synchronizes the system font cache, then it only reads from the cache the names and the fonts that may match the style,
+            so the processes that use the same cache don't each load a copy of the whole cache.
+            It requires a strategy that supports name keys (see FontSelectionStrategy.get_name_key), otherwise, all the system fonts are loaded.
+            Accessing system_fonts or fonts still loads all the system fonts.
     """
 
     def __init__(
@@ -41,12 +234,39 @@ class FontCollection:
         reload_system_font: bool = False,
         use_generated_fonts: bool = True,
         additional_fonts: list[FontFile] = [],
+        max_workers: int | None = 1,
+        font_result_cache_size: int = 1024,
+        lazy_system_fonts: bool = True,
+        system_fonts: list[FontFile] | None = None,
     ) -> None:
+        if system_fonts is not None and reload_system_font:
+            raise ValueError("system_fonts can't be given with reload_system_font")
+
         self.use_system_font = use_system_font
         self.reload_system_font = reload_system_font
         self.use_generated_fonts = use_generated_fonts
         self.additional_fonts = additional_fonts
-        self.__system_fonts: list[FontFile] | None = None
+        self.max_workers = max_workers
+        self.__system_fonts: _FontFileList | None = None if system_fonts is None else _FontFileList(system_fonts)
+        self.__has_given_system_fonts = system_fonts is not None
+        # (options, sources version, hash) of the last time the hash has been computed
+        self.__hash: tuple[tuple[bool, bool, bool, bool, int | None], tuple[int | None, int], int] | None = None
+        self.font_result_cache_size = font_result_cache_size
+        # (source, strategy type): _FontNameIndex
+        self.__name_indexes: dict[tuple[str, type[FontSelectionStrategy]], _FontNameIndex] = {}
+        # (fontname, weight, italic, strategy type): FontResult
+        self.__font_results: OrderedDict[tuple[str, int, bool, type[FontSelectionStrategy]], FontResult | None] = OrderedDict()
+        # The version of each source when the results have been cached
+        self.__font_results_sources_version: tuple[int | None, ...] | None = None
+        # (version of the generated font cache file, generated fonts) of the last time they have been loaded
+        self.__generated_fonts: tuple[Hashable, _FontFileList] | None = None
+        self.__font_result_cache_hits = 0
+        self.__font_result_cache_misses = 0
+        self.lazy_system_fonts = lazy_system_fonts and system_fonts is None
+        # The system font cache file once it has been synchronized by the lazy mode
+        self.__lazy_system_font_cache_file: Path | None = None
+        # strategy type: _LazyFontNameIndex
+        self.__lazy_name_indexes: dict[type[FontSelectionStrategy], _LazyFontNameIndex] = {}
 
 
     def __iter__(self) -> Generator[FontFile, None, None]:
@@ -57,10 +277,10 @@ class FontCollection:
     def system_fonts(self) -> list[FontFile]:
         if self.use_system_font:
             if self.reload_system_font:
-                return FontLoader.load_system_fonts()
+                return _FontFileList(FontLoader.load_system_fonts(self.max_workers))
 
             if self.__system_fonts is None:
-                self.__system_fonts = FontLoader.load_system_fonts()
+                self.__system_fonts = _FontFileList(FontLoader.load_system_fonts(self.max_workers))
             return self.__system_fonts
         return []
 
@@ -69,20 +289,70 @@ class FontCollection:
         raise AttributeError("You cannot set system_fonts, but you can set use_system_font")
 
 
+    @property
+    def additional_fonts(self) -> list[FontFile]:
+        return self.__additional_fonts
+
+    @additional_fonts.setter
+    def additional_fonts(self, value: Iterable[FontFile]) -> None:
+        self.__additional_fonts = _FontFileList(value)
+
+
+    @property
+    def sources_version(self) -> tuple[int | None, int]:
+        """
+        A key that changes each time the given system fonts or the additional fonts are modified or replaced.
+        Two collections never have the same key. The generated fonts are shared by all the collections, so they aren't part of it.
+        """
+        return (self.__system_fonts.version if self.__has_given_system_fonts and self.__system_fonts is not None else None, self.__additional_fonts.version)
+
+
     @property
     def generated_fonts(self) -> list[FontFile]:
-        if self.use_generated_fonts:
-            return FontLoader.load_generated_fonts()
-        return []
+        return list(self.__get_generated_fonts())
 
     @generated_fonts.setter
     def generated_fonts(self, value: Any) -> None:
         raise AttributeError("You cannot set generated_fonts, but you can set use_generated_fonts")
 
 
+    def __get_generated_fonts(self) -> list[FontFile]:
+        """
+        Returns:
+            The generated fonts. They are only loaded again when the generated font cache file changes.
+            Unlike generated_fonts, it isn't a copy, so its version can be used to detect the changes.
+        """
+        if self.use_generated_fonts:
+            version = FontLoader.get_generated_fonts_version()
+            if self.__generated_fonts is None or self.__generated_fonts[0] != version:
+                self.__generated_fonts = (version, _FontFileList(FontLoader.load_generated_fonts()))
+            return self.__generated_fonts[1]
+        return []
+
+
+    @property
+    def font_result_cache_hits(self) -> int:
+        return self.__font_result_cache_hits
+
+
+    @property
+    def font_result_cache_misses(self) -> int:
+        return self.__font_result_cache_misses
+
+
+    def clear_font_result_cache(self) -> None:
+        """
+        Clears the cached results of get_used_font_by_style and resets the hit and miss counters.
+        """
+        self.__font_results.clear()
+        self.__font_results_sources_version = None
+        self.__font_result_cache_hits = 0
+        self.__font_result_cache_misses = 0
+
+
     @property
     def fonts(self) -> list[FontFile]:
-        return self.system_fonts + self.generated_fonts + self.additional_fonts
+        return self.system_fonts + self.__get_generated_fonts() + self.additional_fonts
 
     @fonts.setter
     def fonts(self, value: Any) -> None:
@@ -98,34 +368,190 @@ class FontCollection:
             The best font that matches an AssStyle based on the strategy algorithm.
             If no fonts are found, it returns None.
         """
+        sources, lazy_name_index = self.__get_sources(self.__use_lazy_system_fonts(style.fontname, strategy), strategy)
+
+        result_key = FontCollection.__get_result_key(style, strategy)
+        if result_key in self.__font_results:
+            self.__font_result_cache_hits += 1
+            self.__font_results.move_to_end(result_key)
+            return self.__font_results[result_key]
+
+        self.__font_result_cache_misses += 1
+        font_faces = self.__get_candidate_font_faces(style.fontname, strategy, sources, lazy_name_index)
+        font_result = FontCollection.__get_font_result(
+            style, strategy, ((font_face, strategy.get_similarity_score(font_face, style)) for font_face in font_faces)
+        )
+        self.__add_font_result(result_key, font_result)
+        return font_result
+
+
+    def get_used_fonts_by_styles(self, styles: Iterable[AssStyle], strategy: FontSelectionStrategy) -> dict[AssStyle, FontResult | None]:
+        """Same as get_used_font_by_style, but for many styles at once, like all the used styles of one or many subtitles.
+
+        The styles that have the same font name share their candidate font faces, and they are scored together
+        with FontSelectionStrategy.get_similarity_scores. The results are exactly the same as get_used_font_by_style.
+
+        Args:
+            styles: The AssStyles.
+            strategy: The strategy used to select the best font face that corresponds to the styles.
+        Returns:
+            The best font that matches each AssStyle. See get_used_font_by_style.
+        """
+        font_results: dict[AssStyle, FontResult | None] = {}
+
+        # font name: styles. The dict removes the duplicated styles and keeps the order.
+        styles_by_font_name: dict[str, dict[AssStyle, None]] = {}
+        for style in styles:
+            styles_by_font_name.setdefault(style.fontname, {})[style] = None
+
+        # The sources are only retrieved once for all the styles, with and without the lazy mode if needed
+        sources_by_lazy_mode: dict[bool, tuple[tuple[tuple[str, list[FontFile]], ...], _LazyFontNameIndex | None]] = {}
+        for font_name, font_name_styles in styles_by_font_name.items():
+            use_lazy_system_fonts = self.__use_lazy_system_fonts(font_name, strategy)
+            if use_lazy_system_fonts not in sources_by_lazy_mode:
+                sources_by_lazy_mode[use_lazy_system_fonts] = self.__get_sources(use_lazy_system_fonts, strategy)
+            sources, lazy_name_index = sources_by_lazy_mode[use_lazy_system_fonts]
+
+            missed_styles: list[AssStyle] = []
+            for style in font_name_styles:
+                result_key = FontCollection.__get_result_key(style, strategy)
+                if result_key in self.__font_results:
+                    self.__font_result_cache_hits += 1
+                    self.__font_results.move_to_end(result_key)
+                    font_results[style] = self.__font_results[result_key]
+                else:
+                    self.__font_result_cache_misses += 1
+                    missed_styles.append(style)
+
+            if not missed_styles:
+                continue
+
+            font_faces = list(self.__get_candidate_font_faces(font_name, strategy, sources, lazy_name_index))
+            scores = strategy.get_similarity_scores(font_faces, missed_styles)
+            for style, style_scores in zip(missed_styles, scores):
+                font_result = FontCollection.__get_font_result(style, strategy, zip(font_faces, style_scores))
+                font_results[style] = font_result
+                self.__add_font_result(FontCollection.__get_result_key(style, strategy), font_result)
+
+        return font_results
+
+
+    def __use_lazy_system_fonts(self, font_name: str, strategy: FontSelectionStrategy) -> bool:
+        """
+        Args:
+            font_name: A font name. It can come from a AssStyle.
+            strategy: The strategy used to match the font names.
+        Returns:
+            True if the system fonts that can match the font name can be retrieved from the lazy index.
+        """
+        return self.use_system_font and self.lazy_system_fonts and strategy.get_name_key(font_name) is not None
+
+
+    def __get_sources(
+        self,
+        use_lazy_system_fonts: bool,
+        strategy: FontSelectionStrategy
+    ) -> tuple[tuple[tuple[str, list[FontFile]], ...], _LazyFontNameIndex | None]:
+        """Retrieve the fonts of each source. If they have changed since the results have been cached, the cached results are cleared.
+
+        The changes are detected with the versions of the sources, so it is O(1), but it reads the header of the generated font cache file.
+        So, it should be called once per call of get_used_font_by_style or get_used_fonts_by_styles, not once per style.
+
+        Args:
+            use_lazy_system_fonts: If True, the system fonts are retrieved from the lazy index. See __use_lazy_system_fonts.
+            strategy: The strategy used to match the font names.
+        Returns:
+            The name and the fonts of system_fonts, generated_fonts and additional_fonts,
+            and, if the system fonts are loaded lazily, the index of the system fonts. In that case, the system fonts of the sources are empty.
+        """
+        lazy_name_index: _LazyFontNameIndex | None = None
+        if use_lazy_system_fonts:
+            lazy_name_index = self.__get_lazy_name_index(strategy)
+            sources: tuple[tuple[str, list[FontFile]], ...] = (("system", []), ("generated", self.__get_generated_fonts()), ("additional", self.additional_fonts))
+        else:
+            sources = (("system", self.system_fonts), ("generated", self.__get_generated_fonts()), ("additional", self.additional_fonts))
+
+        sources_version = tuple(_get_font_files_version(font_files) for _, font_files in sources)
+        if self.__font_results_sources_version != sources_version:
+            self.__font_results.clear()
+            self.__font_results_sources_version = sources_version
+
+        return sources, lazy_name_index
+
+
+    @staticmethod
+    def __get_result_key(style: AssStyle, strategy: FontSelectionStrategy) -> tuple[str, int, bool, type[FontSelectionStrategy]]:
+        return (style.fontname, style.weight, style.italic, type(strategy))
+
+
+    def __add_font_result(self, result_key: tuple[str, int, bool, type[FontSelectionStrategy]], font_result: FontResult | None) -> None:
+        if self.font_result_cache_size > 0:
+            self.__font_results[result_key] = font_result
+            while len(self.__font_results) > self.font_result_cache_size:
+                self.__font_results.popitem(last=False)
+
+
+    def __get_candidate_font_faces(
+        self,
+        font_name: str,
+        strategy: FontSelectionStrategy,
+        sources: tuple[tuple[str, list[FontFile]], ...],
+        lazy_name_index: _LazyFontNameIndex | None
+    ) -> Iterable[ABCFontFace]:
+        """
+        Args:
+            font_name: A font name. It can come from a AssStyle.
+            strategy: The strategy used to match the font names.
+            sources: The name and the fonts of system_fonts, generated_fonts and additional_fonts.
+            lazy_name_index: If not None, the index of the system fonts. The system fonts of sources must then be empty.
+        Returns:
+            The font faces that may match font_name, in the same order as in fonts.
+        """
+        font_faces = self.__get_font_faces_by_name(font_name, strategy, sources)
+        if lazy_name_index is not None:
+            font_faces = chain(lazy_name_index.get_font_faces(font_name), font_faces)
+        return font_faces
+
+
+    @staticmethod
+    def __get_font_result(
+        style: AssStyle,
+        strategy: FontSelectionStrategy,
+        scored_font_faces: Iterable[tuple[ABCFontFace, float]]
+    ) -> FontResult | None:
+        """
+        Args:
+            style: An AssStyle
+            strategy: The strategy used to select the best font face that corresponds to the style.
+            scored_font_faces: The candidate font faces with their similarity score, in the same order as in fonts.
+        Returns:
+            See get_used_font_by_style.
+        """
         score_min = float('inf')
         selected_font_face: ABCFontFace | None = None
-        for font_file in self.fonts:
-            for font_face in font_file.font_faces:
-                score = strategy.get_similarity_score(font_face, style)
-
-                if score < float("inf"):
-                    if selected_font_face is None:
-                        score_min = score
-                        selected_font_face = font_face
-                    elif score < score_min:
-                        score_min = score
+        for font_face, score in scored_font_faces:
+            if score < float("inf"):
+                if selected_font_face is None:
+                    score_min = score
+                    selected_font_face = font_face
+                elif score < score_min:
+                    score_min = score
+                    selected_font_face = font_face
+                elif score == score_min:
+                    if font_face.font_file is None:
+                        raise ValueError(f"The font_face \"{font_face}\" isn't linked to any FontFile.")
+                    if selected_font_face.font_file is None:
+                        raise ValueError(f"The selected_font_face \"{selected_font_face}\" isn't linked to any FontFile.")
+                    # GDI prefers the oldest font when the score between 2 fonts is exactly the same.
+                    # However, for us, it is impossible to know when a font has been installed.
+                    # GDI, DirectWrite, CoreText and Fontconfig don't offer a way to retrieve the installation date of a font.
+                    # So, we get the creation date of the font, which should be the same as when it has been installed.
+                    # But, there is an exception:
+                    #   On Windows, if the user has called AddFontResourceW to install a font, the creation date of the file is not the same as when it has been installed.
+                    #   On macOS, the same problem occurs with CTFontManagerRegisterFontsForURL.
+                    # But, this use case is really rare, so it is almost impossible to happen and anyways, there is nothing we can do to avoid it.
+                    if font_face.font_file.creation_time < selected_font_face.font_file.creation_time:
                         selected_font_face = font_face
-                    elif score == score_min:
-                        if font_face.font_file is None:
-                            raise ValueError(f"The font_face \"{font_face}\" isn't linked to any FontFile.")
-                        if selected_font_face.font_file is None:
-                            raise ValueError(f"The selected_font_face \"{selected_font_face}\" isn't linked to any FontFile.")
-                        # GDI prefers the oldest font when the score between 2 fonts is exactly the same.
-                        # However, for us, it is impossible to know when a font has been installed.
-                        # GDI, DirectWrite, CoreText and Fontconfig don't offer a way to retrieve the installation date of a font.
-                        # So, we get the creation date of the font, which should be the same as when it has been installed.
-                        # But, there is an exception:
-                        #   On Windows, if the user has called AddFontResourceW to install a font, the creation date of the file is not the same as when it has been installed.
-                        #   On macOS, the same problem occurs with CTFontManagerRegisterFontsForURL.
-                        # But, this use case is really rare, so it is almost impossible to happen and anyways, there is nothing we can do to avoid it.
-                        if font_face.font_file.filename.stat().st_ctime < selected_font_face.font_file.filename.stat().st_ctime:
-                            selected_font_face = font_face
 
         if selected_font_face is None:
             return None
@@ -138,23 +564,96 @@ class FontCollection:
         return font_result
 
 
+    def __get_font_faces_by_name(
+        self,
+        font_name: str,
+        strategy: FontSelectionStrategy,
+        sources: tuple[tuple[str, list[FontFile]], ...]
+    ) -> Iterable[ABCFontFace]:
+        """
+        Args:
+            font_name: A font name. It can come from a AssStyle.
+            strategy: The strategy used to match the font names.
+            sources: The name and the fonts of system_fonts, generated_fonts and additional_fonts.
+        Returns:
+            The font faces that may match font_name, in the same order as in fonts.
+            If the strategy doesn't support name keys, it returns all the font faces.
+        """
+        key = strategy.get_name_key(font_name)
+        if key is None:
+            return (font_face for _, font_files in sources for font_file in font_files for font_face in font_file.font_faces)
+
+        font_faces: list[ABCFontFace] = []
+        for source, font_files in sources:
+            index_key = (source, type(strategy))
+            index = self.__name_indexes.get(index_key)
+            if index is None or index.version != _get_font_files_version(font_files):
+                index = _FontNameIndex(font_files, strategy)
+                self.__name_indexes[index_key] = index
+            font_faces.extend(index.font_faces_by_key.get(key, []))
+        return font_faces
+
+
+    def __get_lazy_name_index(self, strategy: FontSelectionStrategy) -> _LazyFontNameIndex:
+        """
+        Args:
+            strategy: The strategy used to compute the name keys.
+        Returns:
+            The index of the system fonts for the strategy.
+            The system font cache is synchronized the first time, or each time if reload_system_font is True.
+        """
+        if self.reload_system_font or self.__lazy_system_font_cache_file is None:
+            self.__lazy_system_font_cache_file = FontLoader.update_system_font_cache(self.max_workers)
+            self.__lazy_name_indexes.clear()
+            # The results may come from the previous system fonts
+            self.__font_results.clear()
+
+        index = self.__lazy_name_indexes.get(type(strategy))
+        if index is None:
+            index = _LazyFontNameIndex(self.__lazy_system_font_cache_file, strategy)
+            self.__lazy_name_indexes[type(strategy)] = index
+        return index
+
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, FontCollection):
             return False
-        return (self.use_system_font, self.reload_system_font, self.use_generated_fonts) == (
-            other.use_system_font, other.reload_system_font, other.use_generated_fonts
-        ) and Counter(self.additional_fonts) == Counter(other.additional_fonts)
+        # The hashes are cached, so the collections with different fonts are usually compared in O(1)
+        if hash(self) != hash(other) or self.__get_options() != other.__get_options():
+            return False
+        return self.__get_given_system_fonts() == other.__get_given_system_fonts() and Counter(self.additional_fonts) == Counter(other.additional_fonts)
 
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self.use_system_font,
-                self.reload_system_font,
-                self.use_generated_fonts,
-                frozenset(self.additional_fonts),
+        # The hash is only computed again when the options, the given system fonts or the additional fonts change, so it is usually O(1)
+        options = self.__get_options()
+        sources_version = self.sources_version
+        if self.__hash is None or self.__hash[:2] != (options, sources_version):
+            given_system_fonts = self.__get_given_system_fonts()
+            self.__hash = (
+                options,
+                sources_version,
+                hash(
+                    (
+                        options,
+                        None if given_system_fonts is None else frozenset(given_system_fonts.items()),
+                        frozenset(Counter(self.additional_fonts).items()),
+                    )
+                )
             )
-        )
+        return self.__hash[2]
+
+
+    def __get_options(self) -> tuple[bool, bool, bool, bool, int | None]:
+        return (self.use_system_font, self.reload_system_font, self.use_generated_fonts, self.lazy_system_fonts, self.max_workers)
+
+
+    def __get_given_system_fonts(self) -> Counter[FontFile] | None:
+        if not self.__has_given_system_fonts or self.__system_fonts is None:
+            return None
+        return Counter(self.__system_fonts)
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(Use system font="{self.use_system_font}", Reload system font="{self.reload_system_font}", Use generated fonts="{self.use_generated_fonts}", Additional fonts="{self.additional_fonts}")'
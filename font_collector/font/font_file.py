@@ -20,14 +20,18 @@ class FontFile:
         font_faces: A list of FontFace objects associated with the font file.
         is_collection_font: True if the FontFile represent a TTC or OTC font, otherwhise, False.
         last_loaded_time: The timestamp, in seconds since the Epoch, when the font file was last loaded.
+        creation_time: The creation time (st_ctime) of the font file when it was last loaded. It is used to choose between faces with the same score.
     """
+    __slots__ = ("__filename", "__font_faces", "__is_collection_font", "__last_loaded_time", "__creation_time")
 
     def __init__(
         self,
         filename: Path,
         font_faces: list[ABCFontFace],
         is_collection_font: bool,
-        last_loaded_time: float | None = None
+        last_loaded_time: float | None = None,
+        check_file_exists: bool = True,
+        creation_time: float | None = None
     ) -> None:
         """Initializes the FontFile instance.
 
@@ -38,8 +42,12 @@ class FontFile:
             font_faces: A list of FontFace objects associated with the font file.
             last_loaded_time: The timestamp, in seconds since the Epoch, when the font file was last loaded.
                 If None, it will be set to the current time.
+            check_file_exists: If False, it doesn't verify that the file exists.
+                It should only be used when the caller already knows it, like when restoring a cache.
+            creation_time: The creation time (st_ctime) of the font file.
+                If None, it will be retrieved from the file the first time it is needed.
         """
-        if not filename.is_file():
+        if check_file_exists and not filename.is_file():
             raise FileNotFoundError(f'The file "{filename}" doesn\'t exist.')
         if len(font_faces) == 0:
             raise ValueError(f"A FontFile need to contain at least 1 ABCFontFace.")
@@ -55,6 +63,8 @@ class FontFile:
         else:
             self.__last_loaded_time = last_loaded_time
 
+        self.__creation_time = creation_time
+
     @property
     def filename(self) -> Path:
         return self.__filename
@@ -71,33 +81,47 @@ class FontFile:
     def last_loaded_time(self) -> float:
         return self.__last_loaded_time
 
+    @property
+    def creation_time(self) -> float:
+        if self.__creation_time is None:
+            self.__creation_time = self.filename.stat().st_ctime
+        return self.__creation_time
+
     @classmethod
     def from_font_path(cls: type[FontFile], filename: Path) -> FontFile:
+        # It is retrieved before the font is read, so a modification made while reading it is detected by the next reload
+        creation_time = filename.stat().st_ctime
         font_faces, is_collection_font = FactoryABCFontFace.from_font_path(filename)
-        return cls(filename, font_faces, is_collection_font)
+        return cls(filename, font_faces, is_collection_font, creation_time=creation_time)
 
     def reload_font_file(self) -> None:
         """
         Reloads the font file to update the font faces.
         """
+        creation_time = self.filename.stat().st_ctime
         self.__font_faces, self.__is_collection_font = FactoryABCFontFace.from_font_path(self.filename)
         for font_face in self.__font_faces:
             font_face.link_face_to_a_font_file(self)
         self.__last_loaded_time = time()
+        self.__creation_time = creation_time
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, FontFile):
             return False
-        return self.filename == other.filename and Counter(self.font_faces) == Counter(other.font_faces) and self.is_collection_font == other.is_collection_font
+        # The font faces are only compared when everything else is equal, since it is much slower
+        return (
+            self.filename == other.filename and
+            self.is_collection_font == other.is_collection_font and
+            len(self.font_faces) == len(other.font_faces) and
+            Counter(self.font_faces) == Counter(other.font_faces)
+        )
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self.filename,
-                frozenset(self.font_faces),
-                self.is_collection_font,
-            )
-        )
+        # The font faces aren't hashed. Two equal FontFile have the same filename, so the hash stays consistent with __eq__,
+        # it is O(1) and it doesn't change when the font file is reloaded, so a FontFile can be used as a key.
+        return hash(self.filename)
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(Filename="{self.filename}", Font faces="{self.font_faces}", Is collection Font="{self.is_collection_font}", Last loaded time="{self.last_loaded_time}")'
@@ -1,32 +1,68 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
-import pickle
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tempfile import gettempdir
+from typing import TYPE_CHECKING
 
 from find_system_fonts_filename import get_system_fonts_filename
 
-from .._version import __version__
-from ..exceptions import InvalidFontException
+from ..exceptions import InvalidFontException, InvalidNameRecord
+from .directory_scanner import DirectoryScanner
+from .font_cache import FontCache
 from .font_file import FontFile
+from .name import Name, NameID
+from .sfnt_metadata import SfntMetadata
+
+if TYPE_CHECKING:
+    from .selection_strategy import FontSelectionStrategy
 
 __all__ = ["FontLoader"]
 _logger = logging.getLogger(__name__)
 
 
-class CacheFileContent:
-    """Represents the content structure of a font cache file.
+class _LogRecordCollector(logging.Handler):
+    """Keep the log records emitted in a worker process, so they can be sent back to the main process."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Format the message now, since the args may not be picklable
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+def _init_font_loader_worker() -> None:
+    # The log records are replayed by the main process. So, the worker must not emit them itself.
+    for logger in (logging.getLogger(), logging.getLogger(__name__.partition(".")[0])):
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+
 
-    Attributes:
-        font_collector_version: The version of the font collector that created the cache.
-        cached_fonts: A list of FontFile objects representing the cached fonts.
+def _load_font_file_in_worker(font_path: Path) -> tuple[FontFile | Exception, list[logging.LogRecord]]:
     """
-    def __init__(self, font_collector_version: str, cached_fonts: list[FontFile]):
-        self.font_collector_version = font_collector_version
-        self.cached_fonts = cached_fonts
+    Args:
+        font_path: The path of the font to load.
+    Returns:
+        The loaded FontFile (or the exception raised while loading it) and the log records emitted while loading it.
+    """
+    package_logger = logging.getLogger(__name__.partition(".")[0])
+    collector = _LogRecordCollector()
+    package_logger.addHandler(collector)
+    try:
+        result: FontFile | Exception = FontFile.from_font_path(font_path)
+    except Exception as e:
+        result = e
+    finally:
+        package_logger.removeHandler(collector)
+    return result, collector.records
 
 
 class FontLoader:
@@ -35,62 +71,116 @@ class FontLoader:
     the user to load the font file from a various source.
     """
 
+    # The generated fonts already loaded by this process: (cache file, signature of the cache file, generated fonts)
+    __generated_fonts_registry: tuple[Path, tuple[int, int], list[FontFile]] | None = None
+
     @staticmethod
     def load_font_cache_file(cache_file: Path) -> list[FontFile]:
         """Load the cache file and retrieve the list of cached fonts from it.
-        Note: If the cache file is invalid, the file will be deleted
+        Note: If the cache file is invalid or has been created by another version, the cache is reset.
+            If only some fonts are invalid, only them are removed from the cache.
 
         Args:
             cache_file: The path to the font cache file.
         Returns:
             A list of FontFile objects representing the cached fonts.
         """
-
-        cached_fonts: list[FontFile] = []
         if not cache_file.is_file():
             raise FileNotFoundError(f'The file "{cache_file}" does not exist')
 
-        has_failed_to_read_cache = False
-        with open(cache_file, "rb") as file:
-            try:
-                file_content = pickle.load(file)
-            except Exception:
-                has_failed_to_read_cache = True
-
-        if has_failed_to_read_cache:
-            cache_file.unlink()
-            return cached_fonts
-
-        if isinstance(file_content, CacheFileContent):
-            cache_file_content = file_content
-
-            if cache_file_content.font_collector_version == __version__:
-                cached_fonts = cache_file_content.cached_fonts
-            else:
-                cache_file.unlink()
-        else:
-            cache_file.unlink()
-
+        with FontCache(cache_file) as font_cache:
+            cached_fonts, _ = font_cache.get_font_files()
         return cached_fonts
 
 
     @staticmethod
     def save_font_cache_file(cache_file: Path, cache_fonts: list[FontFile]) -> None:
-        """Serialize and save the font cache data to a specified file.
+        """Save the font cache data to a specified file.
 
         This method creates a cache file with the provided path and stores the font cache data.
-        If the cache file already exists, it will be overwritten.
+        If the cache file already exists, its content will be replaced.
+        To only add, update or remove some fonts, use FontCache directly.
 
         Args:
             cache_file: The path to the font cache file.
             cache_fonts: A list of FontFile objects representing the font cache.
         """
-        with open(cache_file, "wb") as file:
-            pickle.dump(CacheFileContent(__version__, cache_fonts), file)
+        with FontCache(cache_file) as font_cache:
+            font_cache.clear()
+            font_cache.add_font_files(cache_fonts)
 
 
     @staticmethod
-    def load_additional_fonts(additional_fonts_path: Iterable[Path], scan_subdirs: bool = False) -> list[FontFile]:
+    def load_font_files(fonts_path: Iterable[Path], max_workers: int | None = 1) -> list[FontFile]:
+        """Load the font files at the specified paths. The invalid fonts are ignored.
+
+        Args:
+            fonts_path: Iterable of font file paths.
+            max_workers: The number of worker processes used to load the fonts.
+                If 1, the fonts are loaded in the current process.
+                If None, it will use as many worker processes as there are processors on the machine.
+        Returns:
+            A list of FontFile objects representing the loaded fonts.
+            They are in the same order as fonts_path, no matter the number of workers.
+        """
+        font_files, _ = FontLoader.__load_font_files(fonts_path, max_workers)
+        return font_files
+
+
+    @staticmethod
+    def __load_font_files(fonts_path: Iterable[Path], max_workers: int | None) -> tuple[list[FontFile], dict[Path, str]]:
+        """
+        Args:
+            fonts_path: Iterable of font file paths.
+            max_workers: See the doc of load_font_files.
+        Returns:
+            The loaded fonts and the invalid fonts with the reason why they are invalid. Both are in the same order as fonts_path.
+        """
+        font_files: list[FontFile] = []
+        invalid_fonts: dict[Path, str] = {}
+        fonts_path = list(fonts_path)
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be greater than 0, not {max_workers}")
+
+        if max_workers == 1 or len(fonts_path) <= 1:
+            for font_path in fonts_path:
+                try:
+                    font_files.append(FontFile.from_font_path(font_path))
+                except InvalidFontException as e:
+                    _logger.info(f"{e}. The font {font_path} will be ignored.")
+                    invalid_fonts[font_path] = str(e)
+            return font_files, invalid_fonts
+
+        # Send the fonts by chunks to reduce the inter-process communication overhead, but keep enough chunks to balance the load between the workers
+        chunksize = max(1, len(fonts_path) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers, initializer=_init_font_loader_worker) as executor:
+            for font_path, (result, log_records) in zip(fonts_path, executor.map(_load_font_file_in_worker, fonts_path, chunksize=chunksize)):
+                # Replay the logs in the order of fonts_path, so the output is the same as when the fonts are loaded in the current process
+                for log_record in log_records:
+                    logging.getLogger(log_record.name).handle(log_record)
+
+                if isinstance(result, FontFile):
+                    font_files.append(result)
+                elif isinstance(result, InvalidFontException):
+                    _logger.info(f"{result}. The font {font_path} will be ignored.")
+                    invalid_fonts[font_path] = str(result)
+                else:
+                    raise result
+
+        return font_files, invalid_fonts
+
+
+    @staticmethod
+    def load_additional_fonts(
+        additional_fonts_path: Iterable[Path],
+        scan_subdirs: bool = False,
+        max_workers: int | None = 1,
+        use_cache: bool = False,
+        skip_unmodified_directories: bool = False
+    ) -> list[FontFile]:
         """Load additional fonts from the specified paths, including subdirectories if specified.
 
         Args:
@@ -98,120 +188,333 @@ class FontLoader:
                 If you have specified a directory, it will only try to load files with the following extensions: ttf, otf, ttc, and otc.
             scan_subdirs: If True, it will scan subdirectories for the directory specified in additional_fonts_path.
                 If False, it will only scan the directory specified in additional_fonts_path.
+            max_workers: The number of worker processes used to load the fonts. See the doc of load_font_files.
+            use_cache: If True, the fonts of each directory are cached like the system fonts, so only the new or modified fonts are loaded.
+                Each directory has its own cache file. See get_additional_font_cache_file_path.
+                The single font files are never cached.
+            skip_unmodified_directories: If True, the cached fonts of the directories that haven't been modified since the last load
+                are considered up to date without being stat. It avoids a stat per font, but a font overwritten in place isn't detected.
+                See DirectoryScanner. It is only used with use_cache.
         Returns:
-            A list of FontFile objects representing the loaded fonts.
+            A list of FontFile objects representing the loaded fonts. They are in the same order as additional_fonts_path.
         """
-        def is_file_font(file_name: Path) -> bool:
-            return file_name.suffix.lstrip(".").strip().lower() in ["ttf", "otf", "ttc", "otc"]
-
         additional_fonts: list[FontFile] = []
+        # The font files that aren't in a cached directory and that haven't been loaded yet
+        fonts_path: list[Path] = []
 
         for font_path in additional_fonts_path:
             if font_path.is_file():
-                try:
-                    additional_fonts.append(FontFile.from_font_path(font_path))
-                except InvalidFontException as e:
-                    _logger.info(f"{e}. The font {font_path} will be ignored.")
+                fonts_path.append(font_path)
             elif font_path.is_dir():
-                if scan_subdirs:
-                    for root, dirs, files in os.walk(font_path):
-                        for name in files:
-                            file_path = Path(os.path.join(root, name))
-                            if is_file_font(file_path):
-                                try:
-                                    additional_fonts.append(FontFile.from_font_path(file_path))
-                                except InvalidFontException as e:
-                                    _logger.info(f"{e}. The font {file_path} will be ignored.")
+                if use_cache:
+                    # The previous font files are loaded first, so the fonts stay in the same order as additional_fonts_path
+                    additional_fonts.extend(FontLoader.load_font_files(fonts_path, max_workers))
+                    fonts_path = []
+
+                    with FontCache(FontLoader.get_additional_font_cache_file_path(font_path, scan_subdirs)) as font_cache:
+                        directory_fonts_path, scanned_directories, modified_directories = DirectoryScanner.scan(
+                            font_path, scan_subdirs, FontLoader.__is_file_font, font_cache.get_directories()
+                        )
+                        additional_fonts.extend(
+                            FontLoader.__load_font_files_with_cache(
+                                font_cache,
+                                directory_fonts_path,
+                                max_workers,
+                                set(scanned_directories).difference(modified_directories) if skip_unmodified_directories else set()
+                            )
+                        )
+                        font_cache.set_directories(scanned_directories)
                 else:
-                    for path in font_path.iterdir():
-                        if path.is_file() and is_file_font(path):
-                            try:
-                                additional_fonts.append(FontFile.from_font_path(path))
-                            except InvalidFontException as e:
-                                _logger.info(f"{e}. The font {path} will be ignored.")
+                    fonts_path.extend(FontLoader.get_additional_fonts_path([font_path], scan_subdirs))
             else:
                 raise FileNotFoundError(f"The file or directory {font_path} is not reachable")
+
+        additional_fonts.extend(FontLoader.load_font_files(fonts_path, max_workers))
         return additional_fonts
 
 
     @staticmethod
-    def load_system_fonts() -> list[FontFile]:
+    def get_additional_fonts_path(additional_fonts_path: Iterable[Path], scan_subdirs: bool = False) -> list[Path]:
+        """
+        Args:
+            additional_fonts_path: See the doc of load_additional_fonts.
+            scan_subdirs: See the doc of load_additional_fonts.
+        Returns:
+            The path of the font files that load_additional_fonts would load, without loading them.
+        """
+        fonts_path: list[Path] = []
+        for font_path in additional_fonts_path:
+            if font_path.is_file():
+                fonts_path.append(font_path)
+            elif font_path.is_dir():
+                directory_fonts_path, _, _ = DirectoryScanner.scan(font_path, scan_subdirs, FontLoader.__is_file_font, {})
+                fonts_path.extend(directory_fonts_path)
+            else:
+                raise FileNotFoundError(f"The file or directory {font_path} is not reachable")
+        return fonts_path
+
+
+    @staticmethod
+    def filter_fonts_path_by_names(fonts_path: Iterable[Path], font_names: Iterable[str], strategy: FontSelectionStrategy) -> list[Path]:
+        """Find the fonts that may contain a font face that matches one of the font names, by only reading their name table.
+
+        The filter is conservative: a font is only excluded when it is certain that none of its faces can match.
+        So, the variable fonts, the fonts that need to be decoded with fontTools and the fonts that can't be read are always kept.
+
+        Args:
+            fonts_path: The font file paths.
+            font_names: The font names to match. They can come from AssStyle.
+            strategy: The strategy used to match the font names. See FontSelectionStrategy.get_name_key.
+        Returns:
+            The font file paths that may contain one of the font names, in the same order as fonts_path.
+            If the strategy doesn't support name keys, all the font file paths are returned.
+        """
+        name_keys = set()
+        for font_name in font_names:
+            key = strategy.get_name_key(font_name)
+            if key is None:
+                return list(fonts_path)
+            name_keys.add(key)
+
+        return [font_path for font_path in fonts_path if FontLoader.__may_contain_font_names(font_path, name_keys, strategy)]
+
+
+    @staticmethod
+    def __may_contain_font_names(font_path: Path, name_keys: set[Hashable], strategy: FontSelectionStrategy) -> bool:
         """
+        Args:
+            font_path: Font path.
+            name_keys: The name keys to match.
+            strategy: The strategy used to compute the name keys.
+        Returns:
+            False if it is certain that no face of the font has a family name or an exact name with one of the name keys, otherwise True.
+        """
+        try:
+            with open(font_path, "rb") as file:
+                fonts_offset = SfntMetadata.get_fonts_offset(file)
+                if fonts_offset is None:
+                    return True
+
+                offsets, _ = fonts_offset
+                for offset in offsets:
+                    font = SfntMetadata.from_file(file, offset)
+                    if font is None:
+                        return True
+
+                    # The family names and the exact names always come from one of these names (see FactoryABCFontFace)
+                    for name_record in font["name"].names:
+                        if name_record.nameID not in (NameID.FAMILY_NAME, NameID.FULL_NAME, NameID.POSTSCRIPT_NAME):
+                            continue
+                        try:
+                            name = Name.get_decoded_name_record(name_record)
+                        except InvalidNameRecord:
+                            # The faces never contain these names
+                            continue
+                        if strategy.get_name_key(name) in name_keys:
+                            return True
+        except Exception:
+            # The font will be loaded, so the reason why it can't be read will be reported
+            return True
+        return False
+
+
+    @staticmethod
+    def __is_file_font(file_name: str) -> bool:
+        return Path(file_name).suffix.lstrip(".").strip().lower() in ["ttf", "otf", "ttc", "otc"]
+
+
+    @staticmethod
+    def load_system_fonts(max_workers: int | None = 1, skip_unmodified_directories: bool = False) -> list[FontFile]:
+        """
+        Args:
+            max_workers: The number of worker processes used to load the fonts that aren't in the cache. See the doc of load_font_files.
+            skip_unmodified_directories: If True, the cached fonts of the directories that haven't been modified since the last load
+                are considered up to date without being stat. It avoids a stat per font, but a font overwritten in place isn't detected.
+                See DirectoryScanner.
         Returns:
             A list of FontFile objects representing the system fonts.
         """
-        system_fonts: list[FontFile] = []
-        fonts_paths: set[Path] = {Path(font_path) for font_path in get_system_fonts_filename()}
-        system_font_cache_file = FontLoader.get_system_font_cache_file_path()
+        fonts_path = sorted({Path(font_path) for font_path in get_system_fonts_filename()})
+
+        with FontCache(FontLoader.get_system_font_cache_file_path()) as font_cache:
+            scanned_directories, modified_directories = DirectoryScanner.scan_font_files(fonts_path, font_cache.get_directories())
+            system_fonts = FontLoader.__load_font_files_with_cache(
+                font_cache, fonts_path, max_workers, set(scanned_directories).difference(modified_directories) if skip_unmodified_directories else set()
+            )
+            font_cache.set_directories(scanned_directories)
+        return system_fonts
 
-        if system_font_cache_file.is_file():
-            cached_fonts = FontLoader.load_font_cache_file(system_font_cache_file)
-            cached_paths = set(map(lambda item: item.filename, cached_fonts))
 
-            # Remove font that aren't anymore installed
-            removed_path = cached_paths.difference(fonts_paths)
-            system_fonts = list(filter(lambda item: item.filename not in removed_path, cached_fonts))
+    @staticmethod
+    def update_system_font_cache(max_workers: int | None = 1, skip_unmodified_directories: bool = False) -> Path:
+        """Synchronize the system font cache with the installed fonts, like load_system_fonts, but without decoding the cached fonts.
 
-            # Update font that have been updated since last execution
-            has_updated_font = False
-            for cached_font in system_fonts:
-                if cached_font.filename.stat().st_ctime > cached_font.last_loaded_time:
-                    cached_font.reload_font_file()
-                    has_updated_font = True
+        Only the fonts that aren't in the cache, or that have been modified since they have been cached, are loaded.
+        The fonts can then be retrieved when they are needed with FontCache.get_font_names and FontCache.get_font_files_by_filenames.
+        Note: The fonts that are corrupted in the cache are only detected when they are retrieved. They will be loaded again by the next synchronization.
 
-            # Add font that have been installed since last execution
-            added_path = fonts_paths.difference(cached_paths)
-            for font_path in added_path:
-                try:
-                    system_fonts.append(FontFile.from_font_path(font_path))
-                except InvalidFontException as e:
-                    _logger.info(f"{e}. The font {font_path} will be ignored.")
+        Args:
+            max_workers: See the doc of load_font_files.
+            skip_unmodified_directories: See the doc of load_system_fonts.
+        Returns:
+            The path to the system font cache file.
+        """
+        fonts_path = sorted({Path(font_path) for font_path in get_system_fonts_filename()})
+        cache_file = FontLoader.get_system_font_cache_file_path()
 
-            # If there is a change, update the cache file
-            if len(added_path) > 0 or len(removed_path) > 0 or has_updated_font:
-                FontLoader.save_font_cache_file(system_font_cache_file, system_fonts)
+        with FontCache(cache_file) as font_cache:
+            scanned_directories, modified_directories = DirectoryScanner.scan_font_files(fonts_path, font_cache.get_directories())
+            unmodified_directories = set(scanned_directories).difference(modified_directories) if skip_unmodified_directories else set()
+            fonts_path_set = set(fonts_path)
 
-        else:
-            # Since there is no cache file, load the font
-            for font_path in fonts_paths:
+            last_loaded_times = font_cache.get_last_loaded_times()
+            invalid_paths = set(font_cache.get_invalid_fonts())
+            font_cache.remove_font_files(set(last_loaded_times).union(invalid_paths).difference(fonts_path_set))
+
+            # The fonts that have been updated since last execution are loaded again, like the fonts installed since last execution
+            fonts_path_to_load = fonts_path_set.difference(last_loaded_times, invalid_paths)
+            for font_path, last_loaded_time in last_loaded_times.items():
+                if font_path in fonts_path_set and font_path.parent not in unmodified_directories and font_path.stat().st_ctime > last_loaded_time:
+                    fonts_path_to_load.add(font_path)
+
+            loaded_fonts, invalid_fonts = FontLoader.__load_font_files(sorted(fonts_path_to_load), max_workers)
+            font_cache.add_font_files(loaded_fonts)
+            font_cache.add_invalid_fonts(invalid_fonts)
+            font_cache.set_directories(scanned_directories)
+        return cache_file
+
+
+    @staticmethod
+    def __load_font_files_with_cache(
+        font_cache: FontCache,
+        fonts_path: list[Path],
+        max_workers: int | None,
+        unmodified_directories: set[Path]
+    ) -> list[FontFile]:
+        """Load the font files at the specified paths and synchronize the cache with them.
+
+        Only the fonts that aren't in the cache, or that have been modified since they have been cached, are loaded.
+        The fonts in the cache that aren't in fonts_path are removed from it.
+
+        Args:
+            font_cache: The cache of the fonts.
+            fonts_path: The font file paths. They must exist.
+            max_workers: See the doc of load_font_files.
+            unmodified_directories: The directories whose cached fonts are considered up to date without being stat.
+                It should only contain directories that haven't been modified since the last time the cache has been synchronized,
+                and only if the caller accepts to miss the fonts overwritten in place. See DirectoryScanner.
+        Returns:
+            A list of FontFile objects representing the loaded fonts. They are in the same order as fonts_path.
+        """
+        fonts_path_set = set(fonts_path)
+
+        # The fonts that are corrupted in the cache aren't in cached_fonts, so they will be loaded again like the new fonts
+        # fonts_path only contains existing files, so the deleted fonts are in removed_path
+        cached_fonts, _ = font_cache.get_font_files(False)
+        cached_paths = set(map(lambda item: item.filename, cached_fonts))
+        # The invalid fonts that have changed since last execution aren't in invalid_paths, so they will be loaded again like the new fonts
+        invalid_paths = set(font_cache.get_invalid_fonts())
+
+        # Remove font that aren't anymore installed
+        removed_path = cached_paths.union(invalid_paths).difference(fonts_path_set)
+        font_cache.remove_font_files(removed_path)
+
+        # Update font that have been updated since last execution
+        font_files: dict[Path, FontFile] = {}
+        updated_fonts: list[FontFile] = []
+        invalid_fonts: dict[Path, str] = {}
+        for cached_font in cached_fonts:
+            if cached_font.filename in removed_path:
+                continue
+            if cached_font.filename.parent not in unmodified_directories and cached_font.filename.stat().st_ctime > cached_font.last_loaded_time:
                 try:
-                    system_fonts.append(FontFile.from_font_path(font_path))
+                    cached_font.reload_font_file()
                 except InvalidFontException as e:
-                    _logger.info(f"{e}. The font {font_path} will be ignored.")
+                    _logger.info(f"{e}. The font {cached_font.filename} will be ignored.")
+                    invalid_fonts[cached_font.filename] = str(e)
+                    continue
+                updated_fonts.append(cached_font)
+            font_files[cached_font.filename] = cached_font
 
-            # Save the font into the cache file
-            FontLoader.save_font_cache_file(system_font_cache_file, system_fonts)
+        # Add font that have been installed since last execution. The fonts known to be invalid are skipped
+        added_fonts, added_invalid_fonts = FontLoader.__load_font_files(sorted(fonts_path_set.difference(cached_paths, invalid_paths)), max_workers)
+        for added_font in added_fonts:
+            font_files[added_font.filename] = added_font
+        invalid_fonts.update(added_invalid_fonts)
 
-        return system_fonts
+        font_cache.add_font_files(updated_fonts + added_fonts)
+        font_cache.add_invalid_fonts(invalid_fonts)
+
+        return [font_files[font_path] for font_path in fonts_path if font_path in font_files]
+
+
+    @staticmethod
+    def get_invalid_system_fonts() -> dict[Path, str]:
+        """
+        Returns:
+            The system fonts ignored by load_system_fonts because they are invalid, with the reason why they are invalid.
+            They won't be parsed again until their size or modification time change.
+        """
+        system_font_cache_file = FontLoader.get_system_font_cache_file_path()
+        if not system_font_cache_file.is_file():
+            return {}
+
+        with FontCache(system_font_cache_file) as font_cache:
+            return font_cache.get_invalid_fonts()
 
 
     @staticmethod
     def load_generated_fonts() -> list[FontFile]:
         """
+        The generated fonts are kept in memory. While the cache file doesn't change, they are returned without reading it again.
+        Warning: It means that a generated font modified or deleted without using FontLoader isn't detected until the cache file changes.
+
         Returns:
             A list of FontFile objects representing the generated fonts.
             These fonts are created when the user converts a variable font to a normal font
                 via the VariableFontFace.variable_font_to_collection() method.
         """
-        generated_fonts: list[FontFile] = []
         generated_font_cache_file = FontLoader.get_generated_font_cache_file_path()
+        cache_file_signature = FontLoader.__get_file_signature(generated_font_cache_file)
 
-        if generated_font_cache_file.is_file():
-            cached_fonts = FontLoader.load_font_cache_file(generated_font_cache_file)
-            generated_fonts = list(filter(lambda cached_font: cached_font.filename.is_file(), cached_fonts))
-            has_deleted_font = len(cached_fonts) != len(generated_fonts)
+        if cache_file_signature is None:
+            FontLoader.__generated_fonts_registry = None
+            return []
+
+        registry = FontLoader.__generated_fonts_registry
+        if registry is not None and registry[:2] == (generated_font_cache_file, cache_file_signature):
+            return list(registry[2])
+
+        with FontCache(generated_font_cache_file) as font_cache:
+            # The fonts that have been deleted are removed from the cache by get_font_files
+            generated_fonts, corrupted_paths = font_cache.get_font_files()
 
-            has_updated_font = False
             # Update font that have been updated since last execution
+            updated_fonts: list[FontFile] = []
             for cached_font in generated_fonts:
                 if cached_font.filename.stat().st_ctime > cached_font.last_loaded_time:
                     cached_font.reload_font_file()
-                    has_updated_font = True
+                    updated_fonts.append(cached_font)
+
+            # Since there is no other way to find the generated fonts, load again the one that were corrupted in the cache
+            reloaded_fonts = FontLoader.load_font_files(filter(lambda path: path.is_file(), corrupted_paths))
+            generated_fonts.extend(reloaded_fonts)
+
+            font_cache.add_font_files(updated_fonts + reloaded_fonts)
 
-            if has_deleted_font > 0 or has_updated_font:
-                FontLoader.save_font_cache_file(generated_font_cache_file, generated_fonts)
+        FontLoader.__update_generated_fonts_registry(generated_font_cache_file, generated_fonts)
+        return list(generated_fonts)
 
-        return generated_fonts
+
+    @staticmethod
+    def get_generated_fonts_version() -> Hashable:
+        """
+        Returns:
+            A key that changes each time the generated font cache file is modified or replaced, even by another process.
+            It only reads the header of the cache file, so it is a cheap way to know if load_generated_fonts would return other fonts.
+        """
+        generated_font_cache_file = FontLoader.get_generated_font_cache_file_path()
+        return generated_font_cache_file, FontLoader.__get_file_signature(generated_font_cache_file)
 
 
     @staticmethod
@@ -221,9 +524,52 @@ class FontLoader:
             font: The generated font obtained from VariableFontFace.variable_font_to_collection().
                 This font will be cached and subsequently loaded when FontLoader.load_generated_fonts() is called.
         """
-        generated_fonts = FontLoader.load_generated_fonts()
-        generated_fonts.append(font)
-        FontLoader.save_font_cache_file(FontLoader.get_generated_font_cache_file_path(), generated_fonts)
+        generated_font_cache_file = FontLoader.get_generated_font_cache_file_path()
+
+        # If the registry is up to date, update it instead of reading the whole cache file at the next load_generated_fonts
+        registry = FontLoader.__generated_fonts_registry
+        is_registry_up_to_date = registry is not None and registry[:2] == (generated_font_cache_file, FontLoader.__get_file_signature(generated_font_cache_file))
+
+        with FontCache(generated_font_cache_file) as font_cache:
+            font_cache.add_font_files([font])
+
+        if registry is not None and is_registry_up_to_date:
+            generated_fonts = [generated_font for generated_font in registry[2] if generated_font.filename != font.filename]
+            generated_fonts.append(font)
+            FontLoader.__update_generated_fonts_registry(generated_font_cache_file, generated_fonts)
+        else:
+            FontLoader.__generated_fonts_registry = None
+
+
+    @staticmethod
+    def __update_generated_fonts_registry(generated_font_cache_file: Path, generated_fonts: list[FontFile]) -> None:
+        cache_file_signature = FontLoader.__get_file_signature(generated_font_cache_file)
+        if cache_file_signature is None:
+            FontLoader.__generated_fonts_registry = None
+        else:
+            FontLoader.__generated_fonts_registry = (generated_font_cache_file, cache_file_signature, generated_fonts)
+
+
+    @staticmethod
+    def __get_file_signature(file: Path) -> tuple[int, int] | None:
+        """
+        Args:
+            file: A SQLite database file path.
+        Returns:
+            The inode of the file and the file change counter stored in its SQLite header (at the offset 24).
+            SQLite increments the change counter at every transaction that modifies the database (the cache doesn't use the WAL mode),
+                so, unlike the size or the modification time, it detects every write, even when they happen in the same clock tick.
+            If the file doesn't exist, it returns None.
+        """
+        try:
+            with open(file, "rb") as f:
+                inode = os.fstat(f.fileno()).st_ino
+                f.seek(24)
+                change_counter = f.read(4)
+        except OSError:
+            return None
+        # An empty file is a new database that hasn't been written yet
+        return inode, int.from_bytes(change_counter, "big") if len(change_counter) == 4 else -1
 
 
     @staticmethod
@@ -241,11 +587,26 @@ class FontLoader:
         """
         Discards the generated font cache if it exists.
         """
+        FontLoader.__generated_fonts_registry = None
         generated_font_cache = FontLoader.get_generated_font_cache_file_path()
         if generated_font_cache.is_file():
             generated_font_cache.unlink()
 
 
+    @staticmethod
+    def discard_additional_font_cache(font_directory: Path, scan_subdirs: bool) -> None:
+        """
+        Discards the font cache of an additional font directory if it exists.
+
+        Args:
+            font_directory: A directory passed to load_additional_fonts.
+            scan_subdirs: The scan_subdirs passed to load_additional_fonts.
+        """
+        additional_font_cache = FontLoader.get_additional_font_cache_file_path(font_directory, scan_subdirs)
+        if additional_font_cache.is_file():
+            additional_font_cache.unlink()
+
+
     @staticmethod
     def get_system_font_cache_file_path() -> Path:
         """
@@ -254,7 +615,23 @@ class FontLoader:
             Warning, the file may not exist.
         """
         tempDir = gettempdir()
-        return Path(os.path.join(tempDir, "FontCollector_SystemFont.bin"))
+        return Path(os.path.join(tempDir, "FontCollector_SystemFont.db"))
+
+
+    @staticmethod
+    def get_additional_font_cache_file_path(font_directory: Path, scan_subdirs: bool) -> Path:
+        """
+        Args:
+            font_directory: A directory passed to load_additional_fonts.
+            scan_subdirs: The scan_subdirs passed to load_additional_fonts.
+        Returns:
+            The path to the font cache file of this directory.
+            Warning, the file may not exist.
+        """
+        directory_key = f"{font_directory.resolve()}|{scan_subdirs}"
+        directory_hash = hashlib.sha1(directory_key.encode("utf-8")).hexdigest()
+        tempDir = gettempdir()
+        return Path(os.path.join(tempDir, f"FontCollector_AdditionalFont_{directory_hash}.db"))
 
 
     @staticmethod
@@ -265,4 +642,4 @@ class FontLoader:
             Warning, the file may not exist.
         """
         tempDir = gettempdir()
-        return Path(os.path.join(tempDir, "FontCollector_GeneratedFont.bin"))
+        return Path(os.path.join(tempDir, "FontCollector_GeneratedFont.db"))
@@ -1,24 +1,47 @@
 from __future__ import annotations
 
 from ctypes import byref, c_uint, create_string_buffer
+from collections.abc import Iterable
 from itertools import product
 from pathlib import Path
 from struct import error as struct_error
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from fontTools.ttLib.tables._c_m_a_p import CmapSubtable
 from fontTools.ttLib.tables._n_a_m_e import NameRecord
 from fontTools.ttLib.ttFont import TTFont
 from fontTools.varLib.instancer.names import ELIDABLE_AXIS_VALUE_NAME
-from freetype import Face, FT_Face, FT_Get_Glyph_Name
+from freetype import FT_Face, FT_Get_Glyph_Name
 from freetype.ft_enums.ft_style_flags import FT_STYLE_FLAGS
 from langcodes import Language
 
 from ..exceptions import InvalidNameRecord, InvalidVariableFontFaceException
 from .cmap import CMap
+from .freetype_manager import FreeTypeManager
 from .name import Name, NameID, PlatformID
 
 
+class _NameIndex:
+    """The name records of a font indexed by (platformID, nameID). The names are only decoded the first time they are requested.
+
+    Attributes:
+        names_record: The indexed name records. If the name table has been modified since, the index must be rebuilt.
+        names_record_count: The number of indexed name records.
+        names_record_by_id: The name records by (platformID, nameID), in the order of the name table.
+        names_by_id: The decoded names by (platformID, nameID).
+    """
+
+    def __init__(self, names_record: list[NameRecord]) -> None:
+        self.names_record = names_record
+        self.names_record_count = len(names_record)
+        self.names_record_by_id: dict[tuple[int, int], list[NameRecord]] = {}
+        self.names_by_id: dict[tuple[int, int], list[Name]] = {}
+
+        for name_record in names_record:
+            self.names_record_by_id.setdefault((name_record.platformID, name_record.nameID), []).append(name_record)
+
+
 class FontParser:
     """
     A utility class providing static methods for proper font parsing.
@@ -26,6 +49,8 @@ class FontParser:
 
     DEFAULT_WEIGHT = 400
     DEFAULT_ITALIC = False
+    # The index of the name table of each font. See get_font_names.
+    __names_index: WeakKeyDictionary[TTFont, _NameIndex] = WeakKeyDictionary()
     CMAP_ENCODING_MAP: dict[PlatformID, dict[int, str]] = {
         PlatformID.MACINTOSH: {
             0: "mac_roman",
@@ -249,7 +274,7 @@ class FontParser:
 
         for i, axis_value in enumerate(axis_values):
 
-            axis_value_name = FontParser.get_filtered_names(font["name"].names, platformID=PlatformID.MICROSOFT, nameID=axis_value.ValueNameID)
+            axis_value_name = FontParser.get_font_names(font, PlatformID.MICROSOFT, axis_value.ValueNameID)
             if not axis_value_name:
                 raise InvalidVariableFontFaceException("An axis value has an invalid ValueNameID")
             axis_values_names.append(axis_value_name)
@@ -305,7 +330,7 @@ class FontParser:
         if all(not element for element in fullname_axis_value_index):
             # Fallback if all the element have the flag ELIDABLE_AXIS_VALUE_NAME
             if hasattr(font['STAT'].table, "ElidedFallbackNameID"):
-                elided_fallback_name = FontParser.get_filtered_names(font['name'].names, platformID=PlatformID.MICROSOFT, nameID=font['STAT'].table.ElidedFallbackNameID)
+                elided_fallback_name = FontParser.get_font_names(font, PlatformID.MICROSOFT, font['STAT'].table.ElidedFallbackNameID)
 
                 if elided_fallback_name:
                     fullname = elided_fallback_name
@@ -365,6 +390,33 @@ class FontParser:
         return names
 
 
+    @staticmethod
+    def get_font_names(font: TTFont, platformID: PlatformID, nameID: int) -> list[Name]:
+        """Same as get_filtered_names(font["name"].names, platformID=platformID, nameID=nameID),
+        but the name table is only indexed once per font and each name is only decoded once.
+
+        Args:
+            font: A fontTools object (or a SfntMetadata) representing the font.
+            platformID: Filter the names by platformID.
+            nameID: Filter the names by nameID.
+        Returns:
+            A list of the decoded names that have been filtered.
+        """
+        names_record: list[NameRecord] = font["name"].names
+        names_index = FontParser.__names_index.get(font)
+        if names_index is None or names_index.names_record is not names_record or names_index.names_record_count != len(names_record):
+            names_index = _NameIndex(names_record)
+            FontParser.__names_index[font] = names_index
+
+        key = (platformID, nameID)
+        names = names_index.names_by_id.get(key)
+        if names is None:
+            names = FontParser.get_filtered_names(names_index.names_record_by_id.get(key, []))
+            names_index.names_by_id[key] = names
+        # Return a copy, so the caller can modify it
+        return list(names)
+
+
     @staticmethod
     def get_font_italic_bold_property_with_freetype(
         font_path: Path, font_index: int
@@ -376,10 +428,10 @@ class FontParser:
         Returns:
             is_italic, is_glyphs_emboldened, weight
         """
-        with font_path.open("rb") as f:
-            face = Face(f, font_index)
-        is_italic = bool(face.style_flags & FT_STYLE_FLAGS["FT_STYLE_FLAG_ITALIC"])
-        is_glyphs_emboldened = bool(face.style_flags & FT_STYLE_FLAGS["FT_STYLE_FLAG_BOLD"])
+        with FreeTypeManager.open_face(font_path, font_index) as face:
+            style_flags = face.contents.style_flags
+        is_italic = bool(style_flags & FT_STYLE_FLAGS["FT_STYLE_FLAG_ITALIC"])
+        is_glyphs_emboldened = bool(style_flags & FT_STYLE_FLAGS["FT_STYLE_FLAG_BOLD"])
         weight = 700 if is_glyphs_emboldened else 400
 
         return is_italic, is_glyphs_emboldened, weight
@@ -477,18 +529,30 @@ class FontParser:
         font_glyph_names: set[str] = set()
         # This is a limit set by adobe: http://adobe-type-tools.github.io/afdko/OpenTypeFeatureFileSpecification.html#2fi-glyph-name
         buffer_max = 64
+        buffer = create_string_buffer(buffer_max)
         for i in range(face.contents.num_glyphs):
-            buffer = create_string_buffer(buffer_max)
             error = FT_Get_Glyph_Name(face, c_uint(i), byref(buffer), c_uint(buffer_max))
 
             if error:
                 continue
             font_glyph_names.add(buffer.value.decode("ascii").lower())
 
+        return FontParser.get_symbol_cmap_encoding_from_glyph_names(font_glyph_names)
+
+
+    @staticmethod
+    def get_symbol_cmap_encoding_from_glyph_names(glyph_names: Iterable[str]) -> str | None:
+        """
+        Args:
+            glyph_names: The lowercase glyph names of the font.
+        Returns:
+            The cmap ansi code page encoding. See get_symbol_cmap_encoding.
+        """
+        font_glyph_names = set(glyph_names)
+
         count_codepage: dict[str, int] = {}
-        for code_page, glyph_names in UNIQUE_ADOBE_GLYPH_NAME_BY_CODE_PAGE.items():
-            count = sum(1 for font_glyph_name in font_glyph_names if font_glyph_name in glyph_names)
-            count_codepage[code_page] = count
+        for code_page, code_page_glyph_names in UNIQUE_ADOBE_GLYPH_NAME_BY_CODE_PAGE.items():
+            count_codepage[code_page] = len(font_glyph_names.intersection(code_page_glyph_names))
 
         if len(count_codepage) == 0:
             return None
@@ -498,6 +562,26 @@ class FontParser:
         return codepage_encoding
 
 
+    @staticmethod
+    def get_glyph_names_from_post_table(font: TTFont) -> list[str] | None:
+        """
+        Args:
+            font: A fontTools object representing the font.
+        Returns:
+            The lowercase glyph names of the font, like FreeType would return them with FT_Get_Glyph_Name.
+            If the names aren't stored in a post table of format 1 or 2, it returns None.
+        """
+        # FreeType reads the names of CFF fonts from the CFF charset, not from the post table
+        if "post" not in font or "CFF " in font or "CFF2" in font:
+            return None
+
+        post = font["post"]
+        if post.formatType not in (1.0, 2.0):
+            return None
+
+        return [glyph_name.lower() for glyph_name in post.glyphOrder[:font["maxp"].numGlyphs]]
+
+
     @staticmethod
     def get_supported_cmaps(
         font: TTFont, font_path: Path, font_index: int
@@ -530,17 +614,16 @@ class FontParser:
                     elif table.platformID == PlatformID.MACINTOSH:
                         macintosh_cmaps.append(cmap)
         except Exception:
-            with font_path.open("rb") as f:
-                face = Face(f, font_index)
-
-            for charmap in face.charmaps:
-                encoding = FontParser.get_cmap_encoding(charmap.platform_id, charmap.encoding_id)
-                if encoding is not None:
-                    cmap = CMap(charmap.platform_id, charmap.encoding_id)
-                    if charmap.platform_id == PlatformID.MICROSOFT:
-                        microsoft_cmaps.append(cmap)
-                    elif charmap.platform_id == PlatformID.MACINTOSH:
-                        macintosh_cmaps.append(cmap)
+            with FreeTypeManager.open_face(font_path, font_index) as face:
+                charmaps = [face.contents.charmaps[i].contents for i in range(face.contents.num_charmaps)]
+                for charmap in charmaps:
+                    encoding = FontParser.get_cmap_encoding(charmap.platform_id, charmap.encoding_id)
+                    if encoding is not None:
+                        cmap = CMap(charmap.platform_id, charmap.encoding_id)
+                        if charmap.platform_id == PlatformID.MICROSOFT:
+                            microsoft_cmaps.append(cmap)
+                        elif charmap.platform_id == PlatformID.MACINTOSH:
+                            macintosh_cmaps.append(cmap)
         return macintosh_cmaps if len(microsoft_cmaps) == 0 else microsoft_cmaps
 
 
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from ctypes import byref
+from pathlib import Path
+
+from freetype import (
+    FT_Done_Face,
+    FT_Done_FreeType,
+    FT_Exception,
+    FT_Face,
+    FT_Init_FreeType,
+    FT_Library,
+    FT_New_Memory_Face
+)
+
+from .mapped_font_file import MappedFontFile
+
+
+class _FreeTypeResources:
+    """The FreeType library and the open faces of a thread.
+
+    A FreeType library (and its faces) must not be used by multiple threads at the same time,
+    so each thread has its own resources. They are released when the thread ends.
+
+    Attributes:
+        library: The FreeType library.
+        faces: The open faces, from the least recently used to the most recently used.
+            The key is (font_path, font_index, mtime_ns) and the value is the face with the mapped font file it is reading.
+        faces_in_use: The number of times each face is currently opened with FreeTypeManager.open_face.
+        session_depth: The number of nested FreeTypeManager.session currently active.
+    """
+
+    def __init__(self) -> None:
+        self.library = FT_Library()
+        error = FT_Init_FreeType(byref(self.library))
+        if error: raise FT_Exception(error)
+
+        self.faces: OrderedDict[tuple[Path, int, int], tuple[FT_Face, MappedFontFile]] = OrderedDict()
+        self.faces_in_use: dict[tuple[Path, int, int], int] = {}
+        self.session_depth = 0
+
+
+    def __del__(self) -> None:
+        # We check FT_Done_Face because by the time we're called, the module may already be gone (like freetype.Face.__del__)
+        if FT_Done_Face is None or FT_Done_FreeType is None:
+            return
+        for face, font_data in self.faces.values():
+            FT_Done_Face(face)
+            font_data.close()
+        self.faces.clear()
+        FT_Done_FreeType(self.library)
+
+
+class FreeTypeManager:
+    """
+    This class is a collection of static methods that share the FreeType resources of the process.
+
+    Initializing a FreeType library and opening a face is costly compared to most operations done with them,
+    so each thread keeps one library and, during a session, a bounded LRU of open faces.
+    A face is released when it is evicted from the LRU or when the outermost session ends. It is reopened if the font file is modified.
+    Outside of a session, a face is released as soon as it isn't used anymore.
+    Each open face keeps its font file mapped (and so open), which prevents it from being deleted on Windows.
+    That's why the faces are never kept longer than a session.
+
+    Warning: Since the faces are shared, don't expect a face to have a specific charmap selected. Always select it before using it.
+    """
+
+    # The maximum number of open faces per thread. The faces currently opened with open_face are never evicted.
+    MAX_FACES = 32
+
+    __thread_resources = threading.local()
+
+    @staticmethod
+    def get_library() -> FT_Library:
+        """
+        Returns:
+            The FreeType library of the current thread.
+        """
+        return FreeTypeManager.__get_resources().library
+
+
+    @staticmethod
+    @contextmanager
+    def session() -> Iterator[None]:
+        """Keep the faces opened with open_face until the end of the with statement, so an operation that opens the same face many times only reads it once.
+        The sessions can be nested. The faces are released when the outermost session ends.
+        """
+        resources = FreeTypeManager.__get_resources()
+        resources.session_depth += 1
+        try:
+            yield
+        finally:
+            resources.session_depth -= 1
+            if resources.session_depth == 0:
+                FreeTypeManager.clear()
+
+
+    @staticmethod
+    @contextmanager
+    def open_face(font_path: Path, font_index: int) -> Iterator[FT_Face]:
+        """Open a face from the LRU of the current thread. If it isn't in the LRU, it is read from the font file.
+        Outside of a session, the face is released at the end of the with statement.
+
+        Args:
+            font_path: Font path.
+            font_index: Font index.
+        Returns:
+            The face. It must not be used outside the with statement.
+        """
+        resources = FreeTypeManager.__get_resources()
+        key = (font_path, font_index, os.stat(font_path).st_mtime_ns)
+
+        if key in resources.faces:
+            resources.faces.move_to_end(key)
+        else:
+            # We cannot use FT_New_Face due to this issue: https://github.com/rougier/freetype-py/issues/157
+            font_data = MappedFontFile(font_path)
+            try:
+                face = FreeTypeManager.__new_memory_face(resources.library, font_data, font_index)
+            except Exception:
+                font_data.close()
+                raise
+            resources.faces[key] = (face, font_data)
+
+        resources.faces_in_use[key] = resources.faces_in_use.get(key, 0) + 1
+        try:
+            FreeTypeManager.__evict_faces(resources)
+            yield resources.faces[key][0]
+        finally:
+            resources.faces_in_use[key] -= 1
+            if resources.faces_in_use[key] == 0:
+                del resources.faces_in_use[key]
+            if resources.session_depth == 0:
+                FreeTypeManager.clear()
+
+
+    @staticmethod
+    @contextmanager
+    def open_memory_face(font_data: MappedFontFile, font_index: int) -> Iterator[FT_Face]:
+        """Open a face that isn't kept in the LRU. It is useful when the font is only read once (ex: when it is loaded).
+
+        Args:
+            font_data: The mapped font file. It must stay open until the end of the with statement.
+            font_index: Font index.
+        Returns:
+            The face. It is released at the end of the with statement.
+        """
+        face = FreeTypeManager.__new_memory_face(FreeTypeManager.get_library(), font_data, font_index)
+        try:
+            yield face
+        finally:
+            FT_Done_Face(face)
+
+
+    @staticmethod
+    def clear() -> None:
+        """Release the faces of the current thread that aren't currently used."""
+        resources = FreeTypeManager.__get_resources()
+        for key in [key for key in resources.faces if key not in resources.faces_in_use]:
+            face, font_data = resources.faces.pop(key)
+            FT_Done_Face(face)
+            font_data.close()
+
+
+    @staticmethod
+    def get_open_faces_count() -> int:
+        """
+        Returns:
+            The number of open faces in the LRU of the current thread.
+        """
+        return len(FreeTypeManager.__get_resources().faces)
+
+
+    @staticmethod
+    def __get_resources() -> _FreeTypeResources:
+        resources: _FreeTypeResources | None = getattr(FreeTypeManager.__thread_resources, "resources", None)
+        if resources is None:
+            resources = _FreeTypeResources()
+            FreeTypeManager.__thread_resources.resources = resources
+        return resources
+
+
+    @staticmethod
+    def __new_memory_face(library: FT_Library, font_data: MappedFontFile, font_index: int) -> FT_Face:
+        face = FT_Face()
+        error = FT_New_Memory_Face(library, font_data.get_buffer(), len(font_data), font_index, byref(face))
+        if error: raise FT_Exception(error)
+        return face
+
+
+    @staticmethod
+    def __evict_faces(resources: _FreeTypeResources) -> None:
+        if len(resources.faces) <= FreeTypeManager.MAX_FACES:
+            return
+
+        for key in list(resources.faces):
+            if len(resources.faces) <= FreeTypeManager.MAX_FACES:
+                break
+            if key in resources.faces_in_use:
+                continue
+            face, font_data = resources.faces.pop(key)
+            FT_Done_Face(face)
+            font_data.close()
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from contextlib import ExitStack
+from ctypes import byref, c_uint, c_ulong
+from pathlib import Path
+from struct import calcsize, pack, unpack_from
+from typing import TYPE_CHECKING
+
+from fontTools.ttLib.ttFont import TTFont
+from freetype import (
+    FT_Exception,
+    FT_Face,
+    FT_Get_CMap_Format,
+    FT_Get_First_Char,
+    FT_Get_Next_Char,
+    FT_Set_Charmap
+)
+
+from .cmap import CMap
+from .font_parser import FontParser
+from .freetype_manager import FreeTypeManager
+from .mapped_font_file import MappedFontFile
+
+if TYPE_CHECKING:
+    from .sfnt_metadata import SfntMetadata
+
+
+class CMapCoverage:
+    """Represents the character codes of a cmap that are mapped to a glyph.
+
+    Attributes:
+        cmap: The cmap.
+        ranges: The mapped character codes, stored as sorted half-open ranges: [start_0, end_0, start_1, end_1, ...]
+    """
+    __slots__ = ("cmap", "ranges")
+
+    def __init__(self, cmap: CMap, ranges: array[int]) -> None:
+        self.cmap = cmap
+        self.ranges = ranges
+
+
+    def __contains__(self, char_code: int) -> bool:
+        # If the index is odd, char_code is between a start (included) and an end (excluded)
+        return bisect_right(self.ranges, char_code) % 2 == 1
+
+
+    @classmethod
+    def from_char_codes(cls: type[CMapCoverage], cmap: CMap, char_codes: Iterable[int]) -> CMapCoverage:
+        """
+        Args:
+            cmap: The cmap.
+            char_codes: The mapped character codes, in ascending order.
+        Returns:
+            The coverage of the cmap.
+        """
+        ranges: array[int] = array("L")
+        for char_code in char_codes:
+            if char_code >= 0xFFFFFFFF:
+                # The end of the range wouldn't fit in 32 bits. No text can use this character code anyway.
+                continue
+            if len(ranges) and ranges[-1] == char_code:
+                ranges[-1] = char_code + 1
+            else:
+                ranges.extend((char_code, char_code + 1))
+        return cls(cmap, ranges)
+
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CMapCoverage):
+            return False
+        return (self.cmap, self.ranges) == (other.cmap, other.ranges)
+
+
+    def __hash__(self) -> int:
+        return hash((self.cmap, self.ranges.tobytes()))
+
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(CMap="{self.cmap}", Ranges count="{len(self.ranges) // 2}")'
+
+
+class GlyphCoverage:
+    """Represents the characters supported by a font face, like GDI and Libass would see them.
+
+    It contains the coverage of each cmap supported by the font face (see FontParser.get_supported_cmaps),
+    so the missing glyphs can be found without reading the font file.
+
+    Attributes:
+        cmaps: The coverage of each supported cmap, in the same order as the FreeType charmaps.
+        symbol_cmap_encoding: If the font contains a Microsoft symbol cmap, it is its guessed code page (see FontParser.get_symbol_cmap_encoding).
+            It is None if the font doesn't contain a symbol cmap or if the guess failed.
+    """
+    __slots__ = ("cmaps", "symbol_cmap_encoding")
+
+    # The format of the serialized coverage (see to_bytes) is: version, cmap count, symbol_cmap_encoding length
+    HEADER_FORMAT = "<BHB"
+    # The format of each cmap is: platform_id, platform_enc_id, ranges count
+    CMAP_FORMAT = "<HHI"
+    SERIALIZATION_VERSION = 1
+
+    def __init__(self, cmaps: list[CMapCoverage], symbol_cmap_encoding: str | None) -> None:
+        self.cmaps = cmaps
+        self.symbol_cmap_encoding = symbol_cmap_encoding
+
+
+    def get_missing_glyphs(
+        self,
+        text: Iterable[str],
+        support_only_ascii_char_for_symbol_font: bool = False
+    ) -> set[str]:
+        """
+        See the doc of ABCFontFace.get_missing_glyphs
+        """
+        # Each charmap is checked once for all the characters it hasn't found yet
+        char_not_found = set(text)
+
+        for cmap_coverage in self.cmaps:
+            if not char_not_found:
+                break
+
+            platform_id = cmap_coverage.cmap.platform_id
+            encoding_id = cmap_coverage.cmap.platform_enc_id
+
+            cmap_encoding = FontParser.get_cmap_encoding(platform_id, encoding_id)
+
+            # cmap not supported
+            if cmap_encoding is None:
+                continue
+
+            symbol_cmap = False
+            if cmap_encoding == "unknown":
+                if platform_id == 3 and encoding_id == 0:
+                    symbol_cmap = True
+                    cmap_encoding = self.symbol_cmap_encoding
+
+                    if cmap_encoding is None:
+                        # Fallback if guess fails
+                        cmap_encoding = "cp1252"
+                else:
+                    # cmap not supported
+                    continue
+
+            char_found: set[str] = set()
+            for char in char_not_found:
+                if cmap_encoding == "unicode":
+                    codepoint = ord(char)
+                else:
+                    if symbol_cmap and support_only_ascii_char_for_symbol_font and not char.isascii():
+                        continue
+
+                    if symbol_cmap and (0xF020 <= ord(char) and ord(char) <= 0xF0FF):
+                        # If the character is already a "symbol" character (a.k.a is between 0xF020 and 0xF0FF),
+                        # GDI directly use it's codepoint.
+                        codepoint = ord(char)
+                    else:
+                        try:
+                            codepoint = int.from_bytes(char.encode(cmap_encoding), "big")
+                        except UnicodeEncodeError:
+                            continue
+
+                # GDI/Libass modify the codepoint for microsoft symbol cmap.
+                # See: https://github.com/libass/libass/blob/04a208d5d200360d2ac75f8f6cfc43dd58dd9225/libass/ass_font.c#L249-L250
+                if symbol_cmap:
+                    codepoint = 0xF000 | codepoint
+
+                if codepoint in cmap_coverage:
+                    char_found.add(char)
+
+            char_not_found -= char_found
+
+        return char_not_found
+
+
+    @classmethod
+    def from_font(
+        cls: type[GlyphCoverage],
+        font_path: Path,
+        font_index: int,
+        font: TTFont | SfntMetadata | None = None,
+        font_data: MappedFontFile | None = None,
+        supported_cmaps: list[CMap] | None = None
+    ) -> GlyphCoverage:
+        """
+        Args:
+            font_path: Font path.
+            font_index: Font index.
+            font: The fontTools object (or the SfntMetadata) of the font face. If None, it will be read from font_path.
+            font_data: The mapped font file. If None, font_path will be mapped.
+            supported_cmaps: The supported cmaps of the font face (see FontParser.get_supported_cmaps). If None, they will be read from font.
+                They must be given if font has already been used to read them, since the cmap table may be corrupted.
+        Returns:
+            The glyph coverage of the font face.
+        """
+        with ExitStack() as stack:
+            if font_data is None:
+                font_data = stack.enter_context(MappedFontFile(font_path))
+            face = stack.enter_context(FreeTypeManager.open_memory_face(font_data, font_index))
+
+            if font is None:
+                font = TTFont(font_data.open(), fontNumber=font_index, lazy=True)
+            if supported_cmaps is None:
+                supported_cmaps = FontParser.get_supported_cmaps(font, font_path, font_index)
+
+            cmaps: list[CMapCoverage] = []
+            has_symbol_cmap = False
+            for i in range(face.contents.num_charmaps):
+                charmap = face.contents.charmaps[i]
+                # Ignore the CMap created by freetype.
+                # See: https://freetype.org/freetype2/docs/reference/ft2-truetype_tables.html#ft_get_cmap_format
+                if FT_Get_CMap_Format(charmap) == -1:
+                    continue
+
+                cmap = CMap(charmap.contents.platform_id, charmap.contents.encoding_id)
+                if cmap not in supported_cmaps:
+                    continue
+
+                error = FT_Set_Charmap(face, charmap)
+                if error: raise FT_Exception(error)
+
+                cmaps.append(CMapCoverage.from_char_codes(cmap, GlyphCoverage.__get_char_codes(face)))
+                has_symbol_cmap = has_symbol_cmap or (cmap.platform_id == 3 and cmap.platform_enc_id == 0)
+
+            symbol_cmap_encoding = GlyphCoverage.__get_symbol_cmap_encoding(face, font, font_data, font_index) if has_symbol_cmap else None
+
+        return cls(cmaps, symbol_cmap_encoding)
+
+
+    @staticmethod
+    def __get_symbol_cmap_encoding(face: FT_Face, font: TTFont | SfntMetadata, font_data: MappedFontFile, font_index: int) -> str | None:
+        """
+        Args:
+            face: The FreeType face of the font face.
+            font: The fontTools object (or the SfntMetadata) of the font face.
+            font_data: The mapped font file.
+            font_index: Font index.
+        Returns:
+            The guessed code page of the symbol cmap. See FontParser.get_symbol_cmap_encoding.
+        """
+        # Reading the glyph names from the post table is a lot faster than asking them one by one to FreeType
+        if not isinstance(font, TTFont):
+            font = TTFont(font_data.open(), fontNumber=font_index, lazy=True)
+        try:
+            glyph_names = FontParser.get_glyph_names_from_post_table(font)
+        except Exception:
+            glyph_names = None
+
+        if glyph_names is None:
+            return FontParser.get_symbol_cmap_encoding(face)
+        return FontParser.get_symbol_cmap_encoding_from_glyph_names(glyph_names)
+
+
+    @staticmethod
+    def __get_char_codes(face: FT_Face) -> Iterable[int]:
+        """
+        Args:
+            face: A FreeType face with the charmap to read selected.
+        Returns:
+            The character codes of the selected charmap that are mapped to a glyph, in ascending order.
+        """
+        glyph_index = c_uint()
+        # FT_Get_First_Char and FT_Get_Next_Char return an FT_ULong, but freetype-py declares it as a c_int
+        char_code = FT_Get_First_Char(face, byref(glyph_index)) & 0xFFFFFFFF
+        while glyph_index.value != 0:
+            yield char_code
+            char_code = FT_Get_Next_Char(face, c_ulong(char_code), byref(glyph_index)) & 0xFFFFFFFF
+
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns:
+            A compact representation of the coverage. See from_bytes.
+        """
+        symbol_cmap_encoding = b"" if self.symbol_cmap_encoding is None else self.symbol_cmap_encoding.encode("ascii")
+        data = [pack(GlyphCoverage.HEADER_FORMAT, GlyphCoverage.SERIALIZATION_VERSION, len(self.cmaps), len(symbol_cmap_encoding)), symbol_cmap_encoding]
+
+        for cmap_coverage in self.cmaps:
+            ranges = array("I", cmap_coverage.ranges)
+            if sys.byteorder == "big":
+                ranges.byteswap()
+            data.append(pack(GlyphCoverage.CMAP_FORMAT, cmap_coverage.cmap.platform_id, cmap_coverage.cmap.platform_enc_id, len(ranges)))
+            data.append(ranges.tobytes())
+
+        return b"".join(data)
+
+
+    @classmethod
+    def from_bytes(cls: type[GlyphCoverage], data: bytes) -> GlyphCoverage:
+        """
+        Args:
+            data: The value returned by to_bytes.
+        Returns:
+            The deserialized coverage.
+        """
+        version, cmaps_count, symbol_cmap_encoding_length = unpack_from(GlyphCoverage.HEADER_FORMAT, data)
+        if version != GlyphCoverage.SERIALIZATION_VERSION:
+            raise ValueError(f"The glyph coverage version {version} isn't supported.")
+        offset = calcsize(GlyphCoverage.HEADER_FORMAT)
+
+        symbol_cmap_encoding = data[offset : offset + symbol_cmap_encoding_length].decode("ascii") if symbol_cmap_encoding_length else None
+        offset += symbol_cmap_encoding_length
+
+        cmaps: list[CMapCoverage] = []
+        for _ in range(cmaps_count):
+            platform_id, platform_enc_id, ranges_count = unpack_from(GlyphCoverage.CMAP_FORMAT, data, offset)
+            offset += calcsize(GlyphCoverage.CMAP_FORMAT)
+
+            ranges = array("I")
+            ranges.frombytes(data[offset : offset + ranges_count * ranges.itemsize])
+            if len(ranges) != ranges_count:
+                raise ValueError("The glyph coverage is truncated.")
+            if sys.byteorder == "big":
+                ranges.byteswap()
+            offset += ranges_count * ranges.itemsize
+
+            cmaps.append(CMapCoverage(CMap(platform_id, platform_enc_id), array("L", ranges)))
+
+        return cls(cmaps, symbol_cmap_encoding)
+
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GlyphCoverage):
+            return False
+        return (self.cmaps, self.symbol_cmap_encoding) == (other.cmaps, other.symbol_cmap_encoding)
+
+
+    def __hash__(self) -> int:
+        return hash((tuple(self.cmaps), self.symbol_cmap_encoding))
+
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(CMaps="{self.cmaps}", Symbol cmap encoding="{self.symbol_cmap_encoding}")'
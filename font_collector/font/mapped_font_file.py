@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import io
+import os
+from ctypes import Array, c_ubyte
+from mmap import ACCESS_COPY, mmap
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO
+
+
+class _MappedFontFileRaw(io.RawIOBase):
+    """A raw stream that reads a MappedFontFile. Each stream has its own position."""
+
+    def __init__(self, data: mmap | bytearray) -> None:
+        super().__init__()
+        self.__data = data
+        self.__position = 0
+
+
+    def readable(self) -> bool:
+        return True
+
+
+    def seekable(self) -> bool:
+        return True
+
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self.__data[self.__position : self.__position + len(buffer)]
+        buffer[: len(chunk)] = chunk
+        self.__position += len(chunk)
+        return len(chunk)
+
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.__position + offset
+        elif whence == io.SEEK_END:
+            position = len(self.__data) + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self.__position = position
+        return position
+
+
+    def tell(self) -> int:
+        return self.__position
+
+
+class MappedFontFile:
+    """A font file mapped in memory.
+
+    The mapping is shared by all the readers of the font: fontTools and SfntMetadata read it with the streams returned by open,
+    and FreeType directly reads it with get_buffer. So, the file is never copied in memory,
+    only the pages that are actually accessed are loaded, and they are shared with the OS page cache.
+
+    Warning: The mapping must not be used after close has been called.
+        The faces created by FreeType with get_buffer must be released before.
+
+    Attributes:
+        font_path: Font path.
+    """
+
+    def __init__(self, font_path: Path) -> None:
+        self.font_path = font_path
+        with open(font_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size > 0:
+                # FreeType needs a pointer to the font data, and ctypes can only create it from a writable buffer.
+                # With ACCESS_COPY, the mapping is writable, but nothing ever writes in it, so no page is copied.
+                self.__data: mmap | bytearray = mmap(file.fileno(), 0, access=ACCESS_COPY)
+            else:
+                # An empty file cannot be mapped
+                self.__data = bytearray()
+        self.__buffer: Array[c_ubyte] | None = None
+
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+
+    def open(self) -> BinaryIO:
+        """
+        Returns:
+            A new stream that reads the font file from the mapping. Closing it doesn't close the mapping.
+        """
+        return io.BufferedReader(_MappedFontFileRaw(self.__data))
+
+
+    def get_buffer(self) -> Array[c_ubyte]:
+        """
+        Returns:
+            A ctypes view of the mapping. It can be given to FT_New_Memory_Face.
+        """
+        if self.__buffer is None:
+            self.__buffer = (c_ubyte * len(self.__data)).from_buffer(self.__data)
+        return self.__buffer
+
+
+    def close(self) -> None:
+        # The ctypes view must be released before the mapping can be closed
+        self.__buffer = None
+        if isinstance(self.__data, mmap):
+            self.__data.close()
+
+
+    def __enter__(self) -> MappedFontFile:
+        return self
+
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import sys
 from enum import IntEnum
+from functools import lru_cache
 
 from fontTools.ttLib.tables._n_a_m_e import (
     _MAC_LANGUAGE_CODES,
@@ -18,6 +20,10 @@ from .lcid import (
 MAC_LCID_CODE_TO_LANGUAGES: dict[int, str] = _MAC_LANGUAGES
 MAC_LANGUAGES_TO_LCID_CODE: dict[str, int] = _MAC_LANGUAGE_CODES
 
+# The supported languages of each platform, given to closest_supported_match
+_MAC_SUPPORTED_LANGUAGES: list[str] = list(MAC_LANGUAGES_TO_LCID_CODE.keys())
+_WINDOWS_SUPPORTED_LANGUAGES: list[str] = list(WINDOWS_LANGUAGES_TO_LCID_CODE.keys())
+
 
 __all__ = ["Name", "NameID", "PlatformID"]
 
@@ -65,13 +71,15 @@ class Name:
         lang_code: The language code associated with the name.
             In some very specific case, the lang_code can be "und" (undefined)
     """
+    __slots__ = ("value", "lang_code")
 
     def __init__(
         self,
         value: str,
         lang_code: Language
     ) -> None:
-        self.value = value
+        # The same names are repeated in many faces (ex: every face of a family), so they are interned to share the strings
+        self.value = sys.intern(value)
         self.lang_code = lang_code
 
 
@@ -186,18 +194,37 @@ class Name:
         """
         tag_distance = 9 if fallback_to_language else 0
         if platform_id == PlatformID.MICROSOFT:
-            result = closest_supported_match(self.lang_code, list(WINDOWS_LANGUAGES_TO_LCID_CODE.keys()), tag_distance)
-            if result is None:
+            lang_id = Name.__get_lang_id(self.lang_code, PlatformID.MICROSOFT, tag_distance)
+            if lang_id is None:
                 raise ValueError(f'The lang_code "{self.lang_code.to_tag()}" isn\'t supported by the microsoft platform')
-            return WINDOWS_LANGUAGES_TO_LCID_CODE[result]
+            return lang_id
         elif platform_id == PlatformID.MACINTOSH:
-            result = closest_supported_match(self.lang_code, list(MAC_LANGUAGES_TO_LCID_CODE.keys()), tag_distance)
-            if result is None:
+            lang_id = Name.__get_lang_id(self.lang_code, PlatformID.MACINTOSH, tag_distance)
+            if lang_id is None:
                 raise ValueError(f'The lang_code "{self.lang_code.to_tag()}" isn\'t supported by the macintosh platform')
-            return MAC_LANGUAGES_TO_LCID_CODE[result]
+            return lang_id
         raise ValueError(f"You cannot specify the platform id {platform_id}. You can only specify the microsoft or the macintosh id")
 
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __get_lang_id(lang_code: Language, platform_id: PlatformID, tag_distance: int) -> int | None:
+        """
+        Args:
+            lang_code: The language.
+            platform_id: The microsoft or the macintosh platform id.
+            tag_distance: See closest_supported_match.
+        Returns:
+            The language id of the platform, or None if the platform doesn't support the language.
+            The result is cached, since the fonts use a small set of languages.
+        """
+        if platform_id == PlatformID.MICROSOFT:
+            result = closest_supported_match(lang_code, _WINDOWS_SUPPORTED_LANGUAGES, tag_distance)
+            return None if result is None else WINDOWS_LANGUAGES_TO_LCID_CODE[result]
+        result = closest_supported_match(lang_code, _MAC_SUPPORTED_LANGUAGES, tag_distance)
+        return None if result is None else MAC_LANGUAGES_TO_LCID_CODE[result]
+
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Name):
             return False
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from ..exceptions import InvalidNormalFontFaceException
 from .abc_font_face import ABCFontFace
 from .font_type import FontType
+from .glyph_coverage import GlyphCoverage
 from .name import Name
 
 if TYPE_CHECKING:
@@ -20,6 +21,17 @@ class NormalFontFace(ABCFontFace):
 
     For the list of Attributes, see the doc of: ABCFontFace
     """
+    __slots__ = (
+        "__font_index",
+        "__family_names",
+        "__exact_names",
+        "__weight",
+        "__is_italic",
+        "__is_glyph_emboldened",
+        "__font_type",
+        "__font_file",
+        "__glyph_coverage",
+    )
 
     def __init__(
         self,
@@ -30,6 +42,7 @@ class NormalFontFace(ABCFontFace):
         is_italic: bool,
         is_glyph_emboldened: bool,
         font_type: FontType,
+        glyph_coverage: GlyphCoverage | None = None,
     ) -> None:
         if len(family_names) == 0:
             raise InvalidNormalFontFaceException("A font face needs to contain at least 1 family name.")
@@ -42,6 +55,7 @@ class NormalFontFace(ABCFontFace):
         self.__is_glyph_emboldened = is_glyph_emboldened
         self.__font_type = font_type
         self.__font_file = None
+        self.__glyph_coverage = glyph_coverage
 
     @property
     def font_index(self) -> int:
@@ -76,6 +90,14 @@ class NormalFontFace(ABCFontFace):
     def font_file(self) -> FontFile | None:
         return self.__font_file
 
+    @property
+    def glyph_coverage(self) -> GlyphCoverage | None:
+        return self.__glyph_coverage
+
+    @glyph_coverage.setter
+    def glyph_coverage(self, value: GlyphCoverage | None) -> None:
+        self.__glyph_coverage = value
+
     def link_face_to_a_font_file(self, value: FontFile) -> None:
         # Since there is a circular reference between FontFile and this class, we need to be able to set the value
         self.__font_file = value
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Hashable, Sequence
 
 from ...ass.ass_style import AssStyle
 from ..abc_font_face import ABCFontFace
@@ -24,6 +25,33 @@ class FontSelectionStrategy(ABC):
         """
 
 
+    def get_name_key(self, font_name: str) -> Hashable | None:
+        """
+        Args:
+            font_name: A family name, an exact name or a font name that come from an AssStyle.
+        Returns:
+            A key such as is_font_name_match(font_face, style_font_name) is True if, and only if,
+            the key of style_font_name is equal to the key of one of the family names or exact names of the font_face.
+            It allows FontCollection to index the font faces by name.
+            If it returns None, the strategy doesn't support it and all the font faces are compared with is_font_name_match.
+            Warning: If a subclass overrides is_font_name_match, it must also override this method.
+        """
+        return None
+
+
+    def get_name_key_prefix(self, font_name: str) -> str | None:
+        """
+        Args:
+            font_name: A font name. It can come from an AssStyle.
+        Returns:
+            A prefix of the lowercase of every family name and exact name that has the same key as font_name. See get_name_key.
+            It allows FontCache to only read the names that may have this key.
+            If it returns None, the strategy doesn't support it and all the names are read.
+            Warning: If a subclass overrides get_name_key, it must also override this method.
+        """
+        return None
+
+
     @abstractmethod
     def need_faux_bold(self, font_face: ABCFontFace, style: AssStyle) -> bool:
         """
@@ -46,3 +74,16 @@ class FontSelectionStrategy(ABC):
             The lower, the better. If it returns 0, it means it is a perfect match.
             If it returns infinity, then the font name between the style and the font face doesn't match.
         """
+
+
+    def get_similarity_scores(self, font_faces: Sequence[ABCFontFace], styles: Sequence[AssStyle]) -> list[list[float]]:
+        """Same as get_similarity_score, but for every style and every font face at once.
+        A subclass can override it to share the work between the styles, but the scores must be exactly the same as get_similarity_score.
+
+        Args:
+            font_faces: The font faces to score.
+            styles: The AssStyles to score.
+        Returns:
+            The scores of each style: scores[i][j] is get_similarity_score(font_faces[j], styles[i]).
+        """
+        return [[self.get_similarity_score(font_face, style) for font_face in font_faces] for style in styles]
@@ -1,3 +1,5 @@
+from collections.abc import Hashable, Sequence
+
 from ...ass.ass_style import AssStyle
 from ..abc_font_face import ABCFontFace
 from .font_selection_strategy import FontSelectionStrategy
@@ -24,23 +26,93 @@ class FontSelectionStrategyLibass(FontSelectionStrategy):
         return family_name_match or exact_name_match
 
 
+    def get_name_key(self, font_name: str) -> Hashable | None:
+        # A subclass that changes how the names are matched must compare all the font faces
+        if type(self).is_font_name_match is not FontSelectionStrategyLibass.is_font_name_match:
+            return None
+        return font_name.lower()
+
+
+    def get_name_key_prefix(self, font_name: str) -> str | None:
+        if type(self).get_name_key is not FontSelectionStrategyLibass.get_name_key or self.get_name_key(font_name) is None:
+            return None
+        return font_name.lower()
+
+
     def need_faux_bold(self, font_face: ABCFontFace, style: AssStyle) -> bool:
-        return style.weight > font_face.weight + 150 and not font_face.is_glyph_emboldened
+        return FontSelectionStrategyLibass.__need_faux_bold(font_face.weight, font_face.is_glyph_emboldened, style)
 
 
     def get_similarity_score(self, font_face: ABCFontFace, style: AssStyle) -> float:
-        score = 0.0
-
         if not self.is_font_name_match(font_face, style.fontname):
             return float("inf")
 
-        if style.italic and not font_face.is_italic:
+        from ..variable_font_face import VariableFontFace
+        return FontSelectionStrategyLibass.__get_score(
+            font_face.weight, font_face.is_italic, self.need_faux_bold(font_face, style), isinstance(font_face, VariableFontFace), style
+        )
+
+
+    def get_similarity_scores(self, font_faces: Sequence[ABCFontFace], styles: Sequence[AssStyle]) -> list[list[float]]:
+        # A subclass that changes the formula must be scored face by face
+        if (
+            type(self).get_similarity_score is not FontSelectionStrategyLibass.get_similarity_score or
+            type(self).need_faux_bold is not FontSelectionStrategyLibass.need_faux_bold
+        ):
+            return super().get_similarity_scores(font_faces, styles)
+
+        # The attributes of the font faces are only read once, and the name of the font faces are only compared once per font name.
+        # The scores are computed by the same function as get_similarity_score, so they are exactly the same.
+        from ..variable_font_face import VariableFontFace
+        face_attributes = [
+            (font_face.weight, font_face.is_italic, font_face.is_glyph_emboldened, isinstance(font_face, VariableFontFace)) for font_face in font_faces
+        ]
+        # font name: is_font_name_match of each font face
+        name_matches: dict[str, list[bool]] = {}
+
+        scores: list[list[float]] = []
+        for style in styles:
+            name_match = name_matches.get(style.fontname)
+            if name_match is None:
+                name_match = [self.is_font_name_match(font_face, style.fontname) for font_face in font_faces]
+                name_matches[style.fontname] = name_match
+
+            scores.append([
+                FontSelectionStrategyLibass.__get_score(
+                    weight, is_italic, FontSelectionStrategyLibass.__need_faux_bold(weight, is_glyph_emboldened, style), is_variable_font, style
+                ) if is_match else float("inf")
+                for is_match, (weight, is_italic, is_glyph_emboldened, is_variable_font) in zip(name_match, face_attributes)
+            ])
+
+        return scores
+
+
+    @staticmethod
+    def __need_faux_bold(weight: int, is_glyph_emboldened: bool, style: AssStyle) -> bool:
+        return style.weight > weight + 150 and not is_glyph_emboldened
+
+
+    @staticmethod
+    def __get_score(weight: int, is_italic: bool, need_faux_bold: bool, is_variable_font: bool, style: AssStyle) -> float:
+        """
+        Args:
+            weight: The weight of the font face.
+            is_italic: If the font face is italic.
+            need_faux_bold: The result of need_faux_bold for the font face and the style.
+            is_variable_font: If the font face is a VariableFontFace.
+            style: An AssStyle whose font name matches the font face.
+        Returns:
+            The similarity score of a font face whose name matches the style.
+        """
+        score = 0.0
+
+        if style.italic and not is_italic:
             score += 1
-        elif not style.italic and font_face.is_italic:
+        elif not style.italic and is_italic:
             score += 4
 
-        weight_compare = font_face.weight
-        if self.need_faux_bold(font_face, style):
+        weight_compare = weight
+        if need_faux_bold:
             weight_compare += 120
 
         score += (73 * abs(weight_compare - style.weight)) // 256
@@ -49,8 +121,7 @@ class FontSelectionStrategyLibass(FontSelectionStrategy):
         # when a user call VariableFontFace.variable_font_to_collection, the created font will have the same score has
         # the variable font AND since the variable font is older than the font collection, it will prefer the variable font
         # which is not what we want.
-        from ..variable_font_face import VariableFontFace
-        if isinstance(font_face, VariableFontFace):
+        if is_variable_font:
             score += 0.5
 
         return score
@@ -1,3 +1,5 @@
+from collections.abc import Hashable
+
 from ..abc_font_face import ABCFontFace
 from .font_selection_strategy_libass import FontSelectionStrategyLibass
 
@@ -33,6 +35,21 @@ class FontSelectionStrategyVSFilter(FontSelectionStrategyLibass):
         return trunc_utf16_bytes
 
 
+    def get_name_key(self, font_name: str) -> Hashable | None:
+        # A subclass that changes how the names are matched must compare all the font faces
+        if type(self).is_font_name_match is not FontSelectionStrategyVSFilter.is_font_name_match:
+            return None
+        return self.__trunc_name(font_name.lower())
+
+
+    def get_name_key_prefix(self, font_name: str) -> str | None:
+        if type(self).get_name_key is not FontSelectionStrategyVSFilter.get_name_key or self.get_name_key(font_name) is None:
+            return None
+        # The names that are longer than the truncated name have the same key, so only the truncated name is a prefix of them.
+        # If a surrogate has been broken in two, its first half is ignored, so it is still a prefix.
+        return self.__trunc_name(font_name.lower()).decode("utf-16-be", errors="ignore")
+
+
     def is_font_name_match(self, font_face: ABCFontFace, style_font_name: str) -> bool:
         family_name_match = any(self.__trunc_name(style_font_name.lower()) == self.__trunc_name(family_name.value.lower()) for family_name in font_face.family_names)
 
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from struct import calcsize, unpack
+from typing import Any, BinaryIO
+
+from fontTools.ttLib.tables._c_m_a_p import CmapSubtable
+from fontTools.ttLib.tables._n_a_m_e import NameRecord
+
+
+class _NameTable:
+    def __init__(self, names: list[NameRecord]) -> None:
+        self.names = names
+
+
+class _CmapSubtableHeader:
+    def __init__(self, platformID: int, platEncID: int, format: int) -> None:
+        self.platformID = platformID
+        self.platEncID = platEncID
+        self.format = format
+
+
+class _CmapTable:
+    def __init__(self, tables: list[_CmapSubtableHeader]) -> None:
+        self.tables = tables
+
+
+class _OS2Table:
+    def __init__(self, fsSelection: int, usWeightClass: int) -> None:
+        self.fsSelection = fsSelection
+        self.usWeightClass = usWeightClass
+
+
+class _HeadTable:
+    def __init__(self, macStyle: int) -> None:
+        self.macStyle = macStyle
+
+
+class SfntMetadata:
+    """Represents the few tables of an sfnt font face needed to create a NormalFontFace.
+
+    Instead of decoding the font with fontTools, it seeks straight to the table directory and only reads
+    the name records, the OS/2 fsSelection and usWeightClass, the head macStyle and the cmap subtable headers.
+
+    It implements the subset of the fontTools TTFont interface used by FontParser and FontType
+    (``tag in font``, ``font["name"].names``, ``font["cmap"].tables``, ``font["OS/2"].fsSelection``,
+    ``font["OS/2"].usWeightClass`` and ``font["head"].macStyle``), so it can be used instead of a TTFont.
+
+    Attributes:
+        table_tags: The tags of all the tables of the font face.
+    """
+
+    SFNT_VERSIONS = (b"\x00\x01\x00\x00", b"OTTO", b"true")
+    TTC_VERSIONS = (0x00010000, 0x00020000)
+    # From: https://learn.microsoft.com/en-us/typography/opentype/spec/os2
+    OS2_MIN_LENGTH_BY_VERSION = {0: 78, 1: 86, 2: 96, 3: 96, 4: 96, 5: 100}
+    # From: https://learn.microsoft.com/en-us/typography/opentype/spec/head
+    HEAD_LENGTH = 54
+
+    def __init__(
+        self,
+        table_tags: set[str],
+        tables: dict[str, Any],
+    ) -> None:
+        self.table_tags = table_tags
+        self.__tables = tables
+
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self.table_tags
+
+
+    def __getitem__(self, tag: str) -> Any:
+        if tag not in self.__tables:
+            raise KeyError(f"'{tag}' table not found")
+        return self.__tables[tag]
+
+
+    @staticmethod
+    def get_fonts_offset(file: BinaryIO) -> tuple[list[int], bool] | None:
+        """
+        Args:
+            file: A font file opened in binary mode.
+        Returns:
+            The offset of the table directory of each font face and a boolean indicating whether the font is a collection font (TTC/OTC fonts).
+            If the file isn't a TrueType, an OpenType or a collection font, it return None.
+        """
+        file.seek(0)
+        header = file.read(12)
+
+        if header[:4] == b"ttcf":
+            if len(header) != 12:
+                return None
+            version, num_fonts = unpack(">LL", header[4:])
+            if version not in SfntMetadata.TTC_VERSIONS or num_fonts == 0:
+                return None
+            offsets_data = file.read(num_fonts * 4)
+            if len(offsets_data) != num_fonts * 4:
+                return None
+            return list(unpack(f">{num_fonts}L", offsets_data)), True
+
+        if header[:4] in SfntMetadata.SFNT_VERSIONS:
+            return [0], False
+
+        return None
+
+
+    @classmethod
+    def from_file(cls: type[SfntMetadata], file: BinaryIO, offset: int) -> SfntMetadata | None:
+        """
+        Args:
+            file: A font file opened in binary mode.
+            offset: The offset of the table directory of the font face. See get_fonts_offset.
+        Returns:
+            The metadata of the font face.
+            If the font face is a variable font or if anything is unusual (truncated or malformed table, etc.),
+            it return None. In that case, the font face must be read with fontTools.
+        """
+        file_size = file.seek(0, 2)
+
+        file.seek(offset)
+        header = file.read(12)
+        if len(header) != 12 or header[:4] not in SfntMetadata.SFNT_VERSIONS:
+            return None
+        num_tables: int = unpack(">H", header[4:6])[0]
+
+        directory = file.read(num_tables * 16)
+        if len(directory) != num_tables * 16:
+            return None
+
+        # tag: (offset, length)
+        table_records: dict[str, tuple[int, int]] = {}
+        for i in range(num_tables):
+            tag, checksum, table_offset, length = unpack(">4sLLL", directory[i * 16 : (i + 1) * 16])
+            table_records[tag.decode("latin-1")] = (table_offset, length)
+
+        if "fvar" in table_records or "name" not in table_records or "cmap" not in table_records:
+            return None
+
+        if any(table_offset + length > file_size for table_offset, length in table_records.values()):
+            return None
+
+        tables: dict[str, Any] = {}
+
+        name_table = SfntMetadata.__read_name_table(file, *table_records["name"])
+        cmap_table = SfntMetadata.__read_cmap_table(file, *table_records["cmap"])
+        if name_table is None or cmap_table is None:
+            return None
+        tables["name"] = name_table
+        tables["cmap"] = cmap_table
+
+        if "OS/2" in table_records:
+            os2_table = SfntMetadata.__read_os2_table(file, *table_records["OS/2"])
+            if os2_table is None:
+                return None
+            tables["OS/2"] = os2_table
+
+        if "head" in table_records:
+            head_table = SfntMetadata.__read_head_table(file, *table_records["head"])
+            if head_table is None:
+                return None
+            tables["head"] = head_table
+
+        return cls(set(table_records), tables)
+
+
+    @staticmethod
+    def __read_name_table(file: BinaryIO, offset: int, length: int) -> _NameTable | None:
+        # It does the same thing as fontTools: https://github.com/fonttools/fonttools/blob/main/Lib/fontTools/ttLib/tables/_n_a_m_e.py
+        file.seek(offset)
+        data = file.read(length)
+        if len(data) < 6:
+            return None
+
+        format, count, string_offset = unpack(">HHH", data[:6])
+        string_data = data[string_offset:]
+
+        names: list[NameRecord] = []
+        for i in range(count):
+            record = data[6 + i * 12 : 6 + (i + 1) * 12]
+            if len(record) < 12:
+                # fontTools skip the malformed name record
+                continue
+            platform_id, plat_enc_id, lang_id, name_id, string_length, record_string_offset = unpack(">HHHHHH", record)
+            if record_string_offset + string_length > len(string_data):
+                continue
+
+            name = NameRecord()
+            name.platformID = platform_id
+            name.platEncID = plat_enc_id
+            name.langID = lang_id
+            name.nameID = name_id
+            name.string = string_data[record_string_offset : record_string_offset + string_length]
+            names.append(name)
+
+        return _NameTable(names)
+
+
+    @staticmethod
+    def __read_cmap_table(file: BinaryIO, offset: int, length: int) -> _CmapTable | None:
+        # It only reads the subtable headers and reject everything that fontTools would reject.
+        # See: https://github.com/fonttools/fonttools/blob/main/Lib/fontTools/ttLib/tables/_c_m_a_p.py
+        file.seek(offset)
+        header = file.read(4)
+        if len(header) < 4:
+            return None
+        num_subtables: int = unpack(">HH", header)[1]
+        records = file.read(num_subtables * 8)
+        if len(records) != num_subtables * 8:
+            return None
+
+        tables: list[_CmapSubtableHeader] = []
+        for i in range(num_subtables):
+            platform_id, plat_enc_id, subtable_offset = unpack(">HHL", records[i * 8 : (i + 1) * 8])
+
+            file.seek(offset + subtable_offset)
+            subtable_header = file.read(8)
+            if subtable_offset + 4 > length or len(subtable_header) < 4:
+                return None
+
+            format, subtable_length = unpack(">HH", subtable_header[:4])
+            if format in (8, 10, 12, 13):
+                if subtable_offset + 8 > length:
+                    return None
+                subtable_length = unpack(">L", subtable_header[4:8])[0]
+            elif format == 14:
+                if subtable_offset + 6 > length:
+                    return None
+                subtable_length = unpack(">L", subtable_header[2:6])[0]
+
+            if not subtable_length:
+                # fontTools skip the subtable
+                continue
+            if subtable_length < calcsize(CmapSubtable.getSubtableClass(format).headerFormat) or subtable_offset + subtable_length > length:
+                return None
+
+            tables.append(_CmapSubtableHeader(platform_id, plat_enc_id, format))
+
+        return _CmapTable(tables)
+
+
+    @staticmethod
+    def __read_os2_table(file: BinaryIO, offset: int, length: int) -> _OS2Table | None:
+        file.seek(offset)
+        data = file.read(64)
+        if len(data) < 2:
+            return None
+
+        version: int = unpack(">H", data[:2])[0]
+        if version not in SfntMetadata.OS2_MIN_LENGTH_BY_VERSION or length < SfntMetadata.OS2_MIN_LENGTH_BY_VERSION[version]:
+            return None
+
+        us_weight_class: int = unpack(">H", data[4:6])[0]
+        fs_selection: int = unpack(">H", data[62:64])[0]
+        return _OS2Table(fs_selection, us_weight_class)
+
+
+    @staticmethod
+    def __read_head_table(file: BinaryIO, offset: int, length: int) -> _HeadTable | None:
+        if length != SfntMetadata.HEAD_LENGTH:
+            return None
+        file.seek(offset + 44)
+        data = file.read(2)
+        if len(data) != 2:
+            return None
+        return _HeadTable(unpack(">H", data)[0])
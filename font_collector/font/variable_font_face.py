@@ -14,6 +14,7 @@ from ..exceptions import InvalidVariableFontFaceException
 from .abc_font_face import ABCFontFace
 from .font_parser import FontParser
 from .font_type import FontType
+from .glyph_coverage import GlyphCoverage
 from .name import Name, NameID
 
 if TYPE_CHECKING:
@@ -34,6 +35,18 @@ class VariableFontFace(ABCFontFace):
         named_instance_coordinates: The value of each AxisTag ex: {"wght": 800.0}
             For more detail, see: https://learn.microsoft.com/en-us/typography/opentype/spec/fvar#instancerecord
     """
+    __slots__ = (
+        "__font_index",
+        "__families_prefix",
+        "__families_suffix",
+        "__exact_names_suffix",
+        "__weight",
+        "__is_italic",
+        "__font_type",
+        "__named_instance_coordinates",
+        "__font_file",
+        "__glyph_coverage",
+    )
 
     def __init__(
         self,
@@ -45,6 +58,7 @@ class VariableFontFace(ABCFontFace):
         is_italic: bool,
         font_type: FontType,
         named_instance_coordinates: dict[str, float],
+        glyph_coverage: GlyphCoverage | None = None,
     ) -> None:
         if len(families_prefix) == 0:
             raise InvalidVariableFontFaceException("The font does not contain an valid family prefix.")
@@ -58,6 +72,7 @@ class VariableFontFace(ABCFontFace):
         self.__font_type = font_type
         self.__named_instance_coordinates = named_instance_coordinates
         self.__font_file = None
+        self.__glyph_coverage = glyph_coverage
 
 
     @property
@@ -127,6 +142,14 @@ class VariableFontFace(ABCFontFace):
     def font_file(self) -> FontFile | None:
         return self.__font_file
 
+    @property
+    def glyph_coverage(self) -> GlyphCoverage | None:
+        return self.__glyph_coverage
+
+    @glyph_coverage.setter
+    def glyph_coverage(self, value: GlyphCoverage | None) -> None:
+        self.__glyph_coverage = value
+
     def link_face_to_a_font_file(self, value: FontFile) -> None:
         # Since there is a circular reference between FontFile and this class, we need to be able to set the value
         self.__font_file = value
@@ -40,11 +40,13 @@ def parse_arguments() -> tuple[
     bool,
     bool,
     bool,
-    Path | None
+    Path | None,
+    int | None,
+    bool
 ]:
     """
     Returns:
-        ass_files_path, output_directory, mkv_path, delete_fonts, additional_fonts, use_system_fonts
+        ass_files_path, output_directory, mkv_path, delete_fonts, additional_fonts, use_system_fonts, workers, cache_fonts
     """
 
     start_time = datetime.now().strftime("%Y-%m-%d--%H-%M-%S")
@@ -154,6 +156,22 @@ def parse_arguments() -> tuple[
     Destination path of log. If it isn't specified, it will be YYYY-MM-DD--HH-MM-SS_font_collector.log.
     """,
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="""
+    Number of worker processes used to load the fonts. If it is 0, it will use as many workers as there are processors. By default, it is 1 (no worker process).
+    """,
+    )
+    parser.add_argument(
+        "--cache-fonts",
+        action="store_true",
+        help="""
+    If specified, the system fonts and the additional font directories that aren't cached yet are fully loaded and cached, so the next runs are faster.
+    If not specified, only the fonts that the subtitles may use are loaded from the sources that aren't cached, and they are not cached.
+    """,
+    )
 
     args = parser.parse_args()
 
@@ -169,6 +187,11 @@ def parse_arguments() -> tuple[
     collect_draw_fonts = args.collect_draw_fonts
     convert_variable_to_collection = args.dont_convert_variable_to_collection
     logging_file_path = args.logging
+    workers = args.workers if args.workers != 0 else None
+    cache_fonts = args.cache_fonts
+
+    if workers is not None and workers < 0:
+        raise RuntimeError("--workers cannot be negative.")
 
     if len(ass_files_path) == 0 and not use_ass_in_mkv:
         raise RuntimeError("The specified file(s)/folder(s) doesn't exist or the folder(s) doesn't contains any .ass file.")
@@ -192,5 +215,7 @@ def parse_arguments() -> tuple[
         use_system_fonts,
         collect_draw_fonts,
         convert_variable_to_collection,
-        logging_file_path
+        logging_file_path,
+        workers,
+        cache_fonts
     )
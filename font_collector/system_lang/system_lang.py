@@ -1,10 +1,16 @@
+from functools import cache
 from platform import system
 
 from ..exceptions import OSNotSupported
 
 __all__ = ["get_system_lang"]
 
+@cache
 def get_system_lang() -> str:
+    """
+    Returns:
+        The IETF BCP-47 tag of the OS language. It is only retrieved once per process.
+    """
     system_name = system()
 
     if system_name == "Windows":
@@ -1,6 +1,6 @@
 from langcodes import Language
 
-from font_collector import FontType, Name, NormalFontFace
+from font_collector import AssStyle, FontType, Name, NormalFontFace, VariableFontFace
 from font_collector.font.selection_strategy.font_selection_strategy_libass import (
     FontSelectionStrategyLibass
 )
@@ -36,3 +36,47 @@ def test_is_font_name_match_family_and_exact_match():
     assert strategy.is_font_name_match(font, "family")
     assert strategy.is_font_name_match(font, "exact")
     assert not strategy.is_font_name_match(font, "anything")
+
+
+def test_get_name_key():
+    strategy = FontSelectionStrategyLibass()
+
+    assert strategy.get_name_key("Font Name") == strategy.get_name_key("FONT name")
+    assert strategy.get_name_key("A" * 30 + "\U0001f60b") != strategy.get_name_key("A" * 30 + "\U0001f60c")
+
+
+def test_get_name_key_custom_name_match():
+    class FontSelectionStrategyCustom(FontSelectionStrategyLibass):
+        def is_font_name_match(self, font_face, style_font_name):
+            return super().is_font_name_match(font_face, style_font_name.removeprefix("@"))
+
+    # The name keys wouldn't be consistent with is_font_name_match, so all the font faces must be compared
+    assert FontSelectionStrategyCustom().get_name_key("Font Name") is None
+
+
+def test_get_similarity_scores():
+    class FontSelectionStrategyCustom(FontSelectionStrategyLibass):
+        def get_similarity_score(self, font_face, style):
+            return super().get_similarity_score(font_face, style) * 2
+
+    family_name = Name("family", Language.get("en"))
+    font_faces = [
+        NormalFontFace(0, [family_name], [family_name], weight, is_italic, is_glyph_emboldened, FontType.TRUETYPE)
+        for weight in (100, 400, 700, 900)
+        for is_italic in (False, True)
+        for is_glyph_emboldened in (False, True)
+    ]
+    font_faces.append(VariableFontFace(0, [family_name], [], [], 400, False, FontType.TRUETYPE, {"wght": 400.0}))
+    font_faces.append(NormalFontFace(0, [Name("other", Language.get("en"))], [], 400, False, False, FontType.TRUETYPE))
+    styles = [AssStyle(font_name, weight, italic) for font_name in ("family", "FAMILY", "other") for weight in (100, 400, 551, 1000) for italic in (False, True)]
+
+    for strategy in (FontSelectionStrategyLibass(), FontSelectionStrategyCustom()):
+        # The scores are exactly the same as the scores computed one by one
+        expected_scores = [[strategy.get_similarity_score(font_face, style) for font_face in font_faces] for style in styles]
+        assert strategy.get_similarity_scores(font_faces, styles) == expected_scores
+
+
+def test_get_name_key_prefix():
+    strategy = FontSelectionStrategyLibass()
+
+    assert strategy.get_name_key_prefix("Font Name") == "font name"
@@ -40,3 +40,29 @@ def test_is_font_name_match_family_and_exact_match():
     assert strategy.is_font_name_match(font, "family")
     assert strategy.is_font_name_match(font, "exact")
     assert not strategy.is_font_name_match(font, "anything")
+
+
+def test_get_name_key():
+    strategy = FontSelectionStrategyVSFilter()
+
+    family_name_str = "A" * 30 + "\U0001f60b"
+    assert strategy.get_name_key(family_name_str) == strategy.get_name_key("a" * 30 + "\U0001f60c")
+    assert strategy.get_name_key(family_name_str) != strategy.get_name_key("A" * 30 + "\U0001f852")
+
+
+def test_get_name_key_custom_name_match():
+    class FontSelectionStrategyCustom(FontSelectionStrategyVSFilter):
+        def is_font_name_match(self, font_face, style_font_name):
+            return super().is_font_name_match(font_face, style_font_name.removeprefix("@"))
+
+    # The name keys wouldn't be consistent with is_font_name_match, so all the font faces must be compared
+    assert FontSelectionStrategyCustom().get_name_key("Font Name") is None
+
+
+def test_get_name_key_prefix():
+    strategy = FontSelectionStrategyVSFilter()
+
+    # The names with the same key only share the truncated name
+    assert strategy.get_name_key_prefix("A" * 40) == "a" * 31
+    assert strategy.get_name_key_prefix("A" * 30 + "\U0001f60b") == "a" * 30
+    assert strategy.get_name_key_prefix("Font Name") == "font name"
@@ -0,0 +1,78 @@
+import os
+from pathlib import Path
+
+from font_collector.font.directory_scanner import DirectoryScanner, ScannedDirectory
+
+
+def is_font_file(file_name: str) -> bool:
+    return file_name.endswith(".ttf")
+
+
+def set_mtime(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_scan(tmp_path: Path):
+    subdirectory = tmp_path / "subdirectory"
+    subdirectory.mkdir()
+    (tmp_path / "a.ttf").write_bytes(b"")
+    (tmp_path / "b.txt").write_bytes(b"")
+    (subdirectory / "c.ttf").write_bytes(b"")
+    # The directories must be old enough to be trusted
+    set_mtime(tmp_path, 1_000_000_000)
+    set_mtime(subdirectory, 1_000_000_000)
+
+    fonts_path, scanned_directories, modified_directories = DirectoryScanner.scan(tmp_path, False, is_font_file, {})
+    assert fonts_path == [tmp_path / "a.ttf"]
+    assert modified_directories == {tmp_path}
+
+    fonts_path, scanned_directories, modified_directories = DirectoryScanner.scan(tmp_path, True, is_font_file, {})
+    assert fonts_path == [tmp_path / "a.ttf", subdirectory / "c.ttf"]
+    assert modified_directories == {tmp_path, subdirectory}
+    assert scanned_directories[tmp_path].mtime_ns == 1_000_000_000
+
+    # Nothing changed
+    fonts_path, scanned_directories, modified_directories = DirectoryScanner.scan(tmp_path, True, is_font_file, scanned_directories)
+    assert fonts_path == [tmp_path / "a.ttf", subdirectory / "c.ttf"]
+    assert modified_directories == set()
+
+    # A font is added in the subdirectory
+    (subdirectory / "d.ttf").write_bytes(b"")
+    set_mtime(subdirectory, 2_000_000_000)
+    fonts_path, scanned_directories, modified_directories = DirectoryScanner.scan(tmp_path, True, is_font_file, scanned_directories)
+    assert sorted(fonts_path) == [tmp_path / "a.ttf", subdirectory / "c.ttf", subdirectory / "d.ttf"]
+    assert modified_directories == {subdirectory}
+
+    # An unmodified directory isn't listed again
+    scanned_directories[tmp_path] = ScannedDirectory(1_000_000_000, ["fake.ttf"], [])
+    fonts_path, _, modified_directories = DirectoryScanner.scan(tmp_path, True, is_font_file, scanned_directories)
+    assert fonts_path == [tmp_path / "fake.ttf"]
+    assert modified_directories == set()
+
+
+def test_scan_recently_modified_directory(tmp_path: Path):
+    (tmp_path / "a.ttf").write_bytes(b"")
+
+    _, scanned_directories, _ = DirectoryScanner.scan(tmp_path, False, is_font_file, {})
+    assert scanned_directories[tmp_path].mtime_ns is None
+
+    _, _, modified_directories = DirectoryScanner.scan(tmp_path, False, is_font_file, scanned_directories)
+    assert modified_directories == {tmp_path}
+
+
+def test_scan_font_files(tmp_path: Path):
+    subdirectory = tmp_path / "subdirectory"
+    subdirectory.mkdir()
+    set_mtime(tmp_path, 1_000_000_000)
+    set_mtime(subdirectory, 1_000_000_000)
+    fonts_path = [tmp_path / "a.ttf", subdirectory / "b.ttf"]
+
+    scanned_directories, modified_directories = DirectoryScanner.scan_font_files(fonts_path, {})
+    assert modified_directories == {tmp_path, subdirectory}
+
+    scanned_directories, modified_directories = DirectoryScanner.scan_font_files(fonts_path, scanned_directories)
+    assert modified_directories == set()
+
+    # The list of fonts changed, but not the directory mtime
+    scanned_directories, modified_directories = DirectoryScanner.scan_font_files(fonts_path + [subdirectory / "c.ttf"], scanned_directories)
+    assert modified_directories == {subdirectory}
@@ -2,6 +2,8 @@ import collections
 import os
 
 import pytest
+from fontTools.ttLib.ttCollection import TTCollection
+from fontTools.ttLib.ttFont import TTFont
 from langcodes import Language
 
 from font_collector import (
@@ -12,6 +14,7 @@ from font_collector import (
     VariableFontFace
 )
 from font_collector.font.factory_abc_font_face import FactoryABCFontFace
+from font_collector.font.sfnt_metadata import SfntMetadata
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 
@@ -685,3 +688,22 @@ def test_opentype_font():
 
     assert is_collection_font == expected_is_collection_font
     assert collections.Counter(fonts) == collections.Counter(expected_fonts)
+
+
+def test_font_collection_read_with_fonttools(tmp_path, monkeypatch):
+    fonts_path = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+    font_collection_path = tmp_path / "font_collection.ttc"
+    font_collection = TTCollection()
+    font_collection.fonts = [TTFont(os.path.join(fonts_path, "font_mac.TTF")), TTFont(os.path.join(fonts_path, "font_cmap_encoding_0.ttf"))]
+    font_collection.save(font_collection_path)
+
+    fonts, is_collection_font = FactoryABCFontFace.from_font_path(font_collection_path)
+    assert is_collection_font
+    assert [(font.font_index, font.family_names[0].value) for font in fonts] == [(0, "Brushstroke Plain"), (1, "AG_Matura_C")]
+
+    # Without the light reader, each member is read with fontTools
+    monkeypatch.setattr(SfntMetadata, "get_fonts_offset", lambda file: None)
+    fonts_read_with_fonttools, is_collection_font = FactoryABCFontFace.from_font_path(font_collection_path)
+    assert is_collection_font
+    assert fonts_read_with_fonttools == fonts
+    assert [font.glyph_coverage for font in fonts_read_with_fonttools] == [font.glyph_coverage for font in fonts]
@@ -0,0 +1,106 @@
+import os
+import sqlite3
+from pathlib import Path
+
+from font_collector import FontCache, FontFile
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+fonts_path = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+
+
+def test_font_cache(tmp_path: Path):
+    cache_file = tmp_path / "cache.db"
+    font_variable = FontFile.from_font_path(Path(os.path.join(fonts_path, "Asap-VariableFont_wdth,wght.ttf")))
+    font_collection = FontFile.from_font_path(Path(os.path.join(fonts_path, "opentype_font_collection.ttc")))
+    font_mac = FontFile.from_font_path(Path(os.path.join(fonts_path, "font_mac.TTF")))
+
+    with FontCache(cache_file) as font_cache:
+        font_cache.add_font_files([font_variable, font_collection, font_mac])
+
+    with FontCache(cache_file) as font_cache:
+        cached_fonts, corrupted_paths = font_cache.get_font_files()
+        assert cached_fonts == [font_variable, font_collection, font_mac]
+        assert [font.last_loaded_time for font in cached_fonts] == [font_variable.last_loaded_time, font_collection.last_loaded_time, font_mac.last_loaded_time]
+        assert [font.creation_time for font in cached_fonts] == [font_variable.creation_time, font_collection.creation_time, font_mac.creation_time]
+        assert corrupted_paths == []
+
+        # Query by name. It is case-insensitive
+        assert font_cache.get_font_files_by_name(font_mac.font_faces[0].get_best_family_name().value.upper()) == [font_mac]
+        assert font_cache.get_font_files_by_name(font_variable.font_faces[0].get_best_exact_name().value) == [font_variable]
+        assert font_cache.get_font_files_by_name("this font does not exist") == []
+
+        # Query without decoding the fonts
+        assert (font_mac.filename, font_mac.font_faces[0].get_best_family_name().value) in font_cache.get_font_names()
+        assert {filename for filename, _ in font_cache.get_font_names()} == {font_variable.filename, font_collection.filename, font_mac.filename}
+        font_mac_family_name = font_mac.font_faces[0].get_best_family_name().value
+        assert (font_mac.filename, font_mac_family_name) in font_cache.get_font_names_by_prefix(font_mac_family_name[:3].lower())
+        assert {filename for filename, _ in font_cache.get_font_names_by_prefix(font_mac_family_name.lower())} == {font_mac.filename}
+        assert font_cache.get_font_names_by_prefix("this font does not exist") == []
+        assert sorted(font_cache.get_font_names_by_prefix("")) == sorted(font_cache.get_font_names())
+        assert font_cache.get_last_loaded_times() == {font.filename: font.last_loaded_time for font in (font_variable, font_collection, font_mac)}
+        assert font_cache.get_font_files_by_filenames([font_mac.filename, Path("this font does not exist")]) == [font_mac]
+
+        # Upsert
+        font_cache.add_font_files([font_variable])
+        cached_fonts, _ = font_cache.get_font_files()
+        assert cached_fonts == [font_collection, font_mac, font_variable]
+
+        font_cache.remove_font_files([font_collection.filename])
+        cached_fonts, _ = font_cache.get_font_files()
+        assert cached_fonts == [font_mac, font_variable]
+
+        font_cache.clear()
+        assert font_cache.get_font_files() == ([], [])
+
+
+def test_font_cache_corrupted_row(tmp_path: Path):
+    cache_file = tmp_path / "cache.db"
+    font_mac = FontFile.from_font_path(Path(os.path.join(fonts_path, "font_mac.TTF")))
+    font_collection = FontFile.from_font_path(Path(os.path.join(fonts_path, "opentype_font_collection.ttc")))
+
+    with FontCache(cache_file) as font_cache:
+        font_cache.add_font_files([font_mac, font_collection])
+
+    connection = sqlite3.connect(cache_file)
+    with connection:
+        connection.execute("UPDATE font_face SET font_type = 'invalid' WHERE font_file_id = (SELECT id FROM font_file WHERE filename = ?)", (str(font_mac.filename),))
+    connection.close()
+
+    with FontCache(cache_file) as font_cache:
+        cached_fonts, corrupted_paths = font_cache.get_font_files()
+        assert cached_fonts == [font_collection]
+        assert corrupted_paths == [font_mac.filename]
+
+        # The corrupted font has been removed from the cache
+        assert font_cache.get_font_files() == ([font_collection], [])
+
+
+def test_font_cache_corrupted_file(tmp_path: Path):
+    cache_file = tmp_path / "cache.db"
+    cache_file.write_bytes(b"this is not a sqlite database" * 100)
+
+    with FontCache(cache_file) as font_cache:
+        assert font_cache.get_font_files() == ([], [])
+
+
+def test_font_cache_invalid_fonts(tmp_path: Path):
+    cache_file = tmp_path / "cache.db"
+    invalid_font = tmp_path / "invalid_font.ttf"
+    invalid_font.write_bytes(b"invalid font")
+    deleted_font = tmp_path / "deleted_font.ttf"
+    deleted_font.write_bytes(b"invalid font")
+
+    with FontCache(cache_file) as font_cache:
+        font_cache.add_invalid_fonts({invalid_font: "error 1", deleted_font: "error 2"})
+        assert font_cache.get_invalid_fonts() == {deleted_font: "error 2", invalid_font: "error 1"}
+
+        deleted_font.unlink()
+        assert font_cache.get_invalid_fonts() == {invalid_font: "error 1"}
+
+        # When the file change, it isn't considered invalid anymore
+        invalid_font.write_bytes(b"this font has changed")
+        assert font_cache.get_invalid_fonts() == {}
+
+        font_cache.add_invalid_fonts({invalid_font: "error 1"})
+        font_cache.remove_font_files([invalid_font])
+        assert font_cache.get_invalid_fonts() == {}
@@ -9,11 +9,13 @@ from langcodes import Language
 
 from font_collector import (
     AssStyle,
+    FontCache,
     FontCollection,
     FontFile,
     FontLoader,
     FontResult,
     FontSelectionStrategyLibass,
+    FontSelectionStrategyVSFilter,
     FontType,
     Name,
     NormalFontFace,
@@ -27,7 +29,7 @@ def test__init__():
     use_system_font = False
     reload_system_font = True
     use_generated_fonts = False
-    additional_fonts = set()
+    additional_fonts = []
     font_collection = FontCollection(
         use_system_font,
         reload_system_font,
@@ -69,6 +71,24 @@ def test_system_fonts_property():
     assert str(exc_info.value) == "You cannot set system_fonts, but you can set use_system_font"
 
 
+def test_system_fonts_given():
+    font_file = FontFile.from_font_path(Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF")))
+
+    font_collection = FontCollection(use_generated_fonts=False, system_fonts=[font_file])
+    assert font_collection.system_fonts == [font_file]
+    assert font_collection.fonts == [font_file]
+
+    assert not font_collection.lazy_system_fonts
+    assert font_collection.get_used_font_by_style(AssStyle(font_file.font_faces[0].family_names[0].value, 400, False), FontSelectionStrategyLibass()).font_face.font_file is font_file
+
+    font_collection.use_system_font = False
+    assert font_collection.system_fonts == []
+
+    with pytest.raises(ValueError) as exc_info:
+        FontCollection(reload_system_font=True, system_fonts=[font_file])
+    assert str(exc_info.value) == "system_fonts can't be given with reload_system_font"
+
+
 def test_generated_fonts_property():
     # It could be any font
     font_file = FontFile.from_font_path(Path(os.path.join(os.path.dirname(dir_path), "file", "variable font tests", "Test #6", "Test #6.ttf")))
@@ -76,6 +96,10 @@ def test_generated_fonts_property():
     font_collection = FontCollection(use_generated_fonts=False)
     assert len(font_collection.generated_fonts) == 0
 
+    # The generated font cache persist between runs, so make sure the font isn't already in it
+    with FontCache(FontLoader.get_generated_font_cache_file_path()) as font_cache:
+        font_cache.remove_font_files([font_file.filename])
+
     font_collection.use_generated_fonts = True
     nbr_generated_font_before = len(font_collection.generated_fonts)
     FontLoader.add_generated_font(font_file)
@@ -163,6 +187,132 @@ def test_get_used_font_by_style():
     os.remove(sf_pro_display_italic_temp_2)
 
 
+def test_get_used_font_by_style_name_index():
+    class FontSelectionStrategyWithoutIndex(FontSelectionStrategyVSFilter):
+        def get_name_key(self, font_name):
+            return None
+
+    fonts_path = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts"))
+    additional_fonts = FontLoader.load_additional_fonts([fonts_path], scan_subdirs=True)
+    font_collection = FontCollection(use_system_font=False, use_generated_fonts=False, additional_fonts=additional_fonts)
+
+    font_names = {name.value for font_file in additional_fonts for font_face in font_file.font_faces for name in font_face.family_names + font_face.exact_names}
+    font_names.add("Font name that isn't in the FontCollection")
+    for strategy in (FontSelectionStrategyLibass(), FontSelectionStrategyVSFilter()):
+        for font_name in sorted(font_names):
+            for weight, italic in ((400, False), (700, True)):
+                ass_style = AssStyle(font_name.upper(), weight, italic)
+                expected_result = font_collection.get_used_font_by_style(ass_style, FontSelectionStrategyWithoutIndex())
+                assert font_collection.get_used_font_by_style(ass_style, strategy) == expected_result
+
+    # The index follows the modifications of additional_fonts
+    strategy = FontSelectionStrategyLibass()
+    font_collection = FontCollection(use_system_font=False, use_generated_fonts=False, additional_fonts=[])
+    ass_style = AssStyle("exact", 400, False)
+    assert font_collection.get_used_font_by_style(ass_style, strategy) is None
+
+    font_mac_platform = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF"))
+    font_faces = [NormalFontFace(0, [Name("family", Language.get("en"))], [Name("exact", Language.get("en"))], 400, False, False, FontType.TRUETYPE)]
+    font_collection.additional_fonts.append(FontFile(font_mac_platform, font_faces, False))
+    assert font_collection.get_used_font_by_style(ass_style, strategy) == FontResult(font_faces[0], False, False, False)
+
+
+def test_get_used_font_by_style_cache():
+    strategy = FontSelectionStrategyLibass()
+    font_mac_platform = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF"))
+    font_faces = [NormalFontFace(0, [Name("family", Language.get("en"))], [Name("exact", Language.get("en"))], 400, False, False, FontType.TRUETYPE)]
+    font_file = FontFile(font_mac_platform, font_faces, False)
+    font_collection = FontCollection(use_system_font=False, use_generated_fonts=False, additional_fonts=[], font_result_cache_size=2)
+
+    ass_style = AssStyle("family", 400, False)
+    assert font_collection.get_used_font_by_style(ass_style, strategy) is None
+    assert font_collection.get_used_font_by_style(ass_style, strategy) is None
+    assert (font_collection.font_result_cache_hits, font_collection.font_result_cache_misses) == (1, 1)
+
+    # Adding a font invalidates the cache
+    font_collection.additional_fonts.append(font_file)
+    assert font_collection.get_used_font_by_style(ass_style, strategy) == FontResult(font_faces[0], False, False, False)
+    assert (font_collection.font_result_cache_hits, font_collection.font_result_cache_misses) == (1, 2)
+
+    # The least recently used result is evicted
+    font_collection.get_used_font_by_style(AssStyle("family", 700, False), strategy)
+    font_collection.get_used_font_by_style(ass_style, strategy)
+    font_collection.get_used_font_by_style(AssStyle("family", 400, True), strategy)
+    assert (font_collection.font_result_cache_hits, font_collection.font_result_cache_misses) == (2, 4)
+    font_collection.get_used_font_by_style(ass_style, strategy)
+    font_collection.get_used_font_by_style(AssStyle("family", 700, False), strategy)
+    assert (font_collection.font_result_cache_hits, font_collection.font_result_cache_misses) == (3, 5)
+
+    font_collection.clear_font_result_cache()
+    assert (font_collection.font_result_cache_hits, font_collection.font_result_cache_misses) == (0, 0)
+
+
+def test_get_used_font_by_style_lazy_system_fonts(tmp_path, monkeypatch):
+    fonts_path = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts"))
+    system_fonts_path = sorted(font_path for font_path in fonts_path.rglob("*") if font_path.suffix.lower() in (".ttf", ".otf", ".ttc"))
+    monkeypatch.setattr("font_collector.font.font_loader.get_system_fonts_filename", lambda: {str(font_path) for font_path in system_fonts_path})
+    monkeypatch.setattr(FontLoader, "get_system_font_cache_file_path", staticmethod(lambda: tmp_path / "cache.db"))
+
+    # The system fonts are sorted by path, so the expected results can be computed with additional_fonts
+    system_fonts = FontLoader.load_font_files(system_fonts_path)
+    font_collection = FontCollection(use_system_font=False, use_generated_fonts=False, additional_fonts=system_fonts)
+    lazy_font_collection = FontCollection(use_generated_fonts=False, lazy_system_fonts=True)
+
+    font_names = {name.value for font_file in system_fonts for font_face in font_file.font_faces for name in font_face.family_names + font_face.exact_names}
+    font_names.add("Font name that isn't in the FontCollection")
+
+    # The lazy mode never loads all the system fonts, nor all their names
+    monkeypatch.setattr(FontLoader, "load_system_fonts", staticmethod(lambda max_workers=1: pytest.fail("The system fonts should not be loaded")))
+    monkeypatch.setattr(FontCache, "get_font_files", lambda self, check_files_exist=True: pytest.fail("The whole cache should not be read"))
+    monkeypatch.setattr(FontCache, "get_font_names", lambda self: pytest.fail("All the names should not be read"))
+    for strategy in (FontSelectionStrategyLibass(), FontSelectionStrategyVSFilter()):
+        for font_name in sorted(font_names):
+            for weight, italic in ((400, False), (700, True)):
+                ass_style = AssStyle(font_name.upper(), weight, italic)
+                assert lazy_font_collection.get_used_font_by_style(ass_style, strategy) == font_collection.get_used_font_by_style(ass_style, strategy)
+
+
+def test_get_used_fonts_by_styles():
+    fonts_path = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts"))
+    additional_fonts = FontLoader.load_additional_fonts([fonts_path], scan_subdirs=True)
+
+    font_names = {name.value for font_file in additional_fonts for font_face in font_file.font_faces for name in font_face.family_names + font_face.exact_names}
+    font_names.add("Font name that isn't in the FontCollection")
+    styles = [AssStyle(font_name, weight, italic) for font_name in sorted(font_names) for weight in (100, 400, 700, 900) for italic in (False, True)]
+
+    for strategy in (FontSelectionStrategyLibass(), FontSelectionStrategyVSFilter()):
+        font_collection = FontCollection(use_system_font=False, use_generated_fonts=False, additional_fonts=additional_fonts, font_result_cache_size=0)
+        font_results = font_collection.get_used_fonts_by_styles(styles, strategy)
+        assert list(font_results) == styles
+        for style in styles:
+            assert font_results[style] == font_collection.get_used_font_by_style(style, strategy)
+
+    # The results are cached like with get_used_font_by_style
+    font_collection = FontCollection(use_system_font=False, use_generated_fonts=False, additional_fonts=additional_fonts)
+    font_collection.get_used_font_by_style(styles[0], strategy)
+    font_collection.get_used_fonts_by_styles(styles[:2], strategy)
+    assert (font_collection.font_result_cache_hits, font_collection.font_result_cache_misses) == (1, 2)
+
+
+def test_get_used_fonts_by_styles_generated_fonts(tmp_path, monkeypatch):
+    strategy = FontSelectionStrategyLibass()
+    font_mac = FontFile.from_font_path(Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF")))
+    monkeypatch.setattr(FontLoader, "get_generated_font_cache_file_path", staticmethod(lambda: tmp_path / "generated.db"))
+    font_collection = FontCollection(use_system_font=False, additional_fonts=[])
+    styles = [AssStyle(name.value, 400, False) for name in font_mac.font_faces[0].family_names]
+
+    assert font_collection.get_used_fonts_by_styles(styles, strategy) == {style: None for style in styles}
+
+    # The generated font cache file is only checked once per call, and the results follow its changes
+    get_generated_fonts_version = FontLoader.get_generated_fonts_version
+    versions: list[Hashable] = []
+    monkeypatch.setattr(FontLoader, "get_generated_fonts_version", staticmethod(lambda: versions.append(get_generated_fonts_version()) or versions[-1]))
+    FontLoader.add_generated_font(font_mac)
+    font_results = font_collection.get_used_fonts_by_styles(styles, strategy)
+    assert len(versions) == 1
+    assert all(font_result is not None and font_result.font_face.font_file == font_mac for font_result in font_results.values())
+
+
 def test__eq__():
     font_collection_1 = FontCollection(True, True, True, [])
     font_collection_2 = FontCollection(True, True, True, [])
@@ -215,12 +365,34 @@ def test__hash__():
     assert {font_collection_1} != {"test"}
 
 
+def test__eq__and__hash__follow_the_sources():
+    font_mac_platform = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF"))
+    font_faces = [NormalFontFace(0, [Name("family", Language.get("en"))], [Name("exact", Language.get("en"))], 400, False, False, FontType.TRUETYPE)]
+    font_file = FontFile(font_mac_platform, font_faces, False)
+    font_collection_1 = FontCollection(True, True, True, [])
+    font_collection_2 = FontCollection(True, True, True, [])
+
+    sources_version = font_collection_1.sources_version
+    font_collection_1.additional_fonts.append(font_file)
+    assert font_collection_1.sources_version != sources_version
+    assert font_collection_1 != font_collection_2
+
+    font_collection_2.additional_fonts = [font_file]
+    assert font_collection_1 == font_collection_2
+    assert hash(font_collection_1) == hash(font_collection_2)
+
+    assert FontCollection(lazy_system_fonts=False) != FontCollection()
+    assert FontCollection(max_workers=2) != FontCollection()
+    assert FontCollection(system_fonts=[font_file]) != FontCollection(system_fonts=[])
+    assert FontCollection(system_fonts=[font_file]) == FontCollection(system_fonts=[font_file])
+
+
 def test__repr__():
     font_collection = FontCollection(
         use_system_font=False,
         reload_system_font=False,
         use_generated_fonts=False,
-        additional_fonts=set()
+        additional_fonts=[]
     )
 
-    assert repr(font_collection) == 'FontCollection(Use system font="False", Reload system font="False", Use generated fonts="False", Additional fonts="set()")'
+    assert repr(font_collection) == 'FontCollection(Use system font="False", Reload system font="False", Use generated fonts="False", Additional fonts="[]")'
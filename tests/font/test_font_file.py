@@ -73,6 +73,25 @@ def test_last_loaded_time_property():
         font_file.last_loaded_time = 1000
 
 
+def test_creation_time_property(tmp_path: Path):
+    font_faces = [VariableFontFace(0, [Name("test", Language.get("en"))], [], [], 400, False, FontType.TRUETYPE, {})]
+    font_file = FontFile(filename, font_faces, False)
+    assert font_file.creation_time == filename.stat().st_ctime
+    with pytest.raises(AttributeError) as exc_info:
+        font_file.creation_time = 1000
+
+    # The creation time is captured when the font is loaded, so the file isn't stat again
+    font_path = tmp_path / "font_mac.TTF"
+    shutil.copy(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF"), font_path)
+    font_file = FontFile.from_font_path(font_path)
+    creation_time = font_path.stat().st_ctime
+    font_path.unlink()
+    assert font_file.creation_time == creation_time
+
+    font_file = FontFile(filename, font_faces, False, creation_time=1000)
+    assert font_file.creation_time == 1000
+
+
 def test_from_font_path():
     font_mac_platform = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF"))
     time_before = time()
@@ -208,6 +227,22 @@ def test__hash__():
     assert {font_file_1} != {"test"}
 
 
+def test__hash__doesnt_hash_font_faces(tmp_path: Path, monkeypatch):
+    font_path = tmp_path / "font_mac.TTF"
+    shutil.copy(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF"), font_path)
+    font_file = FontFile.from_font_path(font_path)
+    font_file_hash = hash(font_file)
+
+    monkeypatch.setattr(NormalFontFace, "__hash__", lambda self: pytest.fail("The font faces should not be hashed"))
+    fonts_file_found = {font_file}
+    assert font_file in fonts_file_found
+
+    # The hash doesn't change when the font is reloaded
+    font_file.reload_font_file()
+    assert hash(font_file) == font_file_hash
+    assert font_file in fonts_file_found
+
+
 def test__repr__():
     font_mac_platform = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF"))
     font_faces = [
@@ -1,7 +1,12 @@
 import os
+import shutil
 from pathlib import Path
+from time import sleep
 
-from font_collector import FontLoader
+import pytest
+from fontTools.ttLib.ttFont import TTFont
+
+from font_collector import FontCache, FontFile, FontLoader, FontSelectionStrategyLibass, FontSelectionStrategyVSFilter
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 
@@ -69,3 +74,172 @@ def test_load_additional_fonts():
         Path(os.path.join(font_directory_sub_dir, "generated_fonts", "Raleway-Thin.ttf - generated.ttf")),
     ]
     assert sorted(result) == sorted(expected_result)
+
+
+def test_load_font_files(tmp_path, caplog):
+    fonts_directory = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+    invalid_font = tmp_path.joinpath("font_without_cmap.ttf")
+    font = TTFont(os.path.join(fonts_directory, "font_mac.TTF"))
+    del font["cmap"]
+    font.save(invalid_font)
+
+    fonts_path = [
+        Path(os.path.join(fonts_directory, "SFProDisplay-Bold.ttf")),
+        invalid_font,
+        Path(os.path.join(fonts_directory, "font_mac.TTF")),
+        Path(os.path.join(fonts_directory, "SFProDisplay-BoldItalic.ttf")),
+    ]
+    expected_result = [fonts_path[0], fonts_path[2], fonts_path[3]]
+
+    caplog.clear()
+    fonts_result = FontLoader.load_font_files(fonts_path)
+    sequential_logs = [(record.name, record.levelno, record.getMessage()) for record in caplog.records]
+    assert [font.filename for font in fonts_result] == expected_result
+    assert f"The font {invalid_font} will be ignored." in caplog.text
+
+    caplog.clear()
+    parallel_fonts_result = FontLoader.load_font_files(fonts_path, max_workers=2)
+    parallel_logs = [(record.name, record.levelno, record.getMessage()) for record in caplog.records]
+    assert parallel_fonts_result == fonts_result
+    assert parallel_logs == sequential_logs
+
+    with pytest.raises(ValueError) as exc_info:
+        FontLoader.load_font_files(fonts_path, max_workers=0)
+    assert str(exc_info.value) == "max_workers must be greater than 0, not 0"
+
+
+def test_filter_fonts_path_by_names():
+    fonts_directory = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts"))
+    fonts_path = FontLoader.get_additional_fonts_path([fonts_directory], scan_subdirs=True)
+    font_files = FontLoader.load_font_files(fonts_path)
+
+    for strategy in (FontSelectionStrategyLibass(), FontSelectionStrategyVSFilter()):
+        # A font is never excluded if one of its faces matches
+        for font_file in font_files:
+            for font_face in font_file.font_faces:
+                for name in font_face.family_names + font_face.exact_names:
+                    assert font_file.filename in FontLoader.filter_fonts_path_by_names(fonts_path, [name.value.upper()], strategy)
+
+        # The variable fonts are always kept
+        filtered_fonts_path = FontLoader.filter_fonts_path_by_names(fonts_path, ["Font name that doesn't exist"], strategy)
+        assert Path(os.path.join(fonts_directory, "Asap-VariableFont_wdth,wght.ttf")) in filtered_fonts_path
+        assert Path(os.path.join(fonts_directory, "font_mac.TTF")) not in filtered_fonts_path
+
+
+def test_load_system_fonts_invalid_fonts(tmp_path, monkeypatch):
+    font_mac = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF"))
+    invalid_font = tmp_path / "font_without_cmap.ttf"
+    font = TTFont(font_mac)
+    del font["cmap"]
+    font.save(invalid_font)
+
+    monkeypatch.setattr("font_collector.font.font_loader.get_system_fonts_filename", lambda: {str(font_mac), str(invalid_font)})
+    monkeypatch.setattr(FontLoader, "get_system_font_cache_file_path", staticmethod(lambda: tmp_path / "cache.db"))
+
+    assert FontLoader.get_invalid_system_fonts() == {}
+    system_fonts = FontLoader.load_system_fonts()
+    assert [font.filename for font in system_fonts] == [font_mac]
+    assert list(FontLoader.get_invalid_system_fonts()) == [invalid_font]
+
+    # The invalid font isn't parsed again
+    monkeypatch.setattr("font_collector.font.font_file.FactoryABCFontFace.from_font_path", lambda _: pytest.fail("The fonts should not be parsed"))
+    system_fonts = FontLoader.load_system_fonts()
+    assert [font.filename for font in system_fonts] == [font_mac]
+
+
+def test_load_system_fonts_font_overwritten_in_place(tmp_path, monkeypatch):
+    fonts_directory = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+    system_font_directory = tmp_path / "fonts"
+    system_font_directory.mkdir()
+    system_font = system_font_directory / "font.ttf"
+    shutil.copyfile(os.path.join(fonts_directory, "SFProDisplay-Bold.ttf"), system_font)
+    # The directory must not be considered as modified too recently
+    directory_mtime_ns = system_font_directory.stat().st_mtime_ns - 10_000_000_000
+    os.utime(system_font_directory, ns=(directory_mtime_ns, directory_mtime_ns))
+
+    monkeypatch.setattr("font_collector.font.font_loader.get_system_fonts_filename", lambda: {str(system_font)})
+    monkeypatch.setattr(FontLoader, "get_system_font_cache_file_path", staticmethod(lambda: tmp_path / "cache.db"))
+    assert FontLoader.load_system_fonts()[0].font_faces[0].exact_names[0].value == "SF Pro Display Bold"
+
+    # Overwriting the file in place doesn't modify its directory
+    sleep(0.01)
+    shutil.copyfile(os.path.join(fonts_directory, "SFProDisplay-BoldItalic.ttf"), system_font)
+    assert system_font_directory.stat().st_mtime_ns == directory_mtime_ns
+
+    # So the font is only detected when the files of the unmodified directories are stat
+    assert FontLoader.load_system_fonts(skip_unmodified_directories=True)[0].font_faces[0].exact_names[0].value == "SF Pro Display Bold"
+    assert FontLoader.load_system_fonts()[0].font_faces[0].exact_names[0].value == "SF Pro Display Bold Italic"
+
+
+def test_load_additional_fonts_with_cache(tmp_path, monkeypatch):
+    fonts_directory = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+    font_directory = tmp_path / "fonts"
+    font_directory.mkdir()
+    shutil.copy(os.path.join(fonts_directory, "font_mac.TTF"), font_directory)
+    shutil.copy(os.path.join(fonts_directory, "SFProDisplay-Bold.ttf"), font_directory)
+    monkeypatch.setattr("font_collector.font.font_loader.gettempdir", lambda: str(tmp_path))
+
+    fonts_result = FontLoader.load_additional_fonts([font_directory], use_cache=True)
+    assert FontLoader.get_additional_font_cache_file_path(font_directory, False).is_file()
+    assert not FontLoader.get_additional_font_cache_file_path(font_directory, True).is_file()
+
+    # Only the new font is loaded
+    shutil.copy(os.path.join(fonts_directory, "SFProDisplay-BoldItalic.ttf"), font_directory)
+    loaded_fonts = []
+    from_font_path = FontFile.from_font_path.__func__
+    def mock_from_font_path(cls, font_path):
+        loaded_fonts.append(font_path)
+        return from_font_path(cls, font_path)
+    monkeypatch.setattr(FontFile, "from_font_path", classmethod(mock_from_font_path))
+
+    cached_fonts_result = FontLoader.load_additional_fonts([font_directory], use_cache=True)
+    assert loaded_fonts == [font_directory / "SFProDisplay-BoldItalic.ttf"]
+    assert sorted(font.filename for font in cached_fonts_result) == sorted([font.filename for font in fonts_result] + [font_directory / "SFProDisplay-BoldItalic.ttf"])
+
+    FontLoader.discard_additional_font_cache(font_directory, False)
+    assert not FontLoader.get_additional_font_cache_file_path(font_directory, False).is_file()
+
+
+def test_load_additional_fonts_with_cache_keep_order(tmp_path, monkeypatch):
+    fonts_directory = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+    font_directory = tmp_path / "fonts"
+    font_directory.mkdir()
+    shutil.copy(os.path.join(fonts_directory, "font_mac.TTF"), font_directory)
+    font_sf_pro = Path(os.path.join(fonts_directory, "SFProDisplay-Bold.ttf"))
+    font_cmap_encoding_0 = Path(os.path.join(fonts_directory, "font_cmap_encoding_0.ttf"))
+    monkeypatch.setattr("font_collector.font.font_loader.gettempdir", lambda: str(tmp_path))
+
+    fonts_result = FontLoader.load_additional_fonts([font_sf_pro, font_directory, font_cmap_encoding_0], use_cache=True)
+    assert [font.filename for font in fonts_result] == [font_sf_pro, font_directory / "font_mac.TTF", font_cmap_encoding_0]
+
+
+def test_load_generated_fonts_registry(tmp_path, monkeypatch):
+    font_mac = FontFile.from_font_path(Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF")))
+    font_sf_pro = FontFile.from_font_path(Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "SFProDisplay-Bold.ttf")))
+    cache_file = tmp_path / "generated.db"
+    monkeypatch.setattr(FontLoader, "get_generated_font_cache_file_path", staticmethod(lambda: cache_file))
+
+    assert FontLoader.load_generated_fonts() == []
+    FontLoader.add_generated_font(font_mac)
+    assert FontLoader.load_generated_fonts() == [font_mac]
+
+    # The registry is up to date, so the cache file isn't read
+    with monkeypatch.context() as m:
+        m.setattr("font_collector.font.font_loader.FontCache", lambda _: pytest.fail("The cache file should not be read"))
+        assert FontLoader.load_generated_fonts() == [font_mac]
+
+    # The cache file has been modified by another process
+    with FontCache(cache_file) as font_cache:
+        font_cache.add_font_files([font_sf_pro])
+    assert FontLoader.load_generated_fonts() == [font_mac, font_sf_pro]
+
+    # A write that keeps the size and the modification time of the cache file is still detected
+    cache_file_stat = cache_file.stat()
+    with FontCache(cache_file) as font_cache:
+        font_cache.remove_font_files([font_sf_pro.filename])
+    os.utime(cache_file, ns=(cache_file_stat.st_atime_ns, cache_file_stat.st_mtime_ns))
+    assert cache_file.stat().st_size == cache_file_stat.st_size
+    assert FontLoader.load_generated_fonts() == [font_mac]
+
+    FontLoader.discard_generated_font_cache()
+    assert FontLoader.load_generated_fonts() == []
@@ -141,6 +141,29 @@ def test_get_filtered_names():
     assert FontParser.get_filtered_names(names_record, langID=0) == [expected_name]
 
 
+def test_get_font_names():
+    font = TTFont(os.path.join(os.path.dirname(dir_path), "file", "fonts", "Asap-VariableFont_wdth,wght.ttf"))
+
+    for name_id in (NameID.FAMILY_NAME, NameID.FULL_NAME, NameID.POSTSCRIPT_NAME, 256, 1000):
+        expected_names = FontParser.get_filtered_names(font["name"].names, platformID=PlatformID.MICROSOFT, nameID=name_id)
+        assert FontParser.get_font_names(font, PlatformID.MICROSOFT, name_id) == expected_names
+        # The names are memoized
+        assert FontParser.get_font_names(font, PlatformID.MICROSOFT, name_id) == expected_names
+
+    # The index is rebuilt when a name is added to the name table
+    name_record = NameRecord()
+    name_record.nameID = NameID.FAMILY_NAME
+    name_record.string = "Nouveau nom".encode("utf_16_be")
+    name_record.platformID = PlatformID.MICROSOFT
+    name_record.platEncID = 1
+    name_record.langID = 0x40C
+    font["name"].names.append(name_record)
+    assert Name("Nouveau nom", Language.get("fr-FR")) in FontParser.get_font_names(font, PlatformID.MICROSOFT, NameID.FAMILY_NAME)
+    assert FontParser.get_font_names(font, PlatformID.MICROSOFT, NameID.FAMILY_NAME) == FontParser.get_filtered_names(
+        font["name"].names, platformID=PlatformID.MICROSOFT, nameID=NameID.FAMILY_NAME
+    )
+
+
 def test_get_font_italic_bold_property_with_freetype():
     font_path = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_cmap_encoding_2.TTF"))
     assert (False, False, 400) == FontParser.get_font_italic_bold_property_with_freetype(font_path, 0)
@@ -203,6 +226,18 @@ def test_get_symbol_cmap_encoding():
     assert encoding == "cp1253"
 
 
+def test_get_glyph_names_from_post_table():
+    font_path = os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_cmap_encoding_0.ttf")
+    glyph_names = FontParser.get_glyph_names_from_post_table(TTFont(font_path))
+    assert glyph_names is not None
+    assert glyph_names[:3] == [".notdef", ".null", "nonmarkingreturn"]
+    assert FontParser.get_symbol_cmap_encoding_from_glyph_names(glyph_names) == "cp1253"
+
+    # The post table of a CFF font doesn't contain the glyph names
+    font_path = os.path.join(os.path.dirname(dir_path), "file", "fonts", "PENBOX.otf")
+    assert FontParser.get_glyph_names_from_post_table(TTFont(font_path)) is None
+
+
 def test_get_supported_cmaps():
     # This font contain 1 valid mac cmap
     font_path = Path(os.path.join(os.path.dirname(dir_path), "file", "fonts", "font_mac.TTF"))
@@ -0,0 +1,59 @@
+import os
+import shutil
+from ctypes import addressof
+from pathlib import Path
+
+from font_collector.font.freetype_manager import FreeTypeManager
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+fonts_path = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+
+
+def test_open_face(tmp_path: Path):
+    FreeTypeManager.clear()
+    font_path = tmp_path / "font_mac.TTF"
+    shutil.copy(os.path.join(fonts_path, "font_mac.TTF"), font_path)
+
+    # Outside of a session, the face is released after its use
+    with FreeTypeManager.open_face(font_path, 0) as face:
+        assert face.contents.num_glyphs > 0
+        assert FreeTypeManager.get_open_faces_count() == 1
+    assert FreeTypeManager.get_open_faces_count() == 0
+
+    with FreeTypeManager.session():
+        with FreeTypeManager.open_face(font_path, 0) as face:
+            face_address = addressof(face.contents)
+
+        # The face is reused
+        with FreeTypeManager.session(), FreeTypeManager.open_face(font_path, 0) as face:
+            assert addressof(face.contents) == face_address
+        assert FreeTypeManager.get_open_faces_count() == 1
+
+        # When the file is modified, the face is reopened
+        stat = font_path.stat()
+        os.utime(font_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with FreeTypeManager.open_face(font_path, 0) as face:
+            assert addressof(face.contents) != face_address
+        assert FreeTypeManager.get_open_faces_count() == 2
+
+    # The faces are released at the end of the outermost session, so the font file can be deleted
+    assert FreeTypeManager.get_open_faces_count() == 0
+    font_path.unlink()
+
+
+def test_open_face_eviction(monkeypatch):
+    FreeTypeManager.clear()
+    monkeypatch.setattr(FreeTypeManager, "MAX_FACES", 2)
+    font_collection = Path(os.path.join(fonts_path, "opentype_font_collection.ttc"))
+    font_cmap_encoding_0 = Path(os.path.join(fonts_path, "font_cmap_encoding_0.ttf"))
+    font_mac = Path(os.path.join(fonts_path, "font_mac.TTF"))
+
+    with FreeTypeManager.session():
+        with FreeTypeManager.open_face(font_collection, 0):
+            # A face currently used isn't evicted
+            with FreeTypeManager.open_face(font_cmap_encoding_0, 0), FreeTypeManager.open_face(font_mac, 0):
+                assert FreeTypeManager.get_open_faces_count() == 3
+
+        with FreeTypeManager.open_face(font_mac, 0):
+            pass
+        assert FreeTypeManager.get_open_faces_count() == 2
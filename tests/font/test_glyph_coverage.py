@@ -0,0 +1,74 @@
+import os
+from array import array
+from pathlib import Path
+
+from font_collector import FontCache, FontFile
+from font_collector.font.cmap import CMap
+from font_collector.font.glyph_coverage import CMapCoverage, GlyphCoverage
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+fonts_path = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+
+
+def test_cmap_coverage():
+    cmap_coverage = CMapCoverage.from_char_codes(CMap(3, 1), [0x20, 0x21, 0x22, 0x41, 0xFFFFFFFF])
+
+    assert cmap_coverage.ranges == array("L", [0x20, 0x23, 0x41, 0x42])
+    assert 0x1F not in cmap_coverage
+    assert 0x20 in cmap_coverage
+    assert 0x22 in cmap_coverage
+    assert 0x23 not in cmap_coverage
+    assert 0x41 in cmap_coverage
+    assert 0xFFFFFFFF not in cmap_coverage
+
+
+def test_glyph_coverage_from_font():
+    font_cmap_encoding_0 = Path(os.path.join(fonts_path, "font_cmap_encoding_0.ttf"))
+    glyph_coverage = GlyphCoverage.from_font(font_cmap_encoding_0, 0)
+
+    assert [cmap_coverage.cmap for cmap_coverage in glyph_coverage.cmaps] == [CMap(3, 0)]
+    assert glyph_coverage.symbol_cmap_encoding == "cp1253"
+
+    text = "Έκθεση για Απασχόληση Dream Top Co. Οι επιλογές À a"
+    assert glyph_coverage.get_missing_glyphs(text) == set("À")
+    assert glyph_coverage.get_missing_glyphs(text, True) == set("ΈκθεσηγιαπασχόλησηΟιεπιλογέςÀΑ")
+
+
+def test_glyph_coverage_bytes():
+    for font_name in ["font_cmap_encoding_0.ttf", "font_cmap_encoding_2.TTF", "font_mac.TTF", "opentype_font_collection.ttc"]:
+        glyph_coverage = GlyphCoverage.from_font(Path(os.path.join(fonts_path, font_name)), 0)
+        assert GlyphCoverage.from_bytes(glyph_coverage.to_bytes()) == glyph_coverage
+
+
+def test_glyph_coverage_computed_when_loading(tmp_path: Path):
+    font_file = FontFile.from_font_path(Path(os.path.join(fonts_path, "SFProDisplay-Bold.ttf")))
+
+    glyph_coverage = font_file.font_faces[0].glyph_coverage
+    assert glyph_coverage is not None
+
+    cache_file = tmp_path / "cache.db"
+    with FontCache(cache_file) as font_cache:
+        font_cache.add_font_files([font_file])
+
+    with FontCache(cache_file) as font_cache:
+        cached_fonts, _ = font_cache.get_font_files()
+        assert cached_fonts[0].font_faces[0].glyph_coverage == glyph_coverage
+        assert cached_fonts[0].font_faces[0].get_missing_glyphs("SF Pro 中") == {"中"}
+
+
+def test_glyph_coverage_of_variable_font_computed_when_needed():
+    font_file = FontFile.from_font_path(Path(os.path.join(fonts_path, "Asap-VariableFont_wdth,wght.ttf")))
+    assert all(font_face.glyph_coverage is None for font_face in font_file.font_faces)
+
+    assert font_file.font_faces[0].get_missing_glyphs("Asap ✓") == {"✓"}
+    assert font_file.font_faces[0].glyph_coverage is not None
+
+
+def test_glyph_coverage_computed_when_loading_invalid_cmap():
+    invalid_cmap = Path(os.path.join(fonts_path, "invalid_cmap.ttf"))
+    font_file = FontFile.from_font_path(invalid_cmap)
+
+    glyph_coverage = font_file.font_faces[0].glyph_coverage
+    assert glyph_coverage is not None
+    assert len(glyph_coverage.cmaps) > 0
+    assert glyph_coverage == GlyphCoverage.from_font(invalid_cmap, 0)
@@ -0,0 +1,39 @@
+import os
+from pathlib import Path
+
+from fontTools.ttLib.ttFont import TTFont
+
+from font_collector.font.freetype_manager import FreeTypeManager
+from font_collector.font.mapped_font_file import MappedFontFile
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+fonts_path = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+
+
+def test_mapped_font_file():
+    font_path = Path(os.path.join(fonts_path, "opentype_font_collection.ttc"))
+    font_content = font_path.read_bytes()
+
+    with MappedFontFile(font_path) as font_data:
+        assert len(font_data) == len(font_content)
+
+        # Each stream has its own position
+        with font_data.open() as file_1, font_data.open() as file_2:
+            assert file_1.read(4) == font_content[:4]
+            file_2.seek(-4, os.SEEK_END)
+            assert file_2.read() == font_content[-4:]
+            assert file_1.read(4) == font_content[4:8]
+
+        # fontTools and FreeType read the same mapping
+        font = TTFont(font_data.open(), fontNumber=0, lazy=True)
+        with FreeTypeManager.open_memory_face(font_data, 0) as face:
+            assert face.contents.num_glyphs == font["maxp"].numGlyphs
+
+
+def test_mapped_font_file_empty_file():
+    font_path = Path(os.path.join(fonts_path, "empty_file.txt"))
+
+    with MappedFontFile(font_path) as font_data:
+        assert len(font_data) == 0
+        with font_data.open() as file:
+            assert file.read() == b""
@@ -18,6 +18,8 @@ def test__init__():
 
     assert value == name.value
     assert lang_code == name.lang_code
+    # The values are interned, so equal names share the same string
+    assert Name("".join(["te", "st"]), lang_code).value is name.value
 
 
 def test_from_name_record():
@@ -206,6 +208,9 @@ def test_get_lang_code_platform_code():
     with pytest.raises(ValueError) as exc_info:
         invalid_language_code.get_lang_id_from_platform_id(PlatformID.MICROSOFT)
     assert str(exc_info.value) == 'The lang_code "en-FR" isn\'t supported by the microsoft platform'
+    # The unsupported language is cached, but it must still raise
+    with pytest.raises(ValueError):
+        invalid_language_code.get_lang_id_from_platform_id(PlatformID.MICROSOFT)
     assert Language.get(WINDOWS_LCID_CODE_TO_LANGUAGES[invalid_language_code.get_lang_id_from_platform_id(PlatformID.MICROSOFT, True)]).language == "en"
 
     with pytest.raises(ValueError) as exc_info:
@@ -45,6 +45,8 @@ def test__init__():
     assert font.is_glyph_emboldened == is_glyph_emboldened
     assert font.font_type == font_type
     assert font.font_file == None
+    # The attributes are stored in __slots__
+    assert not hasattr(font, "__dict__")
 
     family_names = []
     with pytest.raises(InvalidNormalFontFaceException) as exc_info:
@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+
+from fontTools.ttLib.ttFont import TTFont
+
+from font_collector.font.sfnt_metadata import SfntMetadata
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+fonts_directory = os.path.join(os.path.dirname(dir_path), "file", "fonts")
+
+
+def test_get_fonts_offset():
+    with open(os.path.join(fonts_directory, "font_mac.TTF"), "rb") as file:
+        assert SfntMetadata.get_fonts_offset(file) == ([0], False)
+
+    font_collection_path = Path(os.path.join(fonts_directory, "opentype_font_collection.ttc"))
+    with open(font_collection_path, "rb") as file:
+        offsets, is_collection_font = SfntMetadata.get_fonts_offset(file)
+    assert is_collection_font
+    assert len(offsets) == TTFont(font_collection_path, fontNumber=0).reader.numFonts
+
+    with open(os.path.join(fonts_directory, "empty_file.txt"), "rb") as file:
+        assert SfntMetadata.get_fonts_offset(file) is None
+
+
+def test_from_file():
+    font_path = Path(os.path.join(fonts_directory, "SFProDisplay-Bold.ttf"))
+    font = TTFont(font_path)
+    with open(font_path, "rb") as file:
+        metadata = SfntMetadata.from_file(file, 0)
+
+    assert metadata.table_tags == set(font.keys()) - {"GlyphOrder"}
+    assert "glyf" in metadata
+    assert "fvar" not in metadata
+    assert [(name.platformID, name.platEncID, name.langID, name.nameID, name.string) for name in metadata["name"].names] == [
+        (name.platformID, name.platEncID, name.langID, name.nameID, name.string) for name in font["name"].names
+    ]
+    assert [(table.platformID, table.platEncID) for table in metadata["cmap"].tables] == [
+        (table.platformID, table.platEncID) for table in font["cmap"].tables
+    ]
+    assert metadata["OS/2"].fsSelection == font["OS/2"].fsSelection
+    assert metadata["OS/2"].usWeightClass == font["OS/2"].usWeightClass
+    assert metadata["head"].macStyle == font["head"].macStyle
+
+
+def test_from_file_fallback():
+    # Variable font
+    with open(os.path.join(fonts_directory, "Asap-VariableFont_wdth,wght.ttf"), "rb") as file:
+        assert SfntMetadata.from_file(file, 0) is None
+
+    # The OS/2 table is truncated
+    with open(os.path.join(fonts_directory, "font_with_invalid_os2_table.ttf"), "rb") as file:
+        assert SfntMetadata.from_file(file, 0) is None
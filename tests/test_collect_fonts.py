@@ -0,0 +1,99 @@
+import logging
+import os
+from pathlib import Path
+
+from font_collector import AssDocument, FontCollection, FontFile, FontLoader, FontSelectionStrategyVSFilter
+from font_collector.collect_fonts import collect_subtitle_fonts
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+
+
+def load_subtitle(tmp_path: Path, styles: list[tuple[str, str, bool]], dialogues: list[tuple[str, str]]) -> AssDocument:
+    """
+    Args:
+        tmp_path: The directory where the subtitle is written.
+        styles: The name, the font name and the bold flag of each style.
+        dialogues: The style and the text of each dialogue line.
+    Returns:
+        The loaded subtitle.
+    """
+    subtitle_path = tmp_path / "subtitle.ass"
+    subtitle_path.write_text(
+        "[Script Info]\n"
+        "ScriptType: v4.00+\n"
+        "\n"
+        "[V4+ Styles]\n"
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n"
+        + "".join(f"Style: {name},{fontname},35,&H00FFFFFF,&H000000FF,&H002C2C2C,&H00000000,{int(bold)},0,0,0,100,100,0,0,1,2.5,0,2,0,0,72,1\n" for name, fontname, bold in styles)
+        + "\n"
+        "[Events]\n"
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+        + "".join(f"Dialogue: 0,0:00:00.00,0:00:05.00,{style},,0,0,0,,{text}\n" for style, text in dialogues),
+        encoding="utf_8_sig",
+    )
+    return AssDocument.from_file(subtitle_path)
+
+
+def test_collect_subtitle_fonts_missing_glyphs(tmp_path: Path, caplog):
+    subtitle = load_subtitle(
+        tmp_path,
+        [("Default", "Brushstroke Plain", False), ("Bold", "Brushstroke Plain", True)],
+        [("Default", "Test @"), ("Bold", "Test ~")],
+    )
+    font_mac = FontFile.from_font_path(Path(os.path.join(dir_path, "file", "fonts", "font_mac.TTF")))
+    font_collection = FontCollection(use_system_font=False, use_generated_fonts=False, additional_fonts=[font_mac])
+
+    with caplog.at_level(logging.WARNING):
+        fonts_file_found = collect_subtitle_fonts(subtitle, font_collection, FontSelectionStrategyVSFilter(), False)
+
+    assert fonts_file_found == {font_mac}
+    # Both styles use the same face, but the missing glyphs are still reported per style
+    missing_glyphs_messages = [record.getMessage() for record in caplog.records if "missing the following glyphs" in record.getMessage()]
+    assert missing_glyphs_messages == [
+        "'Brushstroke Plain' is missing the following glyphs used: {'@'}",
+        "'Brushstroke Plain' is missing the following glyphs used: {'~'}",
+    ]
+
+
+def test_collect_subtitle_fonts_missing_glyphs_without_coverage(tmp_path: Path, caplog):
+    subtitle = load_subtitle(
+        tmp_path,
+        [("Default", "Brushstroke Plain", False), ("Greek", "AG_Matura_C", False)],
+        [("Default", "Test @"), ("Greek", "Έκθεση À")],
+    )
+    font_mac = FontFile.from_font_path(Path(os.path.join(dir_path, "file", "fonts", "font_mac.TTF")))
+    font_cmap_encoding_0 = FontFile.from_font_path(Path(os.path.join(dir_path, "file", "fonts", "font_cmap_encoding_0.ttf")))
+    font_mac.font_faces[0].glyph_coverage = None
+    font_cmap_encoding_0.font_faces[0].glyph_coverage = None
+    font_collection = FontCollection(use_system_font=False, use_generated_fonts=False, additional_fonts=[font_mac, font_cmap_encoding_0])
+
+    with caplog.at_level(logging.WARNING):
+        fonts_file_found = collect_subtitle_fonts(subtitle, font_collection, FontSelectionStrategyVSFilter(), False)
+
+    assert fonts_file_found == {font_mac, font_cmap_encoding_0}
+    missing_glyphs_messages = [record.getMessage() for record in caplog.records if "missing the following glyphs" in record.getMessage()]
+    assert missing_glyphs_messages == [
+        "'Brushstroke Plain' is missing the following glyphs used: {'@'}",
+        "'AG_Matura_C' is missing the following glyphs used: {'À'}",
+    ]
+    # The computed coverages are kept
+    assert font_mac.font_faces[0].glyph_coverage is not None
+    assert font_cmap_encoding_0.font_faces[0].glyph_coverage is not None
+
+
+def test_collect_subtitle_fonts_convert_variable_font_used_by_many_styles(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(FontLoader, "get_generated_font_cache_file_path", staticmethod(lambda: tmp_path / "generated_fonts.db"))
+    subtitle = load_subtitle(
+        tmp_path,
+        [("Default", "Asap", False), ("Bold", "Asap", True)],
+        [("Default", "Test"), ("Bold", "Test")],
+    )
+    font_asap = FontFile.from_font_path(Path(os.path.join(dir_path, "file", "fonts", "Asap-VariableFont_wdth,wght.ttf")))
+    font_collection = FontCollection(use_system_font=False, use_generated_fonts=False, additional_fonts=[font_asap])
+    output_directory = tmp_path / "output"
+    output_directory.mkdir()
+
+    # Both styles use the same variable font, so it is only converted once
+    fonts_file_found = collect_subtitle_fonts(subtitle, font_collection, FontSelectionStrategyVSFilter(), False, True, output_directory)
+
+    assert [font_file.filename.name for font_file in fonts_file_found] == ["Asap.ttc"]